@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 CyberRadio Solutions, Inc.
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+"""
+Throughput of log_mag_fft: fused C++ block versus the original block chain.
+
+Each configuration pushes the same number of random vectors through the
+block into null sinks and reports vectors and samples per second, and the
+largest difference between the two implementations' outputs.
+"""
+
+import argparse
+import time
+
+import numpy
+from gnuradio import blocks, gr
+
+import CyberRadio
+
+
+def run(fused, num_inputs, fft_size, nvectors, secondary, data, nthreads):
+    tb = gr.top_block()
+    lmf = CyberRadio.log_mag_fft(numInputs=num_inputs, fftSize=fft_size,
+                                 secondaryOutput=secondary, fused=fused,
+                                 nthreads=nthreads)
+    sinks = []
+    for i in range(num_inputs):
+        src = blocks.vector_source_c(data, True, fft_size)
+        head = blocks.head(gr.sizeof_gr_complex * fft_size, nvectors)
+        sink = blocks.vector_sink_f(fft_size)
+        tb.connect(src, head, (lmf, i))
+        tb.connect((lmf, i), sink)
+        sinks.append(sink)
+    nsecondary = num_inputs if secondary in (
+        "fft", "mag_filtered", "mag_unfiltered", "log_mag_unfiltered") else 0
+    for i in range(nsecondary):
+        size = gr.sizeof_gr_complex if secondary == "fft" else gr.sizeof_float
+        tb.connect((lmf, num_inputs + i), blocks.null_sink(size * fft_size))
+    start = time.time()
+    tb.run()
+    elapsed = time.time() - start
+    return elapsed, numpy.array(sinks[0].data())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--fft-sizes", default="256,1024,4096,16384")
+    parser.add_argument("--inputs", type=int, default=1)
+    parser.add_argument("--samples", type=float, default=5e7,
+                        help="complex samples per input and configuration")
+    parser.add_argument("--secondary", default="fft")
+    parser.add_argument("--nthreads", type=int, default=1,
+                        help="FFTW threads")
+    args = parser.parse_args()
+
+    print("%8s %8s %14s %14s %8s %10s" % (
+        "fft", "inputs", "chain (Msps)", "fused (Msps)", "speedup", "max |dB|"))
+    for fft_size in [int(x) for x in args.fft_sizes.split(",")]:
+        nvectors = max(1, int(args.samples) // fft_size)
+        data = (numpy.random.randn(64 * fft_size) +
+                1j * numpy.random.randn(64 * fft_size)).astype(numpy.complex64)
+        t_chain, y_chain = run(False, args.inputs, fft_size, nvectors,
+                               args.secondary, data, args.nthreads)
+        t_fused, y_fused = run(True, args.inputs, fft_size, nvectors,
+                               args.secondary, data, args.nthreads)
+        msamples = args.inputs * nvectors * fft_size / 1e6
+        print("%8d %8d %14.1f %14.1f %7.2fx %10.2e" % (
+            fft_size, args.inputs, msamples / t_chain, msamples / t_fused,
+            t_chain / t_fused, numpy.max(numpy.abs(y_chain - y_fused))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+######################################################################
+# FindFFTW3f.cmake
+#
+# Finds the single-precision FFTW3 library and its threads library.
+# GNU Radio's FFT component already depends on these; the CyberRadio
+# library uses them directly for batched (multi-transform) plans.
+#
+# Sets the following CMake variables:
+# * FFTW3F_FOUND (Boolean) -- Whether FFTW3f was found
+# * FFTW3F_INCLUDE_DIRS (String) -- FFTW3 include file directory
+# * FFTW3F_LIBRARIES (String) -- fftw3f shared library
+# * FFTW3F_THREADS_LIBRARIES (String) -- fftw3f_threads shared library
+#
+######################################################################
+
+INCLUDE(FindPkgConfig)
+INCLUDE(FindPackageHandleStandardArgs)
+
+PKG_CHECK_MODULES(PC_FFTW3F "fftw3f >= 3.0")
+
+FIND_PATH(
+    FFTW3F_INCLUDE_DIRS
+    NAMES fftw3.h
+    HINTS $ENV{FFTW3_DIR}/include
+          ${PC_FFTW3F_INCLUDE_DIR}
+    PATHS /usr/local/include
+          /usr/include
+)
+
+FIND_LIBRARY(
+    FFTW3F_LIBRARIES
+    NAMES fftw3f libfftw3f
+    HINTS $ENV{FFTW3_DIR}/lib
+          ${PC_FFTW3F_LIBDIR}
+    PATHS /usr/local/lib
+          /usr/lib
+          /usr/lib64
+          /usr/lib/x86_64-linux-gnu # multiarch support
+)
+
+FIND_LIBRARY(
+    FFTW3F_THREADS_LIBRARIES
+    NAMES fftw3f_threads libfftw3f_threads
+    HINTS $ENV{FFTW3_DIR}/lib
+          ${PC_FFTW3F_LIBDIR}
+    PATHS /usr/local/lib
+          /usr/lib
+          /usr/lib64
+          /usr/lib/x86_64-linux-gnu # multiarch support
+)
+
+FIND_PACKAGE_HANDLE_STANDARD_ARGS(FFTW3f
+                                  FOUND_VAR FFTW3F_FOUND
+                                  REQUIRED_VARS FFTW3F_INCLUDE_DIRS
+                                                FFTW3F_LIBRARIES
+                                                FFTW3F_THREADS_LIBRARIES
+                                  )
+
+MARK_AS_ADVANCED(FFTW3F_INCLUDE_DIRS FFTW3F_LIBRARIES FFTW3F_THREADS_LIBRARIES)
@@ -0,0 +1,110 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_CROSS_SPECTRAL_MATRIX_CC_H
+#define INCLUDED_CYBERRADIO_CROSS_SPECTRAL_MATRIX_CC_H
+
+#include <CyberRadio/api.h>
+#include <gnuradio/sync_decimator.h>
+#include <string>
+#include <vector>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Averaged cross-spectral density matrix of coherent channels.
+ * \ingroup CyberRadio
+ *
+ * Each of the num_channels inputs (the coherent DDCs of an NDR304 or
+ * NDR472 group) is windowed and transformed, all in one batched FFT, and
+ * every bin's upper triangle S[a][b] = X_a conj(X_b), a <= b, is folded
+ * into a running average.  Averaging is a plain mean until 1/avg_alpha
+ * frames have been seen and exponential with avg_alpha after that.  The
+ * window has unit energy, so for white noise of power P each diagonal bin
+ * averages to P.
+ *
+ * Only the first fft_size samples of every frame_decimation frames are
+ * analysed; raising it trades averaging time for CPU when six wideband
+ * channels are more than one core can transform.
+ *
+ * The optional output carries the matrix after each analysed frame: pair
+ * (a, b) in the order (0,0), (0,1) ... (0,n-1), (1,1) ... (n-1,n-1), each
+ * as fft_size bins shifted as fft_vcc shifts them (DC in the middle).
+ *
+ * Every update_frames analysed frames a dict is published on the
+ * "calibration" port:
+ * - "gain_db": f32vector, each channel's total power relative to the
+ *   reference channel
+ * - "phase": f32vector, each channel's phase relative to the reference,
+ *   radians, from the power-weighted sum of their cross spectrum over all
+ *   bins (so meant for a common calibration tone or noise source)
+ * - "coherence": f32vector, the magnitude-squared coherence of each pair
+ *   a < b, averaged over bins
+ * - "pairs": s32vector, a and b of each coherence entry in turn
+ * - "reference", "frames": the reference channel and frames averaged
+ *
+ * A message on the "reset" port restarts the average.
+ */
+class CYBERRADIO_API cross_spectral_matrix_cc
+    : virtual public gr::sync_decimator {
+public:
+  typedef boost::shared_ptr<cross_spectral_matrix_cc> sptr;
+
+  /*!
+   * \param num_channels number of coherent inputs, at least 2
+   * \param fft_size FFT length
+   * \param window_type scipy.signal.get_window() name
+   * \param avg_alpha exponential averaging constant in (0, 1]
+   * \param frame_decimation analyse one fft_size frame in this many
+   * \param update_frames analysed frames between calibration messages; 0
+   *    publishes none
+   * \param reference channel the calibration offsets are relative to
+   * \param nthreads FFTW threads for the batched transform
+   */
+  static sptr make(int num_channels = 6, int fft_size = 1024,
+                   const std::string &window_type = "blackmanharris",
+                   double avg_alpha = 0.01, int frame_decimation = 1,
+                   int update_frames = 100, int reference = 0,
+                   int nthreads = 1);
+
+  virtual void set_avg_alpha(double alpha) = 0;
+  virtual double avg_alpha() const = 0;
+  virtual void set_window_type(const std::string &window_type) = 0;
+  virtual std::string window_type() const = 0;
+  virtual void set_update_frames(int frames) = 0;
+  virtual int update_frames() const = 0;
+  virtual void set_reference(int channel) = 0;
+  virtual int reference() const = 0;
+  //! Each channel's power relative to the reference, dB
+  virtual std::vector<float> gain_offsets() const = 0;
+  //! Each channel's phase relative to the reference, radians
+  virtual std::vector<float> phase_offsets() const = 0;
+  //! Bin-averaged magnitude-squared coherence of each pair a < b
+  virtual std::vector<float> coherence() const = 0;
+  virtual void reset() = 0;
+  virtual void set_nthreads(int n) = 0;
+  virtual int nthreads() const = 0;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_CROSS_SPECTRAL_MATRIX_CC_H */
@@ -0,0 +1,76 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_DDC_RESAMPLER_CCF_H
+#define INCLUDED_CYBERRADIO_DDC_RESAMPLER_CCF_H
+
+#include <CyberRadio/api.h>
+#include <gnuradio/block.h>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Polyphase resampler to a fixed rate from whatever rate the DDC
+ * runs at.
+ * \ingroup CyberRadio
+ *
+ * The input rate is taken from the "ddc_rate" tags vita_udp_rx puts on its
+ * outputs (and the channelizer on its own).  When a tag carries a new rate
+ * the filter bank is swapped at the tagged sample: the filter restarts
+ * empty there, so samples at the old and new rates are never mixed, and the
+ * flowgraph keeps running.  Designs come from a process-wide cache keyed by
+ * (in_rate, out_rate, attenuation_db), so switching back to a rate seen
+ * before costs nothing.  See cached_resampler_design() for the filter.
+ *
+ * in_rate sets the rate assumed until the first tag; with 0 the input is
+ * dropped until a rate is known.  Output is tagged "ddc_rate" (out_rate) at
+ * its first sample and after each retune.
+ */
+class CYBERRADIO_API ddc_resampler_ccf : virtual public gr::block {
+public:
+  typedef boost::shared_ptr<ddc_resampler_ccf> sptr;
+
+  /*!
+   * \param out_rate output sample rate, sps
+   * \param in_rate input sample rate until a ddc_rate tag arrives, sps;
+   *        0 for none
+   * \param attenuation_db filter stopband attenuation, dB
+   */
+  static sptr make(double out_rate, double in_rate = 0.0,
+                   double attenuation_db = 80.0);
+
+  //! Input rate in use, 0 if none yet
+  virtual double in_rate() const = 0;
+  //! Retune for input at \p rate, as a ddc_rate tag would
+  virtual void set_in_rate(double rate) = 0;
+  virtual double out_rate() const = 0;
+  virtual void set_out_rate(double rate) = 0;
+  virtual double attenuation_db() const = 0;
+  virtual void set_attenuation_db(double attenuation_db) = 0;
+  //! Interpolation and decimation of the current design, 0 if none
+  virtual int interpolation() const = 0;
+  virtual int decimation() const = 0;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_DDC_RESAMPLER_CCF_H */
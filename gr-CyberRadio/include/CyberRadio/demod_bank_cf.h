@@ -0,0 +1,86 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_DEMOD_BANK_CF_H
+#define INCLUDED_CYBERRADIO_DEMOD_BANK_CF_H
+
+#include <CyberRadio/api.h>
+#include <gnuradio/sync_block.h>
+#include <string>
+#include <vector>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief AM/FM/USB/LSB demodulation of many NBDDC channels in one block.
+ * \ingroup CyberRadio
+ *
+ * Each complex input is demodulated to the float output of the same index
+ * in its own mode; there is one input and one output per mode, and all of
+ * them must be connected:
+ *
+ * - "am": envelope over its running mean, less one (+-1 at 100% modulation)
+ * - "fm": phase step per sample, scaled so fm_deviation gives +-1
+ * - "usb", "lsb": the upper or lower sideband of a channel tuned to the
+ *   suppressed carrier, by the phasing method (a 63-tap Hilbert filter)
+ * - "off": silence, nothing computed
+ *
+ * Every mode sees the same 31-sample delay, so switching modes does not
+ * move the audio in time.
+ *
+ * Squelch: each channel's mean power over the samples of a work call is
+ * compared with its squelch level (dB, 10*log10 of mean |x|^2).  Below it
+ * the channel's output is zeros and no demodulation is done for it, so idle
+ * channels cost one dot product.  The default of -200 dB never closes.
+ *
+ * The "mode" message port takes a pair (channel . mode), or a dict with
+ * "channel" and either or both of "mode" and "squelch" (dB).
+ */
+class CYBERRADIO_API demod_bank_cf : virtual public gr::sync_block {
+public:
+  typedef boost::shared_ptr<demod_bank_cf> sptr;
+
+  /*!
+   * \param modes demodulation mode of each channel; one input and one
+   *        output per entry
+   * \param fs sample rate of each input, Hz
+   * \param squelch_db initial squelch level of every channel, dB
+   * \param fm_deviation FM peak deviation giving full-scale output, Hz
+   */
+  static sptr make(const std::vector<std::string> &modes, double fs = 1.0,
+                   double squelch_db = -200.0, double fm_deviation = 5e3);
+
+  virtual void set_mode(int channel, const std::string &mode) = 0;
+  virtual std::string mode(int channel) const = 0;
+  virtual void set_squelch(int channel, double squelch_db) = 0;
+  virtual double squelch(int channel) const = 0;
+  //! Whether the squelch was open for \p channel on the last work call
+  virtual bool squelch_open(int channel) const = 0;
+  virtual void set_fs(double fs) = 0;
+  virtual double fs() const = 0;
+  virtual void set_fm_deviation(double deviation) = 0;
+  virtual double fm_deviation() const = 0;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_DEMOD_BANK_CF_H */
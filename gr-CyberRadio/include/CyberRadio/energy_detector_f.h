@@ -0,0 +1,98 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_ENERGY_DETECTOR_F_H
+#define INCLUDED_CYBERRADIO_ENERGY_DETECTOR_F_H
+
+#include <CyberRadio/api.h>
+#include <gnuradio/sync_block.h>
+#include <vector>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Signal detections from dB spectra, against a per-bin noise floor.
+ * \ingroup CyberRadio
+ *
+ * The input is a dB spectrum with its lowest frequency first, as log_mag_fft
+ * and the NDR804-PTT spectral sources produce, spanning fs around
+ * center_freq.  Each bin's noise floor is its percentile-th quantile over
+ * time, tracked with trace_quantile_track() in steps of step_db per frame,
+ * so it follows a drifting floor while signals present less than
+ * (1 - percentile) of the time barely lift it.  The first frame seeds the
+ * floor.
+ *
+ * Bins more than threshold_db above their floor are detected, and runs of
+ * detected bins separated by at most max_gap undetected bins are merged
+ * into one signal; signals narrower than min_bins are ignored.  Each signal
+ * is published on the "detections" port as a dict:
+ *
+ * - "center_freq": power-weighted centroid, Hz (double)
+ * - "bandwidth": width of the merged run, Hz (double)
+ * - "snr": peak bin over its floor, dB (float)
+ * - "peak": peak bin level, dB (float)
+ * - "bins": first and last bin, a pair of integers
+ * - "frame": input frame index (uint64)
+ * - "timestamp": the most recent "timestamp" (vita_udp_rx) or "rx_time"
+ *   tag at or before the frame, as tagged; absent if none was seen
+ */
+class CYBERRADIO_API energy_detector_f : virtual public gr::sync_block {
+public:
+  typedef boost::shared_ptr<energy_detector_f> sptr;
+
+  /*!
+   * \param vlen spectrum length
+   * \param fs span of the spectrum, Hz
+   * \param center_freq frequency of the centre bin (vlen/2), Hz
+   * \param threshold_db detection threshold above the noise floor, dB
+   * \param percentile noise floor quantile, in (0, 1)
+   * \param step_db noise floor tracking step per frame, dB
+   * \param min_bins narrowest signal reported, bins
+   * \param max_gap undetected bins bridged within one signal
+   */
+  static sptr make(int vlen, double fs = 1.0, double center_freq = 0.0,
+                   double threshold_db = 10.0, double percentile = 0.2,
+                   double step_db = 0.05, int min_bins = 1, int max_gap = 0);
+
+  virtual void set_threshold_db(double threshold_db) = 0;
+  virtual double threshold_db() const = 0;
+  virtual void set_percentile(double percentile) = 0;
+  virtual double percentile() const = 0;
+  virtual void set_step_db(double step_db) = 0;
+  virtual double step_db() const = 0;
+  virtual void set_fs(double fs) = 0;
+  virtual double fs() const = 0;
+  virtual void set_center_freq(double freq) = 0;
+  virtual double center_freq() const = 0;
+  virtual void set_min_bins(int min_bins) = 0;
+  virtual int min_bins() const = 0;
+  virtual void set_max_gap(int max_gap) = 0;
+  virtual int max_gap() const = 0;
+  //! Current noise floor, dB per bin
+  virtual std::vector<float> noise_floor() const = 0;
+  //! Reseed the noise floor from the next frame
+  virtual void reset() = 0;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_ENERGY_DETECTOR_F_H */
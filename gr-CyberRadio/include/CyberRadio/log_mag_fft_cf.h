@@ -0,0 +1,87 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_LOG_MAG_FFT_CF_H
+#define INCLUDED_CYBERRADIO_LOG_MAG_FFT_CF_H
+
+#include <CyberRadio/api.h>
+#include <gnuradio/sync_block.h>
+#include <string>
+#include <vector>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Windowed FFT, magnitude, averaging and log in one block.
+ * \ingroup CyberRadio
+ *
+ * Does the work of the log_mag_fft chain (fft_vcc, complex_to_mag_squared,
+ * single_pole_iir_filter_ff, vector_nlog10_ff) on each vector while it is
+ * still in cache: the input is windowed into the FFT buffer, transformed,
+ * FFT-shifted while the magnitude is taken, averaged in place and converted
+ * to dB.  Each input has its own averaging state.
+ *
+ * All inputs are transformed together by one batched FFTW plan, which
+ * shares twiddle factors across channels and, with nthreads > 1, spreads the
+ * transforms over FFTW's thread pool.
+ *
+ * Outputs 0 to num_inputs-1 carry the averaged log magnitude.  Depending on
+ * secondary_output, outputs num_inputs to 2*num_inputs-1 carry the shifted
+ * FFT ("fft", complex), the averaged magnitude ("mag_filtered"), the
+ * unaveraged magnitude ("mag_unfiltered") or its log ("log_mag_unfiltered");
+ * any other value leaves them out.
+ *
+ * A message on the "reset" port restarts the averaging.
+ */
+class CYBERRADIO_API log_mag_fft_cf : virtual public gr::sync_block {
+public:
+  typedef boost::shared_ptr<log_mag_fft_cf> sptr;
+
+  /*!
+   * \param num_inputs number of independent input vectors
+   * \param fft_size FFT length
+   * \param window window of length fft_size, or empty for rectangular; it
+   *    is scaled to unit sum, as log_mag_fft does
+   * \param iir_alpha averaging constant in [0, 1]; 1 disables averaging
+   * \param secondary_output "fft", "mag_filtered", "mag_unfiltered",
+   *    "log_mag_unfiltered" or "" for none
+   * \param reset_on_alpha_change restart averaging when alpha changes
+   * \param mag_squared use |X|^2 and 10*log10 (true) or |X| and 20*log10
+   * \param nthreads FFTW threads for the batched transform
+   */
+  static sptr make(int num_inputs, int fft_size,
+                   const std::vector<float> &window, double iir_alpha = 0.125,
+                   const std::string &secondary_output = "fft",
+                   bool reset_on_alpha_change = false, bool mag_squared = true,
+                   int nthreads = 1);
+
+  virtual void set_iir_alpha(double alpha) = 0;
+  virtual double iir_alpha() const = 0;
+  virtual void set_window(const std::vector<float> &window) = 0;
+  virtual void reset() = 0;
+  virtual void set_nthreads(int n) = 0;
+  virtual int nthreads() const = 0;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_LOG_MAG_FFT_CF_H */
@@ -0,0 +1,90 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_PFB_CHANNELIZER_CCF_H
+#define INCLUDED_CYBERRADIO_PFB_CHANNELIZER_CCF_H
+
+#include <CyberRadio/api.h>
+#include <gnuradio/sync_decimator.h>
+#include <vector>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Polyphase filterbank channelizer for a WBDDC stream.
+ * \ingroup CyberRadio
+ *
+ * Splits an in_rate complex stream into num_channels channels spaced
+ * in_rate/num_channels apart, channel k centred at k*in_rate/num_channels
+ * (the upper half are the negative frequencies), each filtered and
+ * decimated to out_rate.  out_rate must be one of the NDR358/NDR551 DDC
+ * rates and divide in_rate; with out_rate above the channel spacing the
+ * channels overlap, which is how to get a channel at a DDC rate that is
+ * not a whole fraction of the wideband rate's spacing.
+ *
+ * There is one output per entry of \p channels, carrying that channel
+ * (negative indices count down from num_channels).  Only those channels are
+ * computed: the prototype filter is folded once per output sample and,
+ * when more than a handful are wanted, one FFT of num_channels points
+ * produces them all, so the cost grows with log(num_channels) rather than
+ * with the channel count; for one or two channels a direct DFT of the
+ * folded block is cheaper and is used instead.
+ *
+ * The prototype is a low pass with its passband to 0.3 and its stopband
+ * from 0.5 times the smaller of channel spacing and out_rate, at
+ * attenuation_db, with unity passband gain.
+ *
+ * Each output is tagged "ddc_rate" (out_rate) and "channel_freq" (the
+ * channel's offset from the wideband centre, Hz) at its first sample and
+ * whenever its channel changes.  The "channels" message port takes a
+ * vector of channel indices for all outputs, or a pair (output . channel).
+ */
+class CYBERRADIO_API pfb_channelizer_ccf : virtual public gr::sync_decimator {
+public:
+  typedef boost::shared_ptr<pfb_channelizer_ccf> sptr;
+
+  /*!
+   * \param in_rate wideband sample rate, sps
+   * \param out_rate channel sample rate, sps; a DDC rate dividing in_rate
+   * \param num_channels channels in the filterbank (FFT size)
+   * \param channels channel index carried on each output
+   * \param attenuation_db prototype filter stopband attenuation, dB
+   * \param nthreads FFTW threads
+   */
+  static sptr make(double in_rate, double out_rate, int num_channels,
+                   const std::vector<int> &channels,
+                   double attenuation_db = 80.0, int nthreads = 1);
+
+  //! Channel index on every output; the length must not change
+  virtual void set_channels(const std::vector<int> &channels) = 0;
+  virtual std::vector<int> channels() const = 0;
+  //! Channel index on output \p output
+  virtual void set_channel(int output, int channel) = 0;
+  //! Offset of channel \p channel from the wideband centre, Hz
+  virtual double channel_freq(int channel) const = 0;
+  virtual std::vector<float> taps() const = 0;
+  virtual void set_nthreads(int nthreads) = 0;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_PFB_CHANNELIZER_CCF_H */
@@ -0,0 +1,75 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_POWER_METER_BANK_CF_H
+#define INCLUDED_CYBERRADIO_POWER_METER_BANK_CF_H
+
+#include <CyberRadio/api.h>
+#include <gnuradio/sync_block.h>
+#include <vector>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Averaged power (RSSI) of many channels, published as one vector.
+ * \ingroup CyberRadio
+ *
+ * Each complex input's power is summed over blocks of block_size samples
+ * and folded into a running average.  The averaging follows rms_cf's
+ * per-sample constant alpha = 2^-avg_gain_exp (the rmsAvgGainExp of the qt
+ * sinks): one block of M samples updates the average with
+ * 1 - (1 - alpha)^M, which is what M per-sample updates do to a steady
+ * level.  The averages of all channels sit in one contiguous array and are
+ * updated together.
+ *
+ * At update_rate (rounded to whole blocks) the "rssi" port carries an
+ * f32vector of every channel's level in dB, 10*log10 of the averaged power
+ * (the same as 20*log10 of rms_cf's output).
+ */
+class CYBERRADIO_API power_meter_bank_cf : virtual public gr::sync_block {
+public:
+  typedef boost::shared_ptr<power_meter_bank_cf> sptr;
+
+  /*!
+   * \param num_channels number of complex inputs
+   * \param fs sample rate of each input, Hz
+   * \param update_rate messages per second
+   * \param avg_gain_exp averaging constant exponent: alpha = 2^-avg_gain_exp
+   * \param block_size samples summed per average update
+   */
+  static sptr make(int num_channels = 1, double fs = 1.0,
+                   double update_rate = 10.0, double avg_gain_exp = 5,
+                   int block_size = 64);
+
+  virtual void set_avg_gain_exp(double exp) = 0;
+  virtual double avg_gain_exp() const = 0;
+  virtual void set_update_rate(double rate) = 0;
+  virtual double update_rate() const = 0;
+  virtual void set_fs(double fs) = 0;
+  virtual double fs() const = 0;
+  //! Latest levels, dB
+  virtual std::vector<float> levels() const = 0;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_POWER_METER_BANK_CF_H */
@@ -0,0 +1,88 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_SINAD_METER_CF_H
+#define INCLUDED_CYBERRADIO_SINAD_METER_CF_H
+
+#include <CyberRadio/api.h>
+#include <gnuradio/sync_block.h>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief SINAD, SNR, level and frequency of a test tone on many channels.
+ * \ingroup CyberRadio
+ *
+ * Each complex input is measured on its own, in blocks of block_size
+ * samples.  The tone is notched by mixing it to DC and removing DC with a
+ * one-pole recursive high-pass (corner at cutoff, in cycles per sample);
+ * what is left is noise plus distortion.  The tone frequency is estimated
+ * from the mean phase step over the block, and with use_freq_estimate the
+ * notch follows that estimate instead of notch_freq.  The cost is a few
+ * multiply-adds per sample, so all of a radio's narrowband DDCs can be
+ * measured by one block.
+ *
+ * At update_rate (rounded to whole blocks) the block publishes one dict on
+ * the "status" port, covering every block since the last one:
+ *
+ * - "sinad": total power over noise+distortion power, dB
+ * - "snr": power with the tone removed from the total, over the noise, dB
+ * - "signal", "noise": 10*log10 of mean total and notched power (the old
+ *   sinad_calc_block's 20*log10 RMS levels)
+ * - "freq": estimated tone frequency, Hz
+ * - "samples": samples consumed per channel so far
+ *
+ * The first five are f32vectors with one entry per channel.
+ */
+class CYBERRADIO_API sinad_meter_cf : virtual public gr::sync_block {
+public:
+  typedef boost::shared_ptr<sinad_meter_cf> sptr;
+
+  /*!
+   * \param num_channels number of complex inputs
+   * \param fs sample rate, Hz
+   * \param block_size samples per measurement block
+   * \param update_rate status messages per second
+   * \param notch_freq tone frequency to notch, Hz
+   * \param cutoff notch high-pass corner, cycles per sample
+   * \param use_freq_estimate notch the estimated frequency instead
+   */
+  static sptr make(int num_channels = 1, double fs = 1.0,
+                   int block_size = 1024, double update_rate = 1.0,
+                   double notch_freq = 0.0, double cutoff = 0.015625,
+                   bool use_freq_estimate = false);
+
+  virtual void set_fs(double fs) = 0;
+  virtual double fs() const = 0;
+  virtual void set_update_rate(double rate) = 0;
+  virtual double update_rate() const = 0;
+  virtual void set_notch_freq(double freq) = 0;
+  virtual double notch_freq() const = 0;
+  virtual void set_cutoff(double cutoff) = 0;
+  virtual double cutoff() const = 0;
+  virtual void set_use_freq_estimate(bool use) = 0;
+  virtual bool use_freq_estimate() const = 0;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_SINAD_METER_CF_H */
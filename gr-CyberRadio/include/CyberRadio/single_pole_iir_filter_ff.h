@@ -26,16 +26,22 @@
 #include <gnuradio/sync_block.h>
 #include "CyberRadio/single_pole_iir.h"
 
-#define INPUT_ARGS_TYPE        double alpha, unsigned int vlen, bool resetOnAlphaChange
-#define INPUT_ARGS_NO_TYPE     alpha, vlen, resetOnAlphaChange
+#define INPUT_ARGS_TYPE        double alpha, unsigned int vlen, bool resetOnAlphaChange, bool doublePrecision
+#define INPUT_ARGS_NO_TYPE     alpha, vlen, resetOnAlphaChange, doublePrecision
 
 namespace gr {
   namespace CyberRadio {
 
     /*!
-     * \brief <+description of block+>
+     * \brief Single-pole IIR average of each element of a float vector.
      * \ingroup CyberRadio
      *
+     * Computes y = y + alpha*(x - y) element-wise, with the state for the
+     * whole vector held in one contiguous array and updated with SIMD.  The
+     * first vector after a reset passes straight through and seeds the
+     * state.  With doublePrecision the state is kept in double, which
+     * avoids float stalling at very small alpha.
+     *
      */
     class CYBERRADIO_API single_pole_iir_filter_ff : virtual public gr::sync_block
     {
@@ -50,7 +56,8 @@ namespace gr {
        * class. CyberRadio::single_pole_iir_filter_ff::make is the public interface for
        * creating new instances.
        */
-      static sptr make(INPUT_ARGS_TYPE);
+      static sptr make(double alpha, unsigned int vlen, bool resetOnAlphaChange,
+                       bool doublePrecision = false);
 
       virtual void set_taps (double alpha) = 0;
       virtual void reset (bool reset) = 0;
@@ -0,0 +1,101 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_SPECTRUM_OCCUPANCY_F_H
+#define INCLUDED_CYBERRADIO_SPECTRUM_OCCUPANCY_F_H
+
+#include <CyberRadio/api.h>
+#include <gnuradio/sync_block.h>
+#include <string>
+#include <vector>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Long-term per-bin spectrum statistics in time buckets.
+ * \ingroup CyberRadio
+ *
+ * Accumulates dB spectra over buckets of bucket_seconds (host clock) and,
+ * at the end of each, publishes a snapshot of every bin's
+ *
+ * - occupancy: fraction of frames above threshold_db
+ * - mean: mean power, dB (of the linear mean)
+ * - max: highest level, dB
+ * - one level per entry of \p percentiles, dB
+ *
+ * then starts the next bucket from scratch.  Memory is fixed: per bin a
+ * count, a power sum, a maximum and a histogram from hist_min_db to
+ * hist_max_db in hist_res_db steps, so percentiles are exact to the
+ * histogram step however many frames a bucket holds; levels outside the
+ * range count in its end bins.
+ *
+ * Snapshots go to the "snapshot" message port as a dict with "start" and
+ * "stop" (Unix seconds, double), "frames" (uint64), "occupancy", "mean",
+ * "max" (f32vectors), "percentiles" (f32vector of the fractions) and
+ * "levels" (a vector of f32vectors, one per percentile).
+ *
+ * If \p filename is set they are also appended to that file as records of
+ * native-endian fields:
+ *
+ * - char magic[4] = "CRSO", uint32 version = 1, uint32 vlen,
+ *   uint32 num_percentiles
+ * - double start, double stop, uint64 frames
+ * - float percentiles[num_percentiles]
+ * - uint16 occupancy[vlen], in 1/65535
+ * - int16 mean[vlen], int16 max[vlen], then int16 levels[vlen] per
+ *   percentile, in 0.01 dB
+ *
+ * A partly filled bucket is flushed when the flowgraph stops.
+ */
+class CYBERRADIO_API spectrum_occupancy_f : virtual public gr::sync_block {
+public:
+  typedef boost::shared_ptr<spectrum_occupancy_f> sptr;
+
+  /*!
+   * \param vlen spectrum length
+   * \param threshold_db occupancy threshold, dB
+   * \param bucket_seconds snapshot period, s
+   * \param percentiles fractions in [0, 1] to report levels for
+   * \param filename file to append snapshots to; empty for none
+   * \param hist_min_db bottom of the percentile histogram, dB
+   * \param hist_max_db top of the percentile histogram, dB
+   * \param hist_res_db percentile histogram step, dB
+   */
+  static sptr make(int vlen, double threshold_db = -100.0,
+                   double bucket_seconds = 60.0,
+                   const std::vector<float> &percentiles =
+                       std::vector<float>(),
+                   const std::string &filename = "",
+                   double hist_min_db = -160.0, double hist_max_db = 0.0,
+                   double hist_res_db = 0.5);
+
+  virtual void set_threshold_db(double threshold_db) = 0;
+  virtual double threshold_db() const = 0;
+  virtual void set_bucket_seconds(double seconds) = 0;
+  virtual double bucket_seconds() const = 0;
+  //! End the current bucket now
+  virtual void flush() = 0;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_SPECTRUM_OCCUPANCY_F_H */
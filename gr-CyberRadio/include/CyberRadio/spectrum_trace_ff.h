@@ -0,0 +1,79 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_SPECTRUM_TRACE_FF_H
+#define INCLUDED_CYBERRADIO_SPECTRUM_TRACE_FF_H
+
+#include <CyberRadio/api.h>
+#include <gnuradio/sync_block.h>
+#include <string>
+#include <vector>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Spectrum analyzer traces: write, max/min hold, average, peak decay.
+ * \ingroup CyberRadio
+ *
+ * Each output is a trace of the input spectrum (normally in dB) in one of
+ * these modes:
+ *
+ * - "write": clear/write, the latest input
+ * - "max_hold": element-wise maximum since the last reset
+ * - "min_hold": element-wise minimum since the last reset
+ * - "average": video average, a single-pole IIR with avg_alpha
+ * - "peak_decay": peak hold that falls by decay (dB) per input vector
+ *
+ * All traces are updated in place, eight bins at a time, from the same
+ * read of each input vector.
+ *
+ * Messages:
+ * - "reset": an integer restarts that trace; anything else restarts all.
+ * - "mode": a pair (trace . mode) or a dict {"trace": n, "mode": mode}
+ *   switches a trace, which also restarts it.
+ */
+class CYBERRADIO_API spectrum_trace_ff : virtual public gr::sync_block {
+public:
+  typedef boost::shared_ptr<spectrum_trace_ff> sptr;
+
+  /*!
+   * \param vlen spectrum length
+   * \param modes mode of each output trace; one output per entry
+   * \param avg_alpha video averaging constant in (0, 1]
+   * \param decay peak_decay fall per input vector
+   */
+  static sptr make(int vlen, const std::vector<std::string> &modes,
+                   double avg_alpha = 0.1, double decay = 0.5);
+
+  virtual void set_mode(int trace, const std::string &mode) = 0;
+  virtual std::string mode(int trace) const = 0;
+  virtual void set_avg_alpha(double alpha) = 0;
+  virtual double avg_alpha() const = 0;
+  virtual void set_decay(double decay) = 0;
+  virtual double decay() const = 0;
+  //! Restart one trace, or all of them when \p trace is negative
+  virtual void reset(int trace = -1) = 0;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_SPECTRUM_TRACE_FF_H */
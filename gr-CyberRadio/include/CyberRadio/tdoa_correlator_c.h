@@ -0,0 +1,100 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_TDOA_CORRELATOR_C_H
+#define INCLUDED_CYBERRADIO_TDOA_CORRELATOR_C_H
+
+#include <CyberRadio/api.h>
+#include <gnuradio/sync_decimator.h>
+#include <vector>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Delay, correlation and phase between coherent channels, by FFT.
+ * \ingroup CyberRadio
+ *
+ * Every hop samples the last block_len samples of each input (the
+ * coherent DDCs of an NDR304 or NDR472 group) are zero padded to a power
+ * of two of at least block_len + max_lag and transformed, all in one
+ * batched FFT.  For each pair a < b the cross spectrum X_a conj(X_b) is
+ * summed over integrate blocks, then one batched inverse FFT gives every
+ * pair's cross-correlation, free of wrap-around out to +/-max_lag.  The
+ * plans and buffers are made once and reused for every block.
+ *
+ * The correlation peak within +/-max_lag is the delay of channel a behind
+ * channel b, in samples; positive means the signal reaches a later.  With
+ * interpolate set a parabola through the peak and its neighbours refines
+ * it to a fraction of a sample, which is accurate to a few hundredths of a
+ * sample for band-limited DDC outputs.  The phase at the peak is a's phase
+ * less b's, as cross_spectral_matrix_cc reports it.
+ *
+ * After every integrate blocks a dict is published on the "tdoa" port:
+ * - "delay": f32vector, delay of each pair, samples
+ * - "tdoa": f32vector, the same in seconds at sample rate fs
+ * - "peak": f32vector, the correlation coefficient at the peak, 0 to 1
+ * - "phase": f32vector, phase at the peak, radians
+ * - "pairs": s32vector, a and b of each entry in turn
+ * - "report": index of this report (uint64)
+ */
+class CYBERRADIO_API tdoa_correlator_c : virtual public gr::sync_decimator {
+public:
+  typedef boost::shared_ptr<tdoa_correlator_c> sptr;
+
+  /*!
+   * \param num_channels number of coherent inputs, at least 2
+   * \param block_len samples correlated per block
+   * \param hop samples between blocks; below block_len the blocks overlap
+   * \param max_lag largest delay searched, samples, below block_len
+   * \param integrate blocks whose cross spectra are summed per report
+   * \param interpolate refine the peak to a fraction of a sample
+   * \param fs sample rate, sps, for "tdoa"
+   * \param nthreads FFTW threads for the batched transforms
+   */
+  static sptr make(int num_channels = 2, int block_len = 4096,
+                   int hop = 2048, int max_lag = 64, int integrate = 1,
+                   bool interpolate = true, double fs = 1.0,
+                   int nthreads = 1);
+
+  virtual void set_integrate(int blocks) = 0;
+  virtual int integrate() const = 0;
+  virtual void set_interpolate(bool interpolate) = 0;
+  virtual bool interpolate() const = 0;
+  virtual void set_fs(double fs) = 0;
+  virtual double fs() const = 0;
+  //! FFT length the blocks are padded to
+  virtual int fft_size() const = 0;
+  //! Delay of each pair a < b in the last report, samples
+  virtual std::vector<float> delays() const = 0;
+  //! Correlation coefficient of each pair in the last report
+  virtual std::vector<float> peaks() const = 0;
+  //! Phase of each pair in the last report, radians
+  virtual std::vector<float> phases() const = 0;
+  //! Drop the partly integrated report
+  virtual void reset() = 0;
+  virtual void set_nthreads(int n) = 0;
+  virtual int nthreads() const = 0;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_TDOA_CORRELATOR_C_H */
@@ -0,0 +1,89 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_TIMESTAMP_ALIGNER_CC_H
+#define INCLUDED_CYBERRADIO_TIMESTAMP_ALIGNER_CC_H
+
+#include <CyberRadio/api.h>
+#include <gnuradio/block.h>
+#include <vector>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Aligns streams from one radio by their VITA 49 timestamps.
+ * \ingroup CyberRadio
+ *
+ * Each input is a DDC stream from vita_udp_rx (a "timestamp" tag, the
+ * pair (integer seconds . fractional)) or vita_iq_source_mk3 ("timestamp_int"
+ * and "timestamp_frac" tags on the same sample), all at sample rate fs.  The
+ * fractional field counts frac_rate ticks a second: 1e12 for the radios'
+ * real-time picosecond timestamps, fs for sample-count timestamps.
+ *
+ * Input before a stream's first timestamp is dropped.  Once every stream
+ * has one, each drops leading samples up to the latest start, so output
+ * sample n of every stream has the same radio time.  From then on every
+ * timestamp is checked against the time the stream's sample count
+ * predicts.  An error above tolerance samples is corrected at the tagged
+ * sample: a stream that lost samples (the timestamp is late) has zeros
+ * inserted in their place, and one whose timestamp went back has the
+ * repeated span dropped, so the outputs stay aligned.
+ *
+ * Each correction is published on the "alignment" port as a dict with
+ * "event" "gap" or "slip", "stream", "error" (timestamp less predicted
+ * time, samples) and "offset" (the output sample it applies from).
+ * Alignment is published as "event" "start" with "dropped", the leading
+ * samples each stream dropped.  Tags on copied samples are passed on at
+ * their new positions.  A message on the "reset" port, or reset(), starts
+ * the alignment over.
+ */
+class CYBERRADIO_API timestamp_aligner_cc : virtual public gr::block {
+public:
+  typedef boost::shared_ptr<timestamp_aligner_cc> sptr;
+
+  /*!
+   * \param num_streams number of streams
+   * \param fs sample rate of every stream, sps
+   * \param frac_rate fractional timestamp ticks per second
+   * \param tolerance largest timestamp error left uncorrected, samples
+   */
+  static sptr make(int num_streams = 2, double fs = 1.0,
+                   double frac_rate = 1e12, int tolerance = 1);
+
+  virtual void set_fs(double fs) = 0;
+  virtual double fs() const = 0;
+  virtual void set_tolerance(int tolerance) = 0;
+  virtual int tolerance() const = 0;
+  //! True once every stream has a timestamp and the outputs are aligned
+  virtual bool aligned() const = 0;
+  //! Error of each stream's latest timestamp against its sample count
+  virtual std::vector<int> alignment_error() const = 0;
+  //! Zeros inserted into stream \p stream since alignment
+  virtual uint64_t samples_inserted(int stream) const = 0;
+  //! Samples dropped from stream \p stream, including the leading ones
+  virtual uint64_t samples_dropped(int stream) const = 0;
+  virtual void reset() = 0;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_TIMESTAMP_ALIGNER_CC_H */
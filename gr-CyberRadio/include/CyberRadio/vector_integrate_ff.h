@@ -0,0 +1,66 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_VECTOR_INTEGRATE_FF_H
+#define INCLUDED_CYBERRADIO_VECTOR_INTEGRATE_FF_H
+
+#include <CyberRadio/api.h>
+#include <gnuradio/block.h>
+#include <string>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief One vector out per k in: their mean, maximum or minimum.
+ * \ingroup CyberRadio
+ *
+ * Meant for linear power spectra ahead of the log stage, so nlog10 and
+ * everything after it run k times less often: "mean" is then a true power
+ * average, "max" a peak hold over the frames and "min" a floor.
+ *
+ * k can change at any time, including from the "k" message port (an
+ * integer); frames already integrated count toward the new k, so a smaller
+ * k emits at the next frame.  set_update_period() picks k for a display
+ * refresh period at a known frame rate.
+ */
+class CYBERRADIO_API vector_integrate_ff : virtual public gr::block {
+public:
+  typedef boost::shared_ptr<vector_integrate_ff> sptr;
+
+  /*!
+   * \param vlen vector length
+   * \param k vectors integrated per output
+   * \param mode "mean", "max" or "min"
+   */
+  static sptr make(int vlen, int k = 1, const std::string &mode = "mean");
+
+  virtual void set_k(int k) = 0;
+  virtual int k() const = 0;
+  //! k = round(period * frame_rate), at least 1
+  virtual void set_update_period(double period, double frame_rate) = 0;
+  virtual void set_mode(const std::string &mode) = 0;
+  virtual std::string mode() const = 0;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_VECTOR_INTEGRATE_FF_H */
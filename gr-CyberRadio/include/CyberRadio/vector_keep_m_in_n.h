@@ -29,7 +29,8 @@ namespace gr {
   namespace CyberRadio {
 
     /*!
-     * \brief <+description of block+>
+     * \brief Keep m consecutive items, starting at offset, out of each
+     * vector of n.
      * \ingroup CyberRadio
      *
      */
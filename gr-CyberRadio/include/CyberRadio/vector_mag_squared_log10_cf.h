@@ -29,9 +29,13 @@ namespace gr {
   namespace CyberRadio {
 
     /*!
-     * \brief <+description of block+>
+     * \brief y = n*log10(|x|^2) + k over vectors of complex samples.
      * \ingroup CyberRadio
      *
+     * The fused equivalent of complex_to_mag_squared followed by
+     * vector_nlog10_ff: the magnitude is formed a cache-sized block at a
+     * time and converted to dB in place.  \p floor_db clamps the output as
+     * in vector_nlog10_ff.
      */
     class CYBERRADIO_API vector_mag_squared_log10_cf : virtual public gr::sync_block
     {
@@ -45,8 +49,15 @@ namespace gr {
        * constructor is in a private implementation
        * class. CyberRadio::vector_mag_squared_log10_cf::make is the public interface for
        * creating new instances.
+       *
+       * \param n multiplier
+       * \param vlen vector length
+       * \param k offset added after scaling
+       * \param floor_db lowest output value; the default is effectively no
+       *        clamp
        */
-      static sptr make(float n, size_t vlen, float k);
+      static sptr make(float n=1.0, size_t vlen=1, float k=0.0,
+                       float floor_db=-1.0e30);
     };
 
   } // namespace CyberRadio
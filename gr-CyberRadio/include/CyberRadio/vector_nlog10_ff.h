@@ -29,9 +29,13 @@ namespace gr {
   namespace CyberRadio {
 
     /*!
-     * \brief <+description of block+>
+     * \brief y = n*log10(x) + k over vectors of floats.
      * \ingroup CyberRadio
      *
+     * The log is computed in a single pass (no separate log2 and scale
+     * stages).  Inputs below the level that maps to \p floor_db are raised
+     * to it, so the output never goes below \p floor_db; even with no floor
+     * a zero input gives a large negative number instead of -inf.
      */
     class CYBERRADIO_API vector_nlog10_ff : virtual public gr::sync_block
     {
@@ -45,8 +49,15 @@ namespace gr {
        * constructor is in a private implementation
        * class. sg1450dsp::vector_nlog10_ff::make is the public interface for
        * creating new instances.
+       *
+       * \param n multiplier
+       * \param vlen vector length
+       * \param k offset added after scaling
+       * \param floor_db lowest output value; the default is effectively no
+       *        clamp
        */
-      static sptr make(float n=1.0, size_t vlen=1, float k=0.0);
+      static sptr make(float n=1.0, size_t vlen=1, float k=0.0,
+                       float floor_db=-1.0e30);
     };
 
   } // namespace CyberRadio
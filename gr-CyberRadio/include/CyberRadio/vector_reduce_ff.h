@@ -0,0 +1,71 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_VECTOR_REDUCE_FF_H
+#define INCLUDED_CYBERRADIO_VECTOR_REDUCE_FF_H
+
+#include <CyberRadio/api.h>
+#include <gnuradio/sync_block.h>
+#include <string>
+#include <vector>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Reduce a long spectrum to out_len display bins, keeping peaks.
+ * \ingroup CyberRadio
+ *
+ * Bins [start, stop) of each input vector (the zoom window; stop 0 means
+ * the whole vector) are split into out_len nearly equal runs, and each
+ * output bin is the maximum ("max", so narrow signals survive) or the mean
+ * ("mean") of its run.  When the window is narrower than out_len, input
+ * bins are repeated instead.  The run boundaries are computed when the
+ * zoom changes, not per vector.
+ *
+ * The "zoom" message port takes a pair (start . stop).
+ */
+class CYBERRADIO_API vector_reduce_ff : virtual public gr::sync_block {
+public:
+  typedef boost::shared_ptr<vector_reduce_ff> sptr;
+
+  /*!
+   * \param vlen input vector length
+   * \param out_len output vector length (display bins)
+   * \param mode "max" or "mean"
+   * \param start first input bin shown
+   * \param stop one past the last input bin shown; 0 for vlen
+   */
+  static sptr make(int vlen, int out_len, const std::string &mode = "max",
+                   int start = 0, int stop = 0);
+
+  virtual void set_zoom(int start, int stop) = 0;
+  virtual int start() const = 0;
+  virtual int stop() const = 0;
+  virtual void set_mode(const std::string &mode) = 0;
+  virtual std::string mode() const = 0;
+  //! First input bin of each output bin, plus stop: out_len + 1 entries
+  virtual std::vector<int> bin_edges() const = 0;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_VECTOR_REDUCE_FF_H */
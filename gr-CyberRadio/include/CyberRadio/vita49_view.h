@@ -0,0 +1,191 @@
+/* -*- c++ -*- */
+/***************************************************************************
+ * \file vita49_view.h
+ *
+ * \brief Zero-copy, lazily decoded view of a VITA 49 I/Q packet.
+ *
+ * \copyright Copyright (c) 2026 CyberRadio Solutions, Inc.
+ *
+ */
+
+#ifndef INCLUDED_CYBERRADIO_VITA49_VIEW_H
+#define INCLUDED_CYBERRADIO_VITA49_VIEW_H
+
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Read-only view of a VITA 49 signal data packet in a caller-owned
+ *    buffer.
+ *
+ * Nothing is copied and nothing is decoded up front: the constructor only
+ * checks for the VITA 49.1 "VRLP" framing word, and each accessor reads the
+ * words it needs when called.  Field offsets follow from the header bits
+ * (packet type, C, T, TSI and TSF), so the same view handles packets with or
+ * without stream ID, class ID, timestamps and trailer.
+ *
+ * Radios that carry vendor words between the standard header fields and the
+ * samples (for example, the DDC words on the NDR358/NDR551) are handled by
+ * passing the number of such words to the payload accessors; the words
+ * themselves are available from extension_word().
+ *
+ * The view does not check that the buffer is as long as the packet claims;
+ * use valid() for that.
+ */
+class vita49_view {
+public:
+  static const uint32_t vrlp_word = 0x56524c50; //!< "VRLP"
+  static const uint32_t vend_word = 0x56454e44; //!< "VEND"
+
+  /*!
+   * \param buf start of the packet (the VRLP word, if framed)
+   * \param len number of valid bytes in the buffer
+   * \param swapped whether the packet's 32-bit words are in the opposite
+   *    byte order from the host's
+   */
+  vita49_view(const void *buf, size_t len, bool swapped = false)
+      : d_buf(static_cast<const uint8_t *>(buf)), d_len(len),
+        d_swapped(swapped), d_hdr(0) {
+    if (len >= 4 && word(0) == vrlp_word)
+      d_hdr = 2;
+  }
+
+  //! Raw 32-bit word \p i of the buffer, in host order
+  uint32_t word(size_t i) const {
+    uint32_t w;
+    memcpy(&w, d_buf + 4 * i, sizeof(w));
+    return d_swapped ? __builtin_bswap32(w) : w;
+  }
+
+  const uint8_t *data() const { return d_buf; }
+  size_t size() const { return d_len; }
+
+  //! Whether the buffer holds the whole packet its header describes
+  bool valid() const {
+    return (d_len >= 4 * (d_hdr + 1)) && (total_bytes() <= d_len) &&
+           (header_bytes() + trailer_bytes() <= total_bytes());
+  }
+
+  //! \name VITA 49.1 framing
+  //@{
+  bool has_framing() const { return d_hdr != 0; }
+  uint32_t frame_count() const { return d_hdr ? (word(1) >> 20) & 0xFFF : 0; }
+  //! Frame size, in 32-bit words
+  uint32_t frame_size() const { return d_hdr ? word(1) & 0xFFFFF : 0; }
+  //@}
+
+  //! \name VRT packet header
+  //@{
+  uint32_t header_word() const { return word(d_hdr); }
+  int packet_type() const { return (header_word() >> 28) & 0x0F; }
+  bool has_class_id() const { return (header_word() >> 27) & 0x01; }
+  bool has_trailer() const { return (header_word() >> 26) & 0x01; }
+  int tsi() const { return (header_word() >> 22) & 0x03; }
+  int tsf() const { return (header_word() >> 20) & 0x03; }
+  int packet_count() const { return (header_word() >> 16) & 0x0F; }
+  //! Packet size, in 32-bit words
+  uint32_t packet_size() const { return header_word() & 0xFFFF; }
+  //! Packet types 1 and 3 carry a stream ID
+  bool has_stream_id() const { return (packet_type() & 0x01) != 0; }
+  //@}
+
+  //! \name Optional header fields (zero if absent)
+  //@{
+  uint32_t stream_id() const {
+    return has_stream_id() ? word(d_hdr + 1) : 0;
+  }
+  //! Organizationally unique identifier
+  uint32_t oui() const {
+    return has_class_id() ? word(class_id_index()) & 0x00FFFFFF : 0;
+  }
+  //! Information class code
+  uint16_t icc() const {
+    return has_class_id() ? word(class_id_index() + 1) >> 16 : 0;
+  }
+  //! Packet class code
+  uint16_t pcc() const {
+    return has_class_id() ? word(class_id_index() + 1) & 0xFFFF : 0;
+  }
+  uint32_t timestamp_int() const {
+    return tsi() != 0 ? word(tsi_index()) : 0;
+  }
+  uint64_t timestamp_frac() const {
+    if (tsf() == 0)
+      return 0;
+    size_t i = tsf_index();
+    return (uint64_t(word(i)) << 32) | word(i + 1);
+  }
+  //! Trailer word
+  uint32_t trailer() const {
+    return has_trailer() ? word(d_hdr + packet_size() - 1) : 0;
+  }
+  //@}
+
+  //! \name Layout
+  //@{
+  //! Bytes from the start of the buffer to the end of the standard header
+  size_t header_bytes() const { return 4 * tsf_index() + (tsf() ? 8 : 0); }
+  //! Bytes after the payload (trailer plus VEND)
+  size_t trailer_bytes() const {
+    return (has_trailer() ? 4 : 0) + (d_hdr ? 4 : 0);
+  }
+  //! Total packet length, including any framing
+  size_t total_bytes() const {
+    return d_hdr ? 4 * size_t(frame_size())
+                 : 4 * size_t(packet_size());
+  }
+  //! Vendor word \p n following the standard header
+  uint32_t extension_word(size_t n) const {
+    return word(header_bytes() / 4 + n);
+  }
+  //@}
+
+  //! \name Payload (zero-copy)
+  //@{
+  size_t payload_offset(size_t extension_words = 0) const {
+    return header_bytes() + 4 * extension_words;
+  }
+  size_t payload_bytes(size_t extension_words = 0) const {
+    size_t end = total_bytes() - trailer_bytes();
+    size_t off = payload_offset(extension_words);
+    return end > off ? end - off : 0;
+  }
+  const uint8_t *payload(size_t extension_words = 0) const {
+    return d_buf + payload_offset(extension_words);
+  }
+  /*!
+   * \brief Interleaved 16-bit I/Q samples, as they are in the buffer.
+   *
+   * Byte and I/Q swapping, if needed, are up to the caller.
+   */
+  const int16_t *samples(size_t extension_words = 0) const {
+    return reinterpret_cast<const int16_t *>(payload(extension_words));
+  }
+  size_t num_samples(size_t extension_words = 0) const {
+    return payload_bytes(extension_words) / 4;
+  }
+  //@}
+
+private:
+  size_t class_id_index() const {
+    return d_hdr + 1 + (has_stream_id() ? 1 : 0);
+  }
+  size_t tsi_index() const {
+    return class_id_index() + (has_class_id() ? 2 : 0);
+  }
+  size_t tsf_index() const { return tsi_index() + (tsi() ? 1 : 0); }
+
+  const uint8_t *d_buf;
+  size_t d_len;
+  bool d_swapped;
+  size_t d_hdr; // word index of the VRT header
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_VITA49_VIEW_H */
@@ -96,6 +96,11 @@ namespace gr
        *    False.
        * \param tagged Whether the block should produce stream tags.  Defaults to
        *    False.
+       * \param auto_detect Whether the block should determine the packet layout
+       *    from the first few packets received.  If true, vita_type,
+       *    payload_size, vita_header_size, vita_tail_size and byte_swapped are
+       *    replaced by the detected values (see get_detected_layout()).
+       *    Defaults to False.
        *
        * \return A boost::shared_ptr<vita_iq_source> representing the new source
        *    block.
@@ -110,7 +115,8 @@ namespace gr
                const std::string& host = "0.0.0.0",
                const std::vector<unsigned short>& port_list = std::vector<unsigned short>(),
                bool debug = false,
-               bool tagged = false);
+               bool tagged = false,
+               bool auto_detect = false);
 
       /*!
        * \brief Gets the real-time calculated sample rate for a specific
@@ -120,6 +126,14 @@ namespace gr
        */
       virtual float get_realtime_sample_rate(int output = 0) = 0;
 
+      /*!
+       * \brief Gets the packet layout found by auto-detection.
+       * \return A description of the layout, suitable for pinning the
+       *    block configuration, or an empty string if auto-detection is off
+       *    or has not locked yet.
+       */
+      virtual std::string get_detected_layout() = 0;
+
     };
 
   } // namespace CyberRadio
@@ -24,6 +24,7 @@
 
 #include <gnuradio/block.h>
 #include <CyberRadio/api.h>
+#include <vector>
 
 namespace gr {
 namespace CyberRadio {
@@ -57,6 +58,10 @@ public:
         bool uses_v49_1 = true;      ///< VITA 49.1 (VRLP and VEND headers)
         bool narrowband = false;     ///< if using a narrowband DDC
         bool debug = false;          ///< output extra debug info
+        bool kernel_timestamps = false;   ///< request SO_TIMESTAMPNS receive times
+        int latency_tag_interval = 0;     ///< tag every Nth packet with its rx time (0=off)
+        float latency_report_period = 0;  ///< seconds between latency status messages (0=off)
+        bool auto_detect = false;         ///< detect the packet layout from the headers
     };
 
     /*!
@@ -78,7 +83,40 @@ public:
                        vector_output, 
                        bool uses_v491, 
                        bool narrowband, 
-                       bool debug) -> sptr;
+                       bool debug,
+                       bool kernel_timestamps = false,
+                       int latency_tag_interval = 0,
+                       float latency_report_period = 0.0,
+                       bool auto_detect = false) -> sptr;
+
+    /*!
+     * \brief Kernel-to-output latency statistics since the last reset.
+     *
+     * Only collected when kernel_timestamps is enabled. Latency is measured from
+     * the kernel's SO_TIMESTAMPNS receive time to the moment the packet's samples
+     * are written to the output buffer.
+     *
+     * \return [packet count, p50 (us), p99 (us), max (us)]
+     */
+    virtual auto get_latency_stats() -> std::vector<double> = 0;
+
+    //! Clear the latency statistics
+    virtual auto reset_latency_stats() -> void = 0;
+
+    /*!
+     * \brief Packet layout found by auto_detect.
+     *
+     * With auto_detect, the header_byte_offset, samples_per_packet,
+     * bytes_per_packet, swap_bytes and uses_v49_1 settings are replaced by
+     * values read from the first few packets. samples_per_packet, if non-zero,
+     * is used as a hint to account for vendor words after the standard header.
+     * The layout is also published on the status port once it is locked, so
+     * it can be pinned in the configuration.
+     *
+     * \return a description of the layout, or an empty string if auto_detect
+     *         is off or the layout is not locked yet
+     */
+    virtual auto get_detected_layout() -> std::string = 0;
 
     // these are already virtual ... do we need the pure virtual?
     bool start() override = 0;
@@ -0,0 +1,79 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_WOLA_LOG_MAG_FFT_CF_H
+#define INCLUDED_CYBERRADIO_WOLA_LOG_MAG_FFT_CF_H
+
+#include <CyberRadio/api.h>
+#include <gnuradio/sync_block.h>
+#include <string>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Weighted overlap-add FFT and plain windowed FFT from one input read.
+ * \ingroup CyberRadio
+ *
+ * Each input vector holds n_overlap*fft_size samples.  The WOLA spectrum
+ * multiplies the whole vector by a window of that length, folds
+ * (sums) the n_overlap segments into fft_size points and transforms them,
+ * trading leakage for resolution at the same FFT size.  The small spectrum
+ * is an ordinary windowed FFT of the first fft_size samples.  Both are made
+ * in the same pass over the input and transformed together by one batched
+ * FFTW plan, then shifted, averaged and converted to dB as log_mag_fft_cf
+ * does.
+ *
+ * The fold and window coefficients, scaled as wola_log_mag_fft scaled
+ * them, are only recomputed when the window type changes.
+ *
+ * Outputs: 0 WOLA log magnitude, 1 WOLA averaged |X|^2, 2 small FFT log
+ * magnitude, 3 small FFT averaged |X|^2.  A message on the "reset" port
+ * restarts the averaging.
+ */
+class CYBERRADIO_API wola_log_mag_fft_cf : virtual public gr::sync_block {
+public:
+  typedef boost::shared_ptr<wola_log_mag_fft_cf> sptr;
+
+  /*!
+   * \param fft_size FFT length
+   * \param n_overlap number of fft_size segments folded together
+   * \param window_type scipy.signal.get_window() name, e.g.
+   *    "blackmanharris"
+   * \param avg_alpha averaging constant in [0, 1]; 1 disables averaging
+   * \param nthreads FFTW threads for the batched transform
+   */
+  static sptr make(int fft_size = 1024, int n_overlap = 4,
+                   const std::string &window_type = "blackmanharris",
+                   double avg_alpha = 0.105112, int nthreads = 1);
+
+  virtual void set_avg_alpha(double alpha) = 0;
+  virtual double avg_alpha() const = 0;
+  virtual void set_window_type(const std::string &window_type) = 0;
+  virtual std::string window_type() const = 0;
+  virtual void reset() = 0;
+  virtual void set_nthreads(int n) = 0;
+  virtual int nthreads() const = 0;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_WOLA_LOG_MAG_FFT_CF_H */
@@ -0,0 +1,310 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "cross_spectral_matrix_cc_impl.h"
+#include "single_pole_iir_kernels.h"
+#include <algorithm>
+#include <cmath>
+#include <complex>
+#include <cstring>
+#include <gnuradio/io_signature.h>
+#include <stdexcept>
+#include <volk/volk.h>
+
+namespace gr {
+namespace CyberRadio {
+
+// Bins per pass over the pair loop: a block of every channel's spectrum
+// stays in cache while all the pairs that use it are updated.
+static const int BIN_BLOCK = 1024;
+
+cross_spectral_matrix_cc::sptr
+cross_spectral_matrix_cc::make(int num_channels, int fft_size,
+                               const std::string &window_type,
+                               double avg_alpha, int frame_decimation,
+                               int update_frames, int reference,
+                               int nthreads) {
+  return gnuradio::get_initial_sptr(new cross_spectral_matrix_cc_impl(
+      num_channels, fft_size, window_type, avg_alpha, frame_decimation,
+      update_frames, reference, nthreads));
+}
+
+/*
+ * The private constructor
+ */
+cross_spectral_matrix_cc_impl::cross_spectral_matrix_cc_impl(
+    int num_channels, int fft_size, const std::string &window_type,
+    double avg_alpha, int frame_decimation, int update_frames,
+    int reference, int nthreads)
+    : gr::sync_decimator(
+          "cross_spectral_matrix_cc",
+          io_signature::make(num_channels, num_channels, sizeof(gr_complex)),
+          io_signature::make(0, 1,
+                             sizeof(gr_complex) * fft_size *
+                                 (num_channels * (num_channels + 1) / 2)),
+          fft_size * frame_decimation),
+      d_num_channels(num_channels), d_fft_size(fft_size),
+      d_num_pairs(num_channels * (num_channels + 1) / 2), d_alpha(1.0f),
+      d_update_frames(0), d_reference(0), d_fft(NULL), d_csd(NULL),
+      d_prod(NULL), d_frames(0), d_since_update(0) {
+  if (num_channels < 2)
+    throw std::invalid_argument(
+        "cross_spectral_matrix_cc: num_channels must be at least 2");
+  if (fft_size < 1 || frame_decimation < 1)
+    throw std::invalid_argument("cross_spectral_matrix_cc: fft_size and "
+                                "frame_decimation must be positive");
+  set_avg_alpha(avg_alpha);
+  set_update_frames(update_frames);
+  set_reference(reference);
+  set_window_type(window_type);
+  d_fft = new fft_batch(fft_size, num_channels, true, nthreads);
+  size_t align = volk_get_alignment();
+  d_csd = (gr_complex *)volk_malloc(
+      sizeof(gr_complex) * fft_size * d_num_pairs, align);
+  d_prod = (gr_complex *)volk_malloc(sizeof(gr_complex) * BIN_BLOCK, align);
+  std::fill(d_csd, d_csd + size_t(fft_size) * d_num_pairs, gr_complex(0));
+  set_tag_propagation_policy(TPP_DONT);
+  message_port_register_out(pmt::mp("calibration"));
+  message_port_register_in(pmt::mp("reset"));
+  set_msg_handler(
+      pmt::mp("reset"),
+      boost::bind(&cross_spectral_matrix_cc_impl::rxResetMsg, this, _1));
+}
+
+cross_spectral_matrix_cc_impl::~cross_spectral_matrix_cc_impl() {
+  delete d_fft;
+  volk_free(d_csd);
+  volk_free(d_prod);
+}
+
+void cross_spectral_matrix_cc_impl::set_avg_alpha(double alpha) {
+  if (!(alpha > 0) || alpha > 1)
+    throw std::out_of_range(
+        "cross_spectral_matrix_cc: avg_alpha must be in (0, 1]");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_alpha = float(alpha);
+}
+
+void cross_spectral_matrix_cc_impl::set_window_type(
+    const std::string &window_type) {
+  window_sptr w = cached_window(window_type, d_fft_size, WINDOW_NORM_ENERGY);
+  gr::thread::scoped_lock lock(d_mutex);
+  d_window = w;
+  d_window_type = window_type;
+}
+
+void cross_spectral_matrix_cc_impl::set_update_frames(int frames) {
+  if (frames < 0)
+    throw std::out_of_range(
+        "cross_spectral_matrix_cc: update_frames must not be negative");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_update_frames = frames;
+  d_since_update = 0;
+}
+
+void cross_spectral_matrix_cc_impl::set_reference(int channel) {
+  if (channel < 0 || channel >= d_num_channels)
+    throw std::out_of_range(
+        "cross_spectral_matrix_cc: reference channel out of range");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_reference = channel;
+}
+
+void cross_spectral_matrix_cc_impl::reset() {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_frames = 0;
+  d_since_update = 0;
+}
+
+void cross_spectral_matrix_cc_impl::set_nthreads(int n) {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_fft->set_nthreads(n);
+}
+
+void cross_spectral_matrix_cc_impl::rxResetMsg(pmt::pmt_t msg) { reset(); }
+
+/*
+ * Calibration offsets and coherence from the current average; any of the
+ * outputs may be null.  Called with d_mutex held.
+ */
+void cross_spectral_matrix_cc_impl::calibration(
+    std::vector<float> *gain, std::vector<float> *phase,
+    std::vector<float> *coherence) const {
+  const int C = d_num_channels;
+  const int N = d_fft_size;
+  const int ref = d_reference;
+  std::vector<double> power(C, 0.0);
+  for (int c = 0; c < C; c++) {
+    const gr_complex *s = d_csd + size_t(pair_index(c, c)) * N;
+    for (int k = 0; k < N; k++)
+      power[c] += s[k].real();
+  }
+  if (gain) {
+    gain->assign(C, 0.0f);
+    for (int c = 0; c < C; c++)
+      if (power[c] > 0 && power[ref] > 0)
+        (*gain)[c] = float(10.0 * log10(power[c] / power[ref]));
+  }
+  if (phase) {
+    // S[a][b] = X_a conj(X_b) is channel a's phase less channel b's
+    phase->assign(C, 0.0f);
+    for (int c = 0; c < C; c++) {
+      if (c == ref)
+        continue;
+      const gr_complex *s =
+          d_csd + size_t(pair_index(std::min(c, ref), std::max(c, ref))) * N;
+      std::complex<double> sum = 0;
+      for (int k = 0; k < N; k++)
+        sum += std::complex<double>(s[k]);
+      double ph = std::arg(sum);
+      (*phase)[c] = float(c < ref ? ph : -ph);
+    }
+  }
+  if (coherence) {
+    coherence->clear();
+    for (int a = 0; a < C; a++) {
+      const gr_complex *sa = d_csd + size_t(pair_index(a, a)) * N;
+      for (int b = a + 1; b < C; b++) {
+        const gr_complex *sb = d_csd + size_t(pair_index(b, b)) * N;
+        const gr_complex *sab = d_csd + size_t(pair_index(a, b)) * N;
+        double acc = 0;
+        int used = 0;
+        for (int k = 0; k < N; k++) {
+          double den = double(sa[k].real()) * sb[k].real();
+          if (den > 0) {
+            acc += std::norm(sab[k]) / den;
+            used++;
+          }
+        }
+        coherence->push_back(used ? float(acc / used) : 0.0f);
+      }
+    }
+  }
+}
+
+std::vector<float> cross_spectral_matrix_cc_impl::gain_offsets() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  std::vector<float> gain;
+  calibration(&gain, NULL, NULL);
+  return gain;
+}
+
+std::vector<float> cross_spectral_matrix_cc_impl::phase_offsets() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  std::vector<float> phase;
+  calibration(NULL, &phase, NULL);
+  return phase;
+}
+
+std::vector<float> cross_spectral_matrix_cc_impl::coherence() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  std::vector<float> coh;
+  calibration(NULL, NULL, &coh);
+  return coh;
+}
+
+void cross_spectral_matrix_cc_impl::publish() {
+  std::vector<float> gain, phase, coh;
+  calibration(&gain, &phase, &coh);
+  std::vector<int> pairs;
+  for (int a = 0; a < d_num_channels; a++)
+    for (int b = a + 1; b < d_num_channels; b++) {
+      pairs.push_back(a);
+      pairs.push_back(b);
+    }
+  pmt::pmt_t msg = pmt::make_dict();
+  msg = pmt::dict_add(msg, pmt::mp("gain_db"),
+                      pmt::init_f32vector(gain.size(), gain));
+  msg = pmt::dict_add(msg, pmt::mp("phase"),
+                      pmt::init_f32vector(phase.size(), phase));
+  msg = pmt::dict_add(msg, pmt::mp("coherence"),
+                      pmt::init_f32vector(coh.size(), coh));
+  msg = pmt::dict_add(msg, pmt::mp("pairs"),
+                      pmt::init_s32vector(pairs.size(), pairs));
+  msg = pmt::dict_add(msg, pmt::mp("reference"),
+                      pmt::from_long(d_reference));
+  msg = pmt::dict_add(msg, pmt::mp("frames"), pmt::from_uint64(d_frames));
+  message_port_pub(pmt::mp("calibration"), msg);
+}
+
+int cross_spectral_matrix_cc_impl::work(
+    int noutput_items, gr_vector_const_void_star &input_items,
+    gr_vector_void_star &output_items) {
+  gr::thread::scoped_lock lock(d_mutex);
+  const int C = d_num_channels;
+  const int N = d_fft_size;
+  const size_t frame = decimation();
+  const float *window = &(*d_window)[0];
+  gr_complex *out =
+      output_items.empty() ? NULL : (gr_complex *)output_items[0];
+  const int half = N / 2;
+  const int upper = N - half;
+
+  for (int i = 0; i < noutput_items; i++) {
+    for (int c = 0; c < C; c++)
+      volk_32fc_32f_multiply_32fc(
+          d_fft->get_inbuf(c),
+          (const gr_complex *)input_items[c] + i * frame, window, N);
+    d_fft->execute();
+
+    // A running mean until 1/alpha frames, so the average settles in that
+    // many frames instead of ramping up from zero
+    d_frames++;
+    const float alpha = (double(d_frames) * d_alpha < 1.0)
+                            ? float(1.0 / double(d_frames))
+                            : d_alpha;
+    for (int k0 = 0; k0 < N; k0 += BIN_BLOCK) {
+      const int n = std::min(BIN_BLOCK, N - k0);
+      float *s = (float *)(d_csd + k0);
+      for (int a = 0; a < C; a++) {
+        const gr_complex *xa = d_fft->get_outbuf(a) + k0;
+        for (int b = a; b < C; b++) {
+          volk_32fc_x2_multiply_conjugate_32fc(
+              d_prod, xa, d_fft->get_outbuf(b) + k0, n);
+          single_pole_iir_update(s, NULL, (const float *)d_prod, alpha,
+                                 2 * size_t(n));
+          s += 2 * size_t(N);
+        }
+      }
+    }
+
+    if (out) {
+      for (int p = 0; p < d_num_pairs; p++) {
+        const gr_complex *s = d_csd + size_t(p) * N;
+        gr_complex *o = out + (size_t(i) * d_num_pairs + p) * N;
+        memcpy(o, s + half, sizeof(gr_complex) * upper);
+        memcpy(o + upper, s, sizeof(gr_complex) * half);
+      }
+    }
+
+    if (d_update_frames > 0 && ++d_since_update >= d_update_frames) {
+      d_since_update = 0;
+      publish();
+    }
+  }
+  return noutput_items;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
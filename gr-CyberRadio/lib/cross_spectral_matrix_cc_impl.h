@@ -0,0 +1,88 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_CROSS_SPECTRAL_MATRIX_CC_IMPL_H
+#define INCLUDED_CYBERRADIO_CROSS_SPECTRAL_MATRIX_CC_IMPL_H
+
+#include <CyberRadio/cross_spectral_matrix_cc.h>
+#include "fft_batch.h"
+#include "spectral_cache.h"
+#include <gnuradio/thread/thread.h>
+
+namespace gr {
+namespace CyberRadio {
+
+class cross_spectral_matrix_cc_impl : public cross_spectral_matrix_cc {
+private:
+  int d_num_channels;
+  int d_fft_size;
+  int d_num_pairs;
+  std::string d_window_type;
+  window_sptr d_window;
+  float d_alpha;
+  int d_update_frames;
+  int d_reference;
+  fft_batch *d_fft;   // transform c is channel c
+  gr_complex *d_csd;  // d_num_pairs * fft_size, unshifted bins
+  gr_complex *d_prod;
+  uint64_t d_frames;
+  int d_since_update;
+  mutable gr::thread::mutex d_mutex;
+
+  //! Index of pair (a, b), a <= b, in d_csd
+  int pair_index(int a, int b) const {
+    return a * d_num_channels - a * (a - 1) / 2 + (b - a);
+  }
+  void calibration(std::vector<float> *gain, std::vector<float> *phase,
+                   std::vector<float> *coherence) const;
+  void publish();
+  void rxResetMsg(pmt::pmt_t msg);
+
+public:
+  cross_spectral_matrix_cc_impl(int num_channels, int fft_size,
+                                const std::string &window_type,
+                                double avg_alpha, int frame_decimation,
+                                int update_frames, int reference,
+                                int nthreads);
+  ~cross_spectral_matrix_cc_impl();
+
+  void set_avg_alpha(double alpha);
+  double avg_alpha() const { return d_alpha; }
+  void set_window_type(const std::string &window_type);
+  std::string window_type() const { return d_window_type; }
+  void set_update_frames(int frames);
+  int update_frames() const { return d_update_frames; }
+  void set_reference(int channel);
+  int reference() const { return d_reference; }
+  std::vector<float> gain_offsets() const;
+  std::vector<float> phase_offsets() const;
+  std::vector<float> coherence() const;
+  void reset();
+  void set_nthreads(int n);
+  int nthreads() const { return d_fft->nthreads(); }
+
+  int work(int noutput_items, gr_vector_const_void_star &input_items,
+           gr_vector_void_star &output_items);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_CROSS_SPECTRAL_MATRIX_CC_IMPL_H */
@@ -0,0 +1,49 @@
+/* -*- c++ -*- */
+/***************************************************************************
+ * \file ddc_rates.h
+ *
+ * \brief DDC filter index to output sample rate, as the radios report it.
+ *
+ * \copyright Copyright (c) 2026 CyberRadio Solutions, Inc.
+ *
+ */
+
+#ifndef INCLUDED_CYBERRADIO_DDC_RATES_H
+#define INCLUDED_CYBERRADIO_DDC_RATES_H
+
+#include <cmath>
+#include <map>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Sample rate (sps) of each NDR358/NDR551 DDC filter index.
+ *
+ * This is the table behind vita_udp_rx's "ddc_rate" tag.
+ */
+inline const std::map<int, float> &ndr358_551_ddc_map() {
+  static const std::map<int, float> rates = {
+      {0, 0.25e3}, {1, 0.5e3},  {2, 1.0e3},  {3, 2.0e3},   {4, 4.0e3},
+      {5, 8.0e3},  {6, 16e3},   {7, 32e3},   {8, 64e3},    {9, 128e3},
+      {10, 200e3}, {11, 256e3}, {12, 400e3}, {13, 1.28e6}, {14, 3.2e6},
+      {15, 4e6},   {16, 2e6},   {32, 8e6},   {33, 8e6},    {34, 16e6},
+      {35, 16e6},  {36, 16e6},  {37, 32e6},  {38, 32e6},   {39, 64e6},
+      {40, 128e6}};
+  return rates;
+}
+
+//! True if \p rate is one of ndr358_551_ddc_map()'s rates (to 1 ppm)
+inline bool is_ddc_rate(double rate) {
+  const std::map<int, float> &rates = ndr358_551_ddc_map();
+  for (std::map<int, float>::const_iterator it = rates.begin();
+       it != rates.end(); ++it)
+    if (std::fabs(rate - it->second) <= 1e-6 * it->second)
+      return true;
+  return false;
+}
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_DDC_RATES_H */
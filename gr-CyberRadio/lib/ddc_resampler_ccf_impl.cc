@@ -0,0 +1,220 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "ddc_resampler_ccf_impl.h"
+#include <algorithm>
+#include <cmath>
+#include <cstring>
+#include <gnuradio/io_signature.h>
+#include <stdexcept>
+#include <volk/volk.h>
+
+namespace gr {
+namespace CyberRadio {
+
+ddc_resampler_ccf::sptr ddc_resampler_ccf::make(double out_rate,
+                                                double in_rate,
+                                                double attenuation_db) {
+  return gnuradio::get_initial_sptr(
+      new ddc_resampler_ccf_impl(out_rate, in_rate, attenuation_db));
+}
+
+/*
+ * The private constructor
+ */
+ddc_resampler_ccf_impl::ddc_resampler_ccf_impl(double out_rate,
+                                               double in_rate,
+                                               double attenuation_db)
+    : gr::block("ddc_resampler_ccf",
+                io_signature::make(1, 1, sizeof(gr_complex)),
+                io_signature::make(1, 1, sizeof(gr_complex))),
+      d_in_rate(0.0), d_out_rate(out_rate), d_attenuation_db(attenuation_db),
+      d_next(0), d_phase(0), d_tag_pending(true) {
+  if (out_rate < 1)
+    throw std::invalid_argument(
+        "ddc_resampler_ccf: out_rate must be at least 1 sps");
+  if (!(attenuation_db > 0))
+    throw std::invalid_argument(
+        "ddc_resampler_ccf: attenuation_db must be positive");
+  retune(in_rate, out_rate, attenuation_db);
+  set_tag_propagation_policy(TPP_DONT);
+}
+
+ddc_resampler_ccf_impl::~ddc_resampler_ccf_impl() {}
+
+/*
+ * Switch designs and restart the filter empty.  A rate of 0 (or below)
+ * means unknown: input is dropped until the next retune.  Throws, leaving
+ * everything as it was, if the design can't be made.  Lock held.
+ */
+void ddc_resampler_ccf_impl::retune(double in_rate, double out_rate,
+                                    double attenuation_db) {
+  resampler_design_sptr design;
+  if (in_rate > 0)
+    design = cached_resampler_design(in_rate, out_rate, attenuation_db);
+  d_in_rate = in_rate > 0 ? in_rate : 0.0;
+  d_out_rate = out_rate;
+  d_attenuation_db = attenuation_db;
+  d_design = design;
+  d_next = 0;
+  d_phase = 0;
+  d_tag_pending = true;
+  if (design) {
+    d_buf.assign(design->taps_per_phase - 1, gr_complex(0, 0));
+    set_relative_rate(double(design->interp) / design->decim);
+  } else {
+    d_buf.clear();
+  }
+}
+
+double ddc_resampler_ccf_impl::in_rate() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return d_in_rate;
+}
+
+void ddc_resampler_ccf_impl::set_in_rate(double rate) {
+  gr::thread::scoped_lock lock(d_mutex);
+  retune(rate, d_out_rate, d_attenuation_db);
+}
+
+double ddc_resampler_ccf_impl::out_rate() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return d_out_rate;
+}
+
+void ddc_resampler_ccf_impl::set_out_rate(double rate) {
+  if (rate < 1)
+    throw std::invalid_argument(
+        "ddc_resampler_ccf: out_rate must be at least 1 sps");
+  gr::thread::scoped_lock lock(d_mutex);
+  retune(d_in_rate, rate, d_attenuation_db);
+}
+
+double ddc_resampler_ccf_impl::attenuation_db() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return d_attenuation_db;
+}
+
+void ddc_resampler_ccf_impl::set_attenuation_db(double attenuation_db) {
+  if (!(attenuation_db > 0))
+    throw std::invalid_argument(
+        "ddc_resampler_ccf: attenuation_db must be positive");
+  gr::thread::scoped_lock lock(d_mutex);
+  retune(d_in_rate, d_out_rate, attenuation_db);
+}
+
+int ddc_resampler_ccf_impl::interpolation() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return d_design ? d_design->interp : 0;
+}
+
+int ddc_resampler_ccf_impl::decimation() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return d_design ? d_design->decim : 0;
+}
+
+void ddc_resampler_ccf_impl::forecast(int noutput_items,
+                                      gr_vector_int &ninput_items_required) {
+  gr::thread::scoped_lock lock(d_mutex);
+  int n = noutput_items;
+  if (d_design)
+    n = int(int64_t(noutput_items) * d_design->decim / d_design->interp) + 1;
+  ninput_items_required[0] = n;
+}
+
+int ddc_resampler_ccf_impl::general_work(int noutput_items,
+                                         gr_vector_int &ninput_items,
+                                         gr_vector_const_void_star &input_items,
+                                         gr_vector_void_star &output_items) {
+  gr::thread::scoped_lock lock(d_mutex);
+  const gr_complex *in = (const gr_complex *)input_items[0];
+  gr_complex *out = (gr_complex *)output_items[0];
+  const uint64_t start = nitems_read(0);
+
+  // Run up to the next rate change; one at this call's first sample takes
+  // effect now.  vita_udp_rx repeats the tag on every packet, so only a
+  // rate that differs (to the sample per second) retunes.
+  int n = ninput_items[0];
+  std::vector<gr::tag_t> tags;
+  get_tags_in_range(tags, 0, start, start + n, pmt::mp("ddc_rate"));
+  for (size_t t = 0; t < tags.size(); t++) {
+    int rel = int(tags[t].offset - start);
+    if (rel > 0) {
+      n = rel;
+      break;
+    }
+    double rate = pmt::to_double(tags[t].value);
+    if (std::llround(rate) == std::llround(d_in_rate))
+      continue;
+    try {
+      retune(rate, d_out_rate, d_attenuation_db);
+    } catch (std::exception &e) {
+      GR_LOG_WARN(d_logger, std::string("ddc_rate: ") + e.what() +
+                                "; dropping input");
+      retune(0.0, d_out_rate, d_attenuation_db);
+      d_in_rate = rate;
+    }
+  }
+  if (!d_design) {
+    consume_each(n);
+    return 0;
+  }
+
+  const int L = d_design->interp;
+  const int M = d_design->decim;
+  const int K = d_design->taps_per_phase;
+  const float *taps = &d_design->taps[0];
+  const size_t hist = K - 1;
+  d_buf.resize(hist + n);
+  memcpy(&d_buf[hist], in, sizeof(gr_complex) * n);
+
+  if (d_tag_pending) {
+    add_item_tag(0, nitems_written(0), pmt::mp("ddc_rate"),
+                 pmt::from_float(float(d_out_rate)));
+    d_tag_pending = false;
+  }
+
+  // d_buf[i .. i+K) ends at the next output's newest input sample
+  int64_t i = d_next;
+  int phase = d_phase;
+  int produced = 0;
+  while (produced < noutput_items && i < n) {
+    volk_32fc_32f_dot_prod_32fc(out + produced, &d_buf[i], taps + phase * K,
+                                K);
+    produced++;
+    phase += M;
+    i += phase / L;
+    phase %= L;
+  }
+  int consumed = int(std::min<int64_t>(i, n));
+  memmove(&d_buf[0], &d_buf[consumed], sizeof(gr_complex) * hist);
+  d_buf.resize(hist);
+  d_next = int(i - consumed);
+  d_phase = phase;
+  consume_each(consumed);
+  return produced;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
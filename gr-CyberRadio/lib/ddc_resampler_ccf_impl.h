@@ -0,0 +1,69 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_DDC_RESAMPLER_CCF_IMPL_H
+#define INCLUDED_CYBERRADIO_DDC_RESAMPLER_CCF_IMPL_H
+
+#include <CyberRadio/ddc_resampler_ccf.h>
+#include "spectral_cache.h"
+#include <gnuradio/thread/thread.h>
+
+namespace gr {
+namespace CyberRadio {
+
+class ddc_resampler_ccf_impl : public ddc_resampler_ccf {
+private:
+  double d_in_rate;
+  double d_out_rate;
+  double d_attenuation_db;
+  resampler_design_sptr d_design;  // null while the input rate is unknown
+  // Input after the filter's taps_per_phase-1 samples of history
+  std::vector<gr_complex> d_buf;
+  int d_next;    // newest input sample of the next output, from the next input
+  int d_phase;   // filter phase of the next output
+  bool d_tag_pending;
+  mutable gr::thread::mutex d_mutex;
+
+  void retune(double in_rate, double out_rate, double attenuation_db);
+
+public:
+  ddc_resampler_ccf_impl(double out_rate, double in_rate,
+                         double attenuation_db);
+  ~ddc_resampler_ccf_impl();
+
+  double in_rate() const;
+  void set_in_rate(double rate);
+  double out_rate() const;
+  void set_out_rate(double rate);
+  double attenuation_db() const;
+  void set_attenuation_db(double attenuation_db);
+  int interpolation() const;
+  int decimation() const;
+
+  void forecast(int noutput_items, gr_vector_int &ninput_items_required);
+  int general_work(int noutput_items, gr_vector_int &ninput_items,
+                   gr_vector_const_void_star &input_items,
+                   gr_vector_void_star &output_items);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_DDC_RESAMPLER_CCF_IMPL_H */
@@ -0,0 +1,285 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "demod_bank_cf_impl.h"
+#include <algorithm>
+#include <cmath>
+#include <cstring>
+#include <gnuradio/filter/firdes.h>
+#include <gnuradio/io_signature.h>
+#include <stdexcept>
+#include <volk/volk.h>
+
+namespace gr {
+namespace CyberRadio {
+
+// Per-sample tracking constant of the AM carrier level, about 1000 samples
+static const double AM_ALPHA = 1.0 / 1024;
+
+demod_bank_cf::sptr demod_bank_cf::make(const std::vector<std::string> &modes,
+                                        double fs, double squelch_db,
+                                        double fm_deviation) {
+  return gnuradio::get_initial_sptr(
+      new demod_bank_cf_impl(modes, fs, squelch_db, fm_deviation));
+}
+
+demod_bank_cf_impl::demod_mode_t
+demod_bank_cf_impl::parse_mode(const std::string &name) {
+  if (name == "off")
+    return MODE_OFF;
+  if (name == "am")
+    return MODE_AM;
+  if (name == "fm")
+    return MODE_FM;
+  if (name == "usb")
+    return MODE_USB;
+  if (name == "lsb")
+    return MODE_LSB;
+  throw std::invalid_argument("demod_bank_cf: unknown mode '" + name + "'");
+}
+
+std::string demod_bank_cf_impl::mode_name(demod_mode_t mode) {
+  switch (mode) {
+  case MODE_AM:
+    return "am";
+  case MODE_FM:
+    return "fm";
+  case MODE_USB:
+    return "usb";
+  case MODE_LSB:
+    return "lsb";
+  default:
+    return "off";
+  }
+}
+
+/*
+ * The private constructor
+ */
+demod_bank_cf_impl::demod_bank_cf_impl(const std::vector<std::string> &modes,
+                                       double fs, double squelch_db,
+                                       double fm_deviation)
+    : gr::sync_block(
+          "demod_bank_cf",
+          io_signature::make(modes.size(), modes.size(), sizeof(gr_complex)),
+          io_signature::make(modes.size(), modes.size(), sizeof(float))),
+      d_num_channels(modes.size()), d_fs(fs), d_fm_deviation(fm_deviation),
+      d_squelch_db(modes.size(), squelch_db),
+      d_squelch_power(modes.size(), float(pow(10.0, squelch_db / 10))),
+      d_open(modes.size(), true), d_am_mean(modes.size(), 0.0f) {
+  if (modes.empty())
+    throw std::invalid_argument("demod_bank_cf: modes must be non-empty");
+  if (fs <= 0 || fm_deviation <= 0)
+    throw std::invalid_argument(
+        "demod_bank_cf: fs and fm_deviation must be positive");
+  for (size_t ch = 0; ch < modes.size(); ch++)
+    d_modes.push_back(parse_mode(modes[ch]));
+  set_fm_deviation(fm_deviation);
+  std::vector<float> h = gr::filter::firdes::hilbert(
+      HILBERT_TAPS, gr::filter::firdes::WIN_BLACKMAN_HARRIS);
+  d_hilbert.assign(h.rbegin(), h.rend());
+  set_history(HILBERT_TAPS);
+  message_port_register_in(pmt::mp("mode"));
+  set_msg_handler(pmt::mp("mode"),
+                  boost::bind(&demod_bank_cf_impl::rxModeMsg, this, _1));
+}
+
+demod_bank_cf_impl::~demod_bank_cf_impl() {}
+
+void demod_bank_cf_impl::check_channel(int channel) const {
+  if (channel < 0 || channel >= d_num_channels)
+    throw std::out_of_range("demod_bank_cf: no such channel");
+}
+
+void demod_bank_cf_impl::set_mode(int channel, const std::string &mode) {
+  check_channel(channel);
+  demod_mode_t m = parse_mode(mode);
+  gr::thread::scoped_lock lock(d_mutex);
+  if (m != d_modes[channel])
+    d_am_mean[channel] = 0.0f;
+  d_modes[channel] = m;
+}
+
+std::string demod_bank_cf_impl::mode(int channel) const {
+  check_channel(channel);
+  gr::thread::scoped_lock lock(d_mutex);
+  return mode_name(d_modes[channel]);
+}
+
+void demod_bank_cf_impl::set_squelch(int channel, double squelch_db) {
+  check_channel(channel);
+  gr::thread::scoped_lock lock(d_mutex);
+  d_squelch_db[channel] = squelch_db;
+  d_squelch_power[channel] = float(pow(10.0, squelch_db / 10));
+}
+
+double demod_bank_cf_impl::squelch(int channel) const {
+  check_channel(channel);
+  gr::thread::scoped_lock lock(d_mutex);
+  return d_squelch_db[channel];
+}
+
+bool demod_bank_cf_impl::squelch_open(int channel) const {
+  check_channel(channel);
+  gr::thread::scoped_lock lock(d_mutex);
+  return d_open[channel];
+}
+
+void demod_bank_cf_impl::set_fs(double fs) {
+  if (fs <= 0)
+    throw std::invalid_argument("demod_bank_cf: fs must be positive");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_fs = fs;
+  d_fm_gain = float(fs / (2 * M_PI * d_fm_deviation));
+}
+
+void demod_bank_cf_impl::set_fm_deviation(double deviation) {
+  if (deviation <= 0)
+    throw std::invalid_argument(
+        "demod_bank_cf: fm_deviation must be positive");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_fm_deviation = deviation;
+  d_fm_gain = float(d_fs / (2 * M_PI * deviation));
+}
+
+void demod_bank_cf_impl::rxModeMsg(pmt::pmt_t msg) {
+  pmt::pmt_t channel = pmt::PMT_NIL, mode = pmt::PMT_NIL;
+  pmt::pmt_t level = pmt::PMT_NIL;
+  if (pmt::is_dict(msg)) {
+    channel = pmt::dict_ref(msg, pmt::mp("channel"), pmt::PMT_NIL);
+    mode = pmt::dict_ref(msg, pmt::mp("mode"), pmt::PMT_NIL);
+    level = pmt::dict_ref(msg, pmt::mp("squelch"), pmt::PMT_NIL);
+  } else if (pmt::is_pair(msg)) {
+    channel = pmt::car(msg);
+    mode = pmt::cdr(msg);
+  }
+  if (!pmt::is_integer(channel) ||
+      !(pmt::is_symbol(mode) || pmt::is_number(level))) {
+    GR_LOG_WARN(d_logger, "mode: expected (channel . mode) or "
+                          "{\"channel\": n, \"mode\": mode, \"squelch\": dB}");
+    return;
+  }
+  try {
+    int ch = int(pmt::to_long(channel));
+    if (pmt::is_symbol(mode))
+      set_mode(ch, pmt::symbol_to_string(mode));
+    if (pmt::is_number(level))
+      set_squelch(ch, pmt::to_double(level));
+  } catch (std::exception &e) {
+    GR_LOG_WARN(d_logger, std::string("mode: ") + e.what());
+  }
+}
+
+/*
+ * Envelope divided by its running mean, less one.  The mean moves once per
+ * call by what n per-sample updates would do to a steady level.
+ */
+void demod_bank_cf_impl::demod_am(float *out, const gr_complex *x, int ch,
+                                  int n) {
+  volk_32fc_magnitude_32f(out, x, n);
+  float sum;
+  volk_32f_accumulator_s32f(&sum, out, n);
+  float mean = sum / n;
+  float &level = d_am_mean[ch];
+  if (level <= 0.0f)
+    level = mean;
+  else
+    level += float(1.0 - pow(1.0 - AM_ALPHA, n)) * (mean - level);
+  if (level <= 0.0f) {
+    memset(out, 0, sizeof(float) * n);
+    return;
+  }
+  const float g = 1.0f / level;
+  for (int i = 0; i < n; i++)
+    out[i] = out[i] * g - 1.0f;
+}
+
+// arg(x[i] * conj(x[i-1])), scaled; x[-1] is in the history
+void demod_bank_cf_impl::demod_fm(float *out, const gr_complex *x, int n) {
+  volk_32fc_x2_multiply_conjugate_32fc(&d_prod[0], x, x - 1, n);
+  volk_32fc_s32f_atan2_32f(out, &d_prod[0], 1.0f / d_fm_gain, n);
+}
+
+/*
+ * Phasing method: the positive frequencies of x are (x + j*H{x})/2, whose
+ * real part is (I - H{Q})/2; the negative ones give (I + H{Q})/2.  \p in
+ * starts HILBERT_TAPS-1 samples before the first output's.
+ */
+void demod_bank_cf_impl::demod_ssb(float *out, const gr_complex *in,
+                                   bool upper, int n) {
+  const int len = n + HILBERT_TAPS - 1;
+  volk_32fc_deinterleave_32f_x2(&d_i[0], &d_q[0], in, len);
+  const float *I = &d_i[DELAY];
+  const float sign = upper ? -0.5f : 0.5f;
+  for (int k = 0; k < n; k++) {
+    float hq;
+    volk_32f_x2_dot_prod_32f(&hq, &d_q[k], &d_hilbert[0], HILBERT_TAPS);
+    out[k] = 0.5f * I[k] + sign * hq;
+  }
+}
+
+int demod_bank_cf_impl::work(int noutput_items,
+                             gr_vector_const_void_star &input_items,
+                             gr_vector_void_star &output_items) {
+  gr::thread::scoped_lock lock(d_mutex);
+  const int n = noutput_items;
+  const size_t len = n + HILBERT_TAPS - 1;
+  if (d_i.size() < len) {
+    d_prod.resize(len);
+    d_i.resize(len);
+    d_q.resize(len);
+  }
+  for (int ch = 0; ch < d_num_channels; ch++) {
+    const gr_complex *in = (const gr_complex *)input_items[ch];
+    const gr_complex *x = in + DELAY; // the samples this call demodulates
+    float *out = (float *)output_items[ch];
+    float power = 0.0f;
+    if (d_modes[ch] != MODE_OFF)
+      volk_32f_x2_dot_prod_32f(&power, (const float *)x, (const float *)x,
+                               2 * n);
+    d_open[ch] = d_modes[ch] != MODE_OFF && power >= d_squelch_power[ch] * n;
+    if (!d_open[ch]) {
+      memset(out, 0, sizeof(float) * n);
+      continue;
+    }
+    switch (d_modes[ch]) {
+    case MODE_AM:
+      demod_am(out, x, ch, n);
+      break;
+    case MODE_FM:
+      demod_fm(out, x, n);
+      break;
+    case MODE_USB:
+    case MODE_LSB:
+      demod_ssb(out, in, d_modes[ch] == MODE_USB, n);
+      break;
+    default:
+      break;
+    }
+  }
+  return noutput_items;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
@@ -0,0 +1,84 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_DEMOD_BANK_CF_IMPL_H
+#define INCLUDED_CYBERRADIO_DEMOD_BANK_CF_IMPL_H
+
+#include <CyberRadio/demod_bank_cf.h>
+#include <gnuradio/thread/thread.h>
+
+namespace gr {
+namespace CyberRadio {
+
+class demod_bank_cf_impl : public demod_bank_cf {
+public:
+  enum demod_mode_t { MODE_OFF, MODE_AM, MODE_FM, MODE_USB, MODE_LSB };
+  static demod_mode_t parse_mode(const std::string &name);
+  static std::string mode_name(demod_mode_t mode);
+
+private:
+  // Hilbert filter length; its centre sets every mode's delay
+  enum { HILBERT_TAPS = 63, DELAY = (HILBERT_TAPS - 1) / 2 };
+
+  int d_num_channels;
+  double d_fs;
+  double d_fm_deviation;
+  float d_fm_gain;                    // 1/radians per sample at deviation
+  std::vector<demod_mode_t> d_modes;
+  std::vector<double> d_squelch_db;
+  std::vector<float> d_squelch_power; // linear thresholds
+  std::vector<bool> d_open;
+  std::vector<float> d_am_mean;       // running mean envelope, 0 = unset
+  std::vector<float> d_hilbert;       // time-reversed
+  // Scratch, grown to the largest work call
+  std::vector<gr_complex> d_prod;
+  std::vector<float> d_i;
+  std::vector<float> d_q;
+  mutable gr::thread::mutex d_mutex;
+
+  void check_channel(int channel) const;
+  void rxModeMsg(pmt::pmt_t msg);
+  void demod_am(float *out, const gr_complex *x, int ch, int n);
+  void demod_fm(float *out, const gr_complex *x, int n);
+  void demod_ssb(float *out, const gr_complex *in, bool upper, int n);
+
+public:
+  demod_bank_cf_impl(const std::vector<std::string> &modes, double fs,
+                     double squelch_db, double fm_deviation);
+  ~demod_bank_cf_impl();
+
+  void set_mode(int channel, const std::string &mode);
+  std::string mode(int channel) const;
+  void set_squelch(int channel, double squelch_db);
+  double squelch(int channel) const;
+  bool squelch_open(int channel) const;
+  void set_fs(double fs);
+  double fs() const { return d_fs; }
+  void set_fm_deviation(double deviation);
+  double fm_deviation() const { return d_fm_deviation; }
+
+  int work(int noutput_items, gr_vector_const_void_star &input_items,
+           gr_vector_void_star &output_items);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_DEMOD_BANK_CF_IMPL_H */
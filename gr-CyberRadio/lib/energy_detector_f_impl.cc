@@ -0,0 +1,230 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "energy_detector_f_impl.h"
+#include "trace_kernels.h"
+#include <algorithm>
+#include <cmath>
+#include <cstring>
+#include <gnuradio/io_signature.h>
+#include <stdexcept>
+#include <volk/volk.h>
+
+namespace gr {
+namespace CyberRadio {
+
+energy_detector_f::sptr energy_detector_f::make(int vlen, double fs,
+                                                double center_freq,
+                                                double threshold_db,
+                                                double percentile,
+                                                double step_db, int min_bins,
+                                                int max_gap) {
+  return gnuradio::get_initial_sptr(
+      new energy_detector_f_impl(vlen, fs, center_freq, threshold_db,
+                                 percentile, step_db, min_bins, max_gap));
+}
+
+/*
+ * The private constructor
+ */
+energy_detector_f_impl::energy_detector_f_impl(int vlen, double fs,
+                                               double center_freq,
+                                               double threshold_db,
+                                               double percentile,
+                                               double step_db, int min_bins,
+                                               int max_gap)
+    : gr::sync_block("energy_detector_f",
+                     io_signature::make(1, 1, sizeof(float) * vlen),
+                     io_signature::make(0, 0, 0)),
+      d_vlen(vlen), d_fs(fs), d_center_freq(center_freq),
+      d_threshold_db(float(threshold_db)), d_percentile(0.5),
+      d_step_db(0.0), d_min_bins(1), d_max_gap(0), d_primed(false),
+      d_timestamp(pmt::PMT_NIL) {
+  if (vlen < 1)
+    throw std::invalid_argument("energy_detector_f: vlen must be positive");
+  if (fs <= 0)
+    throw std::invalid_argument("energy_detector_f: fs must be positive");
+  d_floor = (float *)volk_malloc(sizeof(float) * vlen, volk_get_alignment());
+  memset(d_floor, 0, sizeof(float) * vlen);
+  set_percentile(percentile);
+  set_step_db(step_db);
+  set_min_bins(min_bins);
+  set_max_gap(max_gap);
+  message_port_register_out(pmt::mp("detections"));
+}
+
+energy_detector_f_impl::~energy_detector_f_impl() { volk_free(d_floor); }
+
+// Lock held
+void energy_detector_f_impl::update_steps() {
+  d_step_up = float(d_step_db * d_percentile);
+  d_step_down = float(d_step_db * (1.0 - d_percentile));
+}
+
+void energy_detector_f_impl::set_threshold_db(double threshold_db) {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_threshold_db = float(threshold_db);
+}
+
+void energy_detector_f_impl::set_percentile(double percentile) {
+  if (percentile <= 0 || percentile >= 1)
+    throw std::out_of_range("energy_detector_f: percentile must be in (0, 1)");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_percentile = percentile;
+  update_steps();
+}
+
+void energy_detector_f_impl::set_step_db(double step_db) {
+  if (step_db <= 0)
+    throw std::out_of_range("energy_detector_f: step_db must be positive");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_step_db = step_db;
+  update_steps();
+}
+
+void energy_detector_f_impl::set_fs(double fs) {
+  if (fs <= 0)
+    throw std::invalid_argument("energy_detector_f: fs must be positive");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_fs = fs;
+}
+
+void energy_detector_f_impl::set_center_freq(double freq) {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_center_freq = freq;
+}
+
+void energy_detector_f_impl::set_min_bins(int min_bins) {
+  if (min_bins < 1)
+    throw std::out_of_range("energy_detector_f: min_bins must be positive");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_min_bins = min_bins;
+}
+
+void energy_detector_f_impl::set_max_gap(int max_gap) {
+  if (max_gap < 0)
+    throw std::out_of_range("energy_detector_f: max_gap must be >= 0");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_max_gap = max_gap;
+}
+
+std::vector<float> energy_detector_f_impl::noise_floor() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return std::vector<float>(d_floor, d_floor + d_vlen);
+}
+
+void energy_detector_f_impl::reset() {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_primed = false;
+}
+
+// Lock held
+void energy_detector_f_impl::publish(const float *x, int start, int stop,
+                                     uint64_t frame) {
+  int peak_bin = start;
+  for (int k = start + 1; k <= stop; k++)
+    if (x[k] > x[peak_bin])
+      peak_bin = k;
+  const float peak = x[peak_bin];
+  // Weights relative to the peak, so the powers can't overflow
+  double sum = 0, moment = 0;
+  for (int k = start; k <= stop; k++) {
+    double w = pow(10.0, (x[k] - peak) / 10.0);
+    sum += w;
+    moment += w * k;
+  }
+  const double bin_width = d_fs / d_vlen;
+  const double centroid = moment / sum;
+  pmt::pmt_t msg = pmt::make_dict();
+  msg = pmt::dict_add(
+      msg, pmt::mp("center_freq"),
+      pmt::from_double(d_center_freq + (centroid - d_vlen / 2) * bin_width));
+  msg = pmt::dict_add(msg, pmt::mp("bandwidth"),
+                      pmt::from_double((stop - start + 1) * bin_width));
+  msg = pmt::dict_add(msg, pmt::mp("snr"),
+                      pmt::from_float(peak - d_floor[peak_bin]));
+  msg = pmt::dict_add(msg, pmt::mp("peak"), pmt::from_float(peak));
+  msg = pmt::dict_add(msg, pmt::mp("bins"),
+                      pmt::cons(pmt::from_long(start), pmt::from_long(stop)));
+  msg = pmt::dict_add(msg, pmt::mp("frame"), pmt::from_uint64(frame));
+  if (!pmt::is_null(d_timestamp))
+    msg = pmt::dict_add(msg, pmt::mp("timestamp"), d_timestamp);
+  message_port_pub(pmt::mp("detections"), msg);
+}
+
+/*
+ * Runs of bins above floor + threshold, merged across gaps of up to
+ * max_gap bins.  Lock held.
+ */
+void energy_detector_f_impl::detect(const float *x, uint64_t frame) {
+  int start = -1, last = -1;
+  for (int k = 0; k < d_vlen; k++) {
+    if (x[k] <= d_floor[k] + d_threshold_db)
+      continue;
+    if (start >= 0 && k - last - 1 > d_max_gap) {
+      if (last - start + 1 >= d_min_bins)
+        publish(x, start, last, frame);
+      start = -1;
+    }
+    if (start < 0)
+      start = k;
+    last = k;
+  }
+  if (start >= 0 && last - start + 1 >= d_min_bins)
+    publish(x, start, last, frame);
+}
+
+int energy_detector_f_impl::work(int noutput_items,
+                                 gr_vector_const_void_star &input_items,
+                                 gr_vector_void_star &output_items) {
+  gr::thread::scoped_lock lock(d_mutex);
+  const float *in = (const float *)input_items[0];
+  const uint64_t start = nitems_read(0);
+
+  std::vector<gr::tag_t> tags, rx_time;
+  get_tags_in_range(tags, 0, start, start + noutput_items,
+                    pmt::mp("timestamp"));
+  get_tags_in_range(rx_time, 0, start, start + noutput_items,
+                    pmt::mp("rx_time"));
+  tags.insert(tags.end(), rx_time.begin(), rx_time.end());
+  std::sort(tags.begin(), tags.end(), gr::tag_t::offset_compare);
+  size_t t = 0;
+
+  for (int i = 0; i < noutput_items; i++) {
+    const float *x = in + size_t(i) * d_vlen;
+    for (; t < tags.size() && tags[t].offset <= start + i; t++)
+      d_timestamp = tags[t].value;
+    if (!d_primed) {
+      memcpy(d_floor, x, sizeof(float) * d_vlen);
+      d_primed = true;
+      continue;
+    }
+    detect(x, start + i);
+    trace_quantile_track(d_floor, x, d_step_up, d_step_down, d_vlen);
+  }
+  return noutput_items;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
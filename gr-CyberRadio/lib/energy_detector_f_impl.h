@@ -0,0 +1,81 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_ENERGY_DETECTOR_F_IMPL_H
+#define INCLUDED_CYBERRADIO_ENERGY_DETECTOR_F_IMPL_H
+
+#include <CyberRadio/energy_detector_f.h>
+#include <gnuradio/thread/thread.h>
+
+namespace gr {
+namespace CyberRadio {
+
+class energy_detector_f_impl : public energy_detector_f {
+private:
+  int d_vlen;
+  double d_fs;
+  double d_center_freq;
+  float d_threshold_db;
+  double d_percentile;
+  double d_step_db;
+  float d_step_up;     // step_db * percentile
+  float d_step_down;   // step_db * (1 - percentile)
+  int d_min_bins;
+  int d_max_gap;
+  float *d_floor;
+  bool d_primed;
+  pmt::pmt_t d_timestamp;
+  mutable gr::thread::mutex d_mutex;
+
+  void update_steps();
+  void detect(const float *x, uint64_t frame);
+  void publish(const float *x, int start, int stop, uint64_t frame);
+
+public:
+  energy_detector_f_impl(int vlen, double fs, double center_freq,
+                         double threshold_db, double percentile,
+                         double step_db, int min_bins, int max_gap);
+  ~energy_detector_f_impl();
+
+  void set_threshold_db(double threshold_db);
+  double threshold_db() const { return d_threshold_db; }
+  void set_percentile(double percentile);
+  double percentile() const { return d_percentile; }
+  void set_step_db(double step_db);
+  double step_db() const { return d_step_db; }
+  void set_fs(double fs);
+  double fs() const { return d_fs; }
+  void set_center_freq(double freq);
+  double center_freq() const { return d_center_freq; }
+  void set_min_bins(int min_bins);
+  int min_bins() const { return d_min_bins; }
+  void set_max_gap(int max_gap);
+  int max_gap() const { return d_max_gap; }
+  std::vector<float> noise_floor() const;
+  void reset();
+
+  int work(int noutput_items, gr_vector_const_void_star &input_items,
+           gr_vector_void_star &output_items);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_ENERGY_DETECTOR_F_IMPL_H */
@@ -0,0 +1,102 @@
+/* -*- c++ -*- */
+/***************************************************************************
+ * \file fft_batch.h
+ *
+ * \brief Several same-size complex FFTs behind one FFTW plan.
+ *
+ * \copyright Copyright (c) 2026 CyberRadio Solutions, Inc.
+ *
+ */
+
+#ifndef INCLUDED_CYBERRADIO_FFT_BATCH_H
+#define INCLUDED_CYBERRADIO_FFT_BATCH_H
+
+#include "spectral_cache.h"
+#include <gnuradio/gr_complex.h>
+#include <stdexcept>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief A batch of \p howmany complex FFTs of length \p size.
+ *
+ * The transforms live back to back in one aligned input buffer and one
+ * output buffer (transform \c k starts at element \c k*size), and a single
+ * fftwf_plan_many_dft() plan runs them all.  Twiddle factors are shared, and
+ * with nthreads > 1 FFTW spreads the batch over a thread pool, so this scales
+ * better than one gr::fft::fft_complex per channel.
+ *
+ * The plan comes from cached_fft_plan(), so batches of the same shape share
+ * one plan and FFTW wisdom carries planning over between runs.
+ */
+class fft_batch {
+public:
+  fft_batch(int size, int howmany, bool forward = true, int nthreads = 1)
+      : d_size(size), d_howmany(howmany), d_forward(forward),
+        d_nthreads(nthreads < 1 ? 1 : nthreads) {
+    if (size < 1 || howmany < 1)
+      throw std::invalid_argument("fft_batch: size and howmany must be >= 1");
+    size_t n = size_t(size) * howmany;
+    d_in = (gr_complex *)fftwf_malloc(sizeof(gr_complex) * n);
+    d_out = (gr_complex *)fftwf_malloc(sizeof(gr_complex) * n);
+    if (!d_in || !d_out)
+      throw std::bad_alloc();
+    for (size_t k = 0; k < n; k++)
+      d_in[k] = d_out[k] = 0;
+    plan();
+  }
+
+  ~fft_batch() {
+    d_plan.reset();
+    fftwf_free(d_in);
+    fftwf_free(d_out);
+  }
+
+  int size() const { return d_size; }
+  int howmany() const { return d_howmany; }
+  int nthreads() const { return d_nthreads; }
+
+  //! Input of transform \p k
+  gr_complex *get_inbuf(int k = 0) const { return d_in + size_t(k) * d_size; }
+  //! Output of transform \p k
+  gr_complex *get_outbuf(int k = 0) const {
+    return d_out + size_t(k) * d_size;
+  }
+
+  //! Replan with a different thread count
+  void set_nthreads(int nthreads) {
+    nthreads = nthreads < 1 ? 1 : nthreads;
+    if (nthreads != d_nthreads) {
+      d_nthreads = nthreads;
+      plan();
+    }
+  }
+
+  void execute() {
+    fftwf_execute_dft(d_plan.get(), reinterpret_cast<fftwf_complex *>(d_in),
+                      reinterpret_cast<fftwf_complex *>(d_out));
+  }
+
+private:
+  void plan() {
+    d_plan = cached_fft_plan(d_size, d_howmany, d_forward, d_nthreads);
+  }
+
+  int d_size;
+  int d_howmany;
+  bool d_forward;
+  int d_nthreads;
+  gr_complex *d_in;
+  gr_complex *d_out;
+  boost::shared_ptr<fftwf_plan_s> d_plan;
+
+  // not copyable
+  fft_batch(const fft_batch &);
+  fft_batch &operator=(const fft_batch &);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_FFT_BATCH_H */
@@ -0,0 +1,50 @@
+/* -*- c++ -*- */
+/***************************************************************************
+ * \file fold_kernels.h
+ *
+ * \brief Multiply-accumulate of a data segment into a fold buffer.
+ *
+ * \copyright Copyright (c) 2026 CyberRadio Solutions, Inc.
+ *
+ */
+
+#ifndef INCLUDED_CYBERRADIO_FOLD_KERNELS_H
+#define INCLUDED_CYBERRADIO_FOLD_KERNELS_H
+
+#include <cstddef>
+#include <cstring>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief acc[k] += x[k] * c[k] for k in [0, n).
+ *
+ * The inner loop of weighted overlap-add and polyphase filterbanks: each
+ * block of input is weighted by its slice of the window or prototype filter
+ * and summed into one FFT-sized buffer.  Complex data with real weights is
+ * handled as interleaved floats against weights stored twice over (I and Q),
+ * so one kernel serves both.
+ */
+inline void fold_accumulate(float *acc, const float *x, const float *c,
+                            size_t n) {
+  size_t k = 0;
+#if defined(__GNUC__)
+  typedef float v8sf __attribute__((vector_size(32)));
+  for (; k + 8 <= n; k += 8) {
+    v8sf va, vx, vc;
+    memcpy(&va, acc + k, sizeof(va));
+    memcpy(&vx, x + k, sizeof(vx));
+    memcpy(&vc, c + k, sizeof(vc));
+    va += vx * vc;
+    memcpy(acc + k, &va, sizeof(va));
+  }
+#endif
+  for (; k < n; k++)
+    acc[k] += x[k] * c[k];
+}
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_FOLD_KERNELS_H */
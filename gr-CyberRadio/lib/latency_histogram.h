@@ -0,0 +1,104 @@
+/* -*- c++ -*- */
+/***************************************************************************
+ * \file latency_histogram.h
+ *
+ * \brief Fixed-size log/linear histogram for per-packet latency statistics.
+ *
+ * \copyright Copyright (c) 2026 CyberRadio Solutions, Inc.
+ *
+ */
+
+#ifndef INCLUDED_CYBERRADIO_LATENCY_HISTOGRAM_H
+#define INCLUDED_CYBERRADIO_LATENCY_HISTOGRAM_H
+
+#include <algorithm>
+#include <array>
+#include <cstdint>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Latency histogram with constant memory and constant-time insert.
+ *
+ * Values (nanoseconds) are binned by octave, and each octave is split into
+ * 2^sub_bucket_bits linear sub-buckets, so a percentile is reported with a
+ * relative error of at most 1/2^sub_bucket_bits.  The maximum is tracked
+ * exactly.
+ */
+class latency_histogram {
+public:
+  static constexpr int sub_bucket_bits = 3;
+  static constexpr int sub_buckets = 1 << sub_bucket_bits;
+  static constexpr int octaves = 64 - sub_bucket_bits;
+
+  latency_histogram() { reset(); }
+
+  //! Clear all counts
+  void reset() {
+    d_counts.fill(0);
+    d_count = 0;
+    d_max = 0;
+  }
+
+  //! Add one value, in nanoseconds
+  void add(uint64_t ns) {
+    d_counts[bucket_index(ns)]++;
+    d_count++;
+    d_max = std::max(d_max, ns);
+  }
+
+  //! Number of values added since the last reset
+  uint64_t count() const { return d_count; }
+
+  //! Largest value added since the last reset, in nanoseconds
+  uint64_t max() const { return d_max; }
+
+  /*!
+   * \brief Value at percentile \p p (0 to 100), in nanoseconds.
+   *
+   * Reports the upper edge of the bucket holding the requested rank,
+   * clamped to the exact maximum.
+   */
+  double percentile(double p) const {
+    if (d_count == 0)
+      return 0.0;
+    p = std::min(std::max(p, 0.0), 100.0);
+    uint64_t rank = (uint64_t)(p / 100.0 * (double)(d_count - 1)) + 1;
+    uint64_t seen = 0;
+    for (size_t i = 0; i < d_counts.size(); i++) {
+      seen += d_counts[i];
+      if (seen >= rank)
+        return (double)std::min(bucket_upper_edge(i), d_max);
+    }
+    return (double)d_max;
+  }
+
+private:
+  static size_t bucket_index(uint64_t ns) {
+    if (ns < (uint64_t)sub_buckets)
+      return (size_t)ns;
+    int msb = 63 - __builtin_clzll(ns);
+    int shift = msb - sub_bucket_bits;
+    uint64_t sub = (ns >> shift) & (sub_buckets - 1);
+    return (size_t)((shift + 1) * sub_buckets + sub);
+  }
+
+  static uint64_t bucket_upper_edge(size_t index) {
+    if (index < (size_t)sub_buckets)
+      return index;
+    int shift = (int)(index / sub_buckets) - 1;
+    uint64_t sub = index % sub_buckets;
+    uint64_t base = ((uint64_t)sub_buckets + sub) << shift;
+    return base + (((uint64_t)1 << shift) - 1);
+  }
+
+  std::array<uint64_t, (octaves + 1) * sub_buckets> d_counts;
+  uint64_t d_count;
+  uint64_t d_max;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_LATENCY_HISTOGRAM_H */
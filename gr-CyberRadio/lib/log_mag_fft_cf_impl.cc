@@ -0,0 +1,228 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "log_mag_fft_cf_impl.h"
+#include "single_pole_iir_kernels.h"
+#include <cmath>
+#include <cstring>
+#include <gnuradio/io_signature.h>
+#include <stdexcept>
+#include <volk/volk.h>
+
+namespace gr {
+namespace CyberRadio {
+
+log_mag_fft_cf::sptr log_mag_fft_cf::make(int num_inputs, int fft_size,
+                                          const std::vector<float> &window,
+                                          double iir_alpha,
+                                          const std::string &secondary_output,
+                                          bool reset_on_alpha_change,
+                                          bool mag_squared, int nthreads) {
+  return gnuradio::get_initial_sptr(new log_mag_fft_cf_impl(
+      num_inputs, fft_size, window, iir_alpha, secondary_output,
+      reset_on_alpha_change, mag_squared, nthreads));
+}
+
+log_mag_fft_cf_impl::secondary_t
+log_mag_fft_cf_impl::parse_secondary(const std::string &name) {
+  if (name == "fft")
+    return SECONDARY_FFT;
+  if (name == "mag_filtered")
+    return SECONDARY_MAG_FILTERED;
+  if (name == "mag_unfiltered")
+    return SECONDARY_MAG_UNFILTERED;
+  if (name == "log_mag_unfiltered")
+    return SECONDARY_LOG_MAG_UNFILTERED;
+  return SECONDARY_NONE;
+}
+
+static std::vector<int> output_sizes(int num_inputs, int fft_size,
+                                     const std::string &secondary_output) {
+  std::vector<int> sizes(num_inputs, sizeof(float) * fft_size);
+  switch (log_mag_fft_cf_impl::parse_secondary(secondary_output)) {
+  case log_mag_fft_cf_impl::SECONDARY_NONE:
+    break;
+  case log_mag_fft_cf_impl::SECONDARY_FFT:
+    sizes.resize(2 * num_inputs, sizeof(gr_complex) * fft_size);
+    break;
+  default:
+    sizes.resize(2 * num_inputs, sizeof(float) * fft_size);
+    break;
+  }
+  return sizes;
+}
+
+/*
+ * The private constructor
+ */
+log_mag_fft_cf_impl::log_mag_fft_cf_impl(int num_inputs, int fft_size,
+                                         const std::vector<float> &window,
+                                         double iir_alpha,
+                                         const std::string &secondary_output,
+                                         bool reset_on_alpha_change,
+                                         bool mag_squared, int nthreads)
+    : gr::sync_block(
+          "log_mag_fft_cf",
+          io_signature::make(num_inputs, num_inputs,
+                             sizeof(gr_complex) * fft_size),
+          io_signature::makev(
+              num_inputs, 2 * num_inputs,
+              output_sizes(num_inputs, fft_size, secondary_output))),
+      d_num_inputs(num_inputs), d_fft_size(fft_size),
+      d_secondary(parse_secondary(secondary_output)),
+      d_reset_on_alpha_change(reset_on_alpha_change),
+      d_mag_squared(mag_squared), d_alpha(1.0f),
+      d_log_scale((mag_squared ? 10.0f : 20.0f) / log2f(10.0f)),
+      d_avg(num_inputs), d_primed(num_inputs, false) {
+  if (num_inputs < 1 || fft_size < 1)
+    throw std::invalid_argument(
+        "log_mag_fft_cf: num_inputs and fft_size must be positive");
+  d_fft = new fft_batch(fft_size, num_inputs, true, nthreads);
+  size_t align = volk_get_alignment();
+  d_window = (float *)volk_malloc(sizeof(float) * fft_size, align);
+  d_mag = (float *)volk_malloc(sizeof(float) * fft_size, align);
+  for (int ch = 0; ch < num_inputs; ch++) {
+    d_avg[ch] = (float *)volk_malloc(sizeof(float) * fft_size, align);
+    memset(d_avg[ch], 0, sizeof(float) * fft_size);
+  }
+  set_window(window);
+  set_iir_alpha(iir_alpha);
+  message_port_register_in(pmt::mp("reset"));
+  set_msg_handler(pmt::mp("reset"),
+                  boost::bind(&log_mag_fft_cf_impl::rxResetMsg, this, _1));
+}
+
+log_mag_fft_cf_impl::~log_mag_fft_cf_impl() {
+  delete d_fft;
+  volk_free(d_window);
+  volk_free(d_mag);
+  for (size_t ch = 0; ch < d_avg.size(); ch++)
+    volk_free(d_avg[ch]);
+}
+
+void log_mag_fft_cf_impl::set_iir_alpha(double alpha) {
+  if (alpha < 0 || alpha > 1)
+    throw std::out_of_range("Alpha must be in [0, 1]\n");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_alpha = float(alpha);
+  if (d_reset_on_alpha_change)
+    d_primed.assign(d_num_inputs, false);
+}
+
+void log_mag_fft_cf_impl::set_window(const std::vector<float> &window) {
+  gr::thread::scoped_lock lock(d_mutex);
+  if (window.empty()) {
+    for (int k = 0; k < d_fft_size; k++)
+      d_window[k] = 1.0f / d_fft_size;
+  } else if (int(window.size()) == d_fft_size) {
+    double sum = 0;
+    for (int k = 0; k < d_fft_size; k++)
+      sum += window[k];
+    float scale = (sum != 0) ? float(1.0 / sum) : 1.0f;
+    for (int k = 0; k < d_fft_size; k++)
+      d_window[k] = window[k] * scale;
+  } else {
+    throw std::invalid_argument(
+        "log_mag_fft_cf: window length must equal fft_size");
+  }
+}
+
+void log_mag_fft_cf_impl::reset() {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_primed.assign(d_num_inputs, false);
+}
+
+void log_mag_fft_cf_impl::set_nthreads(int n) {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_fft->set_nthreads(n);
+}
+
+void log_mag_fft_cf_impl::rxResetMsg(pmt::pmt_t msg) { reset(); }
+
+int log_mag_fft_cf_impl::work(int noutput_items,
+                              gr_vector_const_void_star &input_items,
+                              gr_vector_void_star &output_items) {
+  gr::thread::scoped_lock lock(d_mutex);
+  const int N = d_fft_size;
+  // fft_vcc's shift: the upper floor(N/2) bins move to the front
+  const int half = N / 2;
+  const int upper = N - half;
+  const bool have_secondary = (d_secondary != SECONDARY_NONE) &&
+                              (int(output_items.size()) == 2 * d_num_inputs);
+  const float alpha = d_alpha;
+
+  for (int i = 0; i < noutput_items; i++) {
+    // Window every input into the batch, then transform them together
+    for (int ch = 0; ch < d_num_inputs; ch++) {
+      const gr_complex *in = (const gr_complex *)input_items[ch] + i * N;
+      volk_32fc_32f_multiply_32fc(d_fft->get_inbuf(ch), in, d_window, N);
+    }
+    d_fft->execute();
+
+    for (int ch = 0; ch < d_num_inputs; ch++) {
+      const gr_complex *fft_out = d_fft->get_outbuf(ch);
+      float *out = (float *)output_items[ch] + i * N;
+      void *sec = have_secondary ? output_items[d_num_inputs + ch] : NULL;
+      float *avg = d_avg[ch];
+
+      if (sec && d_secondary == SECONDARY_FFT) {
+        gr_complex *o = (gr_complex *)sec + i * N;
+        memcpy(o, fft_out + half, sizeof(gr_complex) * upper);
+        memcpy(o + upper, fft_out, sizeof(gr_complex) * half);
+      }
+      // Magnitude, shifted on the way out of the FFT buffer
+      float *mag = (sec && d_secondary == SECONDARY_MAG_UNFILTERED)
+                       ? (float *)sec + i * N
+                       : d_mag;
+      if (d_mag_squared) {
+        volk_32fc_magnitude_squared_32f(mag, fft_out + half, upper);
+        volk_32fc_magnitude_squared_32f(mag + upper, fft_out, half);
+      } else {
+        volk_32fc_magnitude_32f(mag, fft_out + half, upper);
+        volk_32fc_magnitude_32f(mag + upper, fft_out, half);
+      }
+      if (sec && d_secondary == SECONDARY_LOG_MAG_UNFILTERED) {
+        float *o = (float *)sec + i * N;
+        volk_32f_log2_32f(o, mag, N);
+        volk_32f_s32f_multiply_32f(o, o, d_log_scale, N);
+      }
+      // Single-pole average, seeded with the first spectrum after a reset
+      if (!d_primed[ch]) {
+        memcpy(avg, mag, sizeof(float) * N);
+        d_primed[ch] = true;
+      } else {
+        single_pole_iir_update(avg, NULL, mag, alpha, N);
+      }
+      if (sec && d_secondary == SECONDARY_MAG_FILTERED)
+        memcpy((float *)sec + i * N, avg, sizeof(float) * N);
+
+      volk_32f_log2_32f(out, avg, N);
+      volk_32f_s32f_multiply_32f(out, out, d_log_scale, N);
+    }
+  }
+  return noutput_items;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
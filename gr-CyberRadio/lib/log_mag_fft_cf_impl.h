@@ -0,0 +1,81 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_LOG_MAG_FFT_CF_IMPL_H
+#define INCLUDED_CYBERRADIO_LOG_MAG_FFT_CF_IMPL_H
+
+#include <CyberRadio/log_mag_fft_cf.h>
+#include "fft_batch.h"
+#include <gnuradio/thread/thread.h>
+
+namespace gr {
+namespace CyberRadio {
+
+class log_mag_fft_cf_impl : public log_mag_fft_cf {
+public:
+  enum secondary_t {
+    SECONDARY_NONE,
+    SECONDARY_FFT,
+    SECONDARY_MAG_FILTERED,
+    SECONDARY_MAG_UNFILTERED,
+    SECONDARY_LOG_MAG_UNFILTERED
+  };
+  static secondary_t parse_secondary(const std::string &name);
+
+private:
+  int d_num_inputs;
+  int d_fft_size;
+  secondary_t d_secondary;
+  bool d_reset_on_alpha_change;
+  bool d_mag_squared;
+  float d_alpha;
+  float d_log_scale; // n / log2(10), applied to log2()
+  fft_batch *d_fft;            // one transform per input
+  float *d_window;
+  float *d_mag;                // one spectrum of scratch
+  std::vector<float *> d_avg;  // averaging state per input
+  std::vector<bool> d_primed;  // false until the first spectrum after reset
+  gr::thread::mutex d_mutex;
+
+  void rxResetMsg(pmt::pmt_t msg);
+
+public:
+  log_mag_fft_cf_impl(int num_inputs, int fft_size,
+                      const std::vector<float> &window, double iir_alpha,
+                      const std::string &secondary_output,
+                      bool reset_on_alpha_change, bool mag_squared,
+                      int nthreads);
+  ~log_mag_fft_cf_impl();
+
+  void set_iir_alpha(double alpha);
+  double iir_alpha() const { return d_alpha; }
+  void set_window(const std::vector<float> &window);
+  void reset();
+  void set_nthreads(int n);
+  int nthreads() const { return d_fft->nthreads(); }
+
+  int work(int noutput_items, gr_vector_const_void_star &input_items,
+           gr_vector_void_star &output_items);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_LOG_MAG_FFT_CF_IMPL_H */
@@ -34,6 +34,11 @@ namespace CyberRadio {
 
 /*!
  * \brief VITA 49 frame header information.
+ *
+ * These structures describe the fixed NDR308-style frame layout, and are
+ * used to size receive buffers.  To decode a packet, use vita49_view
+ * (CyberRadio/vita49_view.h), which handles any combination of header
+ * fields and byte order.
  */
 struct Vita49Header {
   uint32_t frameStart;      //!< Frame start word (ASCII string "VRLP")
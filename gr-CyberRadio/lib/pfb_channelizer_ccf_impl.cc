@@ -0,0 +1,274 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "pfb_channelizer_ccf_impl.h"
+#include "ddc_rates.h"
+#include "fold_kernels.h"
+#include "spectral_window.h"
+#include <algorithm>
+#include <cmath>
+#include <cstring>
+#include <gnuradio/filter/firdes.h>
+#include <gnuradio/io_signature.h>
+#include <stdexcept>
+#include <volk/volk.h>
+
+namespace gr {
+namespace CyberRadio {
+
+pfb_channelizer_ccf::sptr
+pfb_channelizer_ccf::make(double in_rate, double out_rate, int num_channels,
+                          const std::vector<int> &channels,
+                          double attenuation_db, int nthreads) {
+  return gnuradio::get_initial_sptr(new pfb_channelizer_ccf_impl(
+      in_rate, out_rate, num_channels, channels, attenuation_db, nthreads));
+}
+
+// in_rate/out_rate, or 0 if that is not (within 1 ppm) an integer
+static int rate_ratio(double in_rate, double out_rate) {
+  if (in_rate <= 0 || out_rate <= 0 || out_rate > in_rate)
+    return 0;
+  double ratio = in_rate / out_rate;
+  double whole = std::floor(ratio + 0.5);
+  return std::fabs(ratio - whole) <= 1e-6 * ratio ? int(whole) : 0;
+}
+
+/*
+ * The private constructor
+ */
+pfb_channelizer_ccf_impl::pfb_channelizer_ccf_impl(
+    double in_rate, double out_rate, int num_channels,
+    const std::vector<int> &channels, double attenuation_db, int nthreads)
+    : gr::sync_decimator(
+          "pfb_channelizer_ccf", io_signature::make(1, 1, sizeof(gr_complex)),
+          io_signature::make(1, std::max<int>(1, channels.size()),
+                             sizeof(gr_complex)),
+          std::max(1, rate_ratio(in_rate, out_rate))),
+      d_in_rate(in_rate), d_out_rate(out_rate), d_num_channels(num_channels),
+      d_decim(rate_ratio(in_rate, out_rate)), d_use_fft(false), d_dft(NULL),
+      d_fft(NULL), d_phase(0) {
+  if (num_channels < 1)
+    throw std::invalid_argument(
+        "pfb_channelizer_ccf: num_channels must be positive");
+  if (channels.empty())
+    throw std::invalid_argument(
+        "pfb_channelizer_ccf: at least one channel is required");
+  if (d_decim < 1)
+    throw std::invalid_argument(
+        "pfb_channelizer_ccf: out_rate must divide in_rate");
+  if (!is_ddc_rate(out_rate))
+    throw std::invalid_argument(
+        "pfb_channelizer_ccf: out_rate is not a DDC rate");
+  if (attenuation_db <= 0)
+    throw std::invalid_argument(
+        "pfb_channelizer_ccf: attenuation_db must be positive");
+
+  // firdes sizes the filter from the attenuation, the Kaiser window meets it
+  double bw = std::min(in_rate / num_channels, out_rate);
+  d_taps = gr::filter::firdes::low_pass_2(1.0, in_rate, 0.4 * bw, 0.2 * bw,
+                                          attenuation_db,
+                                          gr::filter::firdes::WIN_KAISER,
+                                          kaiser_beta(attenuation_db));
+  d_taps_len = (d_taps.size() + num_channels - 1) / num_channels *
+               size_t(num_channels);
+  d_taps.resize(d_taps_len, 0.0f);
+  set_history(d_taps_len);
+
+  size_t align = volk_get_alignment();
+  d_coef = (float *)volk_malloc(sizeof(float) * 2 * d_taps_len, align);
+  for (size_t j = 0; j < d_taps_len; j++)
+    d_coef[2 * j] = d_coef[2 * j + 1] = d_taps[d_taps_len - 1 - j];
+  d_twiddle =
+      (gr_complex *)volk_malloc(sizeof(gr_complex) * num_channels, align);
+  for (int r = 0; r < num_channels; r++)
+    d_twiddle[r] = std::polar(1.0f, float(-2.0 * M_PI * r / num_channels));
+  d_dft = (gr_complex *)volk_malloc(
+      sizeof(gr_complex) * num_channels * channels.size(), align);
+  d_fft = new fft_batch(num_channels, BATCH, true, nthreads);
+
+  d_channels.resize(channels.size());
+  d_tag_pending.assign(channels.size(), true);
+  for (size_t o = 0; o < channels.size(); o++)
+    d_channels[o] = check_channel(channels[o]);
+  update_channel_plan();
+
+  set_tag_propagation_policy(TPP_DONT);
+  message_port_register_in(pmt::mp("channels"));
+  set_msg_handler(pmt::mp("channels"),
+                  boost::bind(&pfb_channelizer_ccf_impl::rxChannelsMsg, this,
+                              _1));
+}
+
+pfb_channelizer_ccf_impl::~pfb_channelizer_ccf_impl() {
+  delete d_fft;
+  volk_free(d_coef);
+  volk_free(d_twiddle);
+  volk_free(d_dft);
+}
+
+int pfb_channelizer_ccf_impl::check_channel(int channel) const {
+  if (channel < -d_num_channels || channel >= d_num_channels)
+    throw std::out_of_range("pfb_channelizer_ccf: no such channel");
+  return channel < 0 ? channel + d_num_channels : channel;
+}
+
+/*
+ * One DFT bin costs num_channels complex multiply-adds against a full
+ * FFT's (num_channels/2)*log2(num_channels) butterflies, so a few bins are
+ * cheaper computed directly.  Lock held.
+ */
+void pfb_channelizer_ccf_impl::update_channel_plan() {
+  const int M = d_num_channels;
+  d_use_fft = 2 * d_channels.size() > std::log2(double(M));
+  if (d_use_fft)
+    return;
+  for (size_t o = 0; o < d_channels.size(); o++) {
+    gr_complex *row = d_dft + o * M;
+    for (int t = 0; t < M; t++)
+      row[t] = d_twiddle[uint64_t(d_channels[o]) * t % M];
+  }
+}
+
+void pfb_channelizer_ccf_impl::set_channels(const std::vector<int> &channels) {
+  if (channels.size() != d_channels.size())
+    throw std::invalid_argument(
+        "pfb_channelizer_ccf: the number of outputs cannot change");
+  std::vector<int> checked(channels.size());
+  for (size_t o = 0; o < channels.size(); o++)
+    checked[o] = check_channel(channels[o]);
+  gr::thread::scoped_lock lock(d_mutex);
+  for (size_t o = 0; o < checked.size(); o++)
+    if (checked[o] != d_channels[o])
+      d_tag_pending[o] = true;
+  d_channels = checked;
+  update_channel_plan();
+}
+
+std::vector<int> pfb_channelizer_ccf_impl::channels() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return d_channels;
+}
+
+void pfb_channelizer_ccf_impl::set_channel(int output, int channel) {
+  if (output < 0 || output >= int(d_channels.size()))
+    throw std::out_of_range("pfb_channelizer_ccf: no such output");
+  std::vector<int> channels = this->channels();
+  channels[output] = channel;
+  set_channels(channels);
+}
+
+// The upper half of the channels are the negative frequencies, as fftshift
+double pfb_channelizer_ccf_impl::channel_freq(int channel) const {
+  int k = check_channel(channel);
+  if (k >= (d_num_channels + 1) / 2)
+    k -= d_num_channels;
+  return k * d_in_rate / d_num_channels;
+}
+
+void pfb_channelizer_ccf_impl::set_nthreads(int nthreads) {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_fft->set_nthreads(nthreads);
+}
+
+void pfb_channelizer_ccf_impl::rxChannelsMsg(pmt::pmt_t msg) {
+  try {
+    if (pmt::is_pair(msg) && pmt::is_integer(pmt::car(msg)) &&
+        pmt::is_integer(pmt::cdr(msg))) {
+      set_channel(int(pmt::to_long(pmt::car(msg))),
+                  int(pmt::to_long(pmt::cdr(msg))));
+    } else if (pmt::is_s32vector(msg)) {
+      set_channels(pmt::s32vector_elements(msg));
+    } else if (pmt::is_vector(msg)) {
+      std::vector<int> channels(pmt::length(msg));
+      for (size_t o = 0; o < channels.size(); o++)
+        channels[o] = int(pmt::to_long(pmt::vector_ref(msg, o)));
+      set_channels(channels);
+    } else {
+      GR_LOG_WARN(d_logger, "channels: expected a vector of channels or "
+                            "(output . channel)");
+    }
+  } catch (std::exception &e) {
+    GR_LOG_WARN(d_logger, std::string("channels: ") + e.what());
+  }
+}
+
+/*
+ * Output m of channel k is the input mixed down by k*in_rate/M, low-pass
+ * filtered and kept at every decim'th sample.  Folding the time-reversed
+ * prototype's M-sample phases over the input window and taking the DFT
+ * gives bin k of that up to a rotation: with the window starting at sample
+ * n, y_k = X_k * exp(-j*2*pi*k*n/M), so only n mod M is tracked.
+ */
+int pfb_channelizer_ccf_impl::work(int noutput_items,
+                                   gr_vector_const_void_star &input_items,
+                                   gr_vector_void_star &output_items) {
+  gr::thread::scoped_lock lock(d_mutex);
+  const gr_complex *in = (const gr_complex *)input_items[0];
+  const int M = d_num_channels;
+  const size_t phases = d_taps_len / M;
+  const int nout = std::min(int(d_channels.size()), int(output_items.size()));
+
+  for (int o = 0; o < nout; o++) {
+    if (!d_tag_pending[o])
+      continue;
+    add_item_tag(o, nitems_written(o), pmt::mp("ddc_rate"),
+                 pmt::from_float(float(d_out_rate)));
+    add_item_tag(o, nitems_written(o), pmt::mp("channel_freq"),
+                 pmt::from_double(channel_freq(d_channels[o])));
+    d_tag_pending[o] = false;
+  }
+
+  uint64_t phase = d_phase;
+  for (int i0 = 0; i0 < noutput_items; i0 += BATCH) {
+    const int nb = std::min(int(BATCH), noutput_items - i0);
+    for (int b = 0; b < nb; b++) {
+      float *acc = (float *)d_fft->get_inbuf(b);
+      const float *x = (const float *)(in + size_t(i0 + b) * d_decim);
+      memset(acc, 0, sizeof(gr_complex) * M);
+      for (size_t p = 0; p < phases; p++)
+        fold_accumulate(acc, x + 2 * p * M, d_coef + 2 * p * M, 2 * M);
+    }
+    if (d_use_fft)
+      d_fft->execute();
+    for (int b = 0; b < nb; b++) {
+      for (int o = 0; o < nout; o++) {
+        const int k = d_channels[o];
+        gr_complex X;
+        if (d_use_fft)
+          X = d_fft->get_outbuf(b)[k];
+        else
+          volk_32fc_x2_dot_prod_32fc(&X, d_fft->get_inbuf(b), d_dft + o * M,
+                                     M);
+        ((gr_complex *)output_items[o])[i0 + b] =
+            X * d_twiddle[uint64_t(k) * phase % M];
+      }
+      phase = (phase + d_decim) % M;
+    }
+  }
+  d_phase = phase;
+  return noutput_items;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
@@ -0,0 +1,78 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_PFB_CHANNELIZER_CCF_IMPL_H
+#define INCLUDED_CYBERRADIO_PFB_CHANNELIZER_CCF_IMPL_H
+
+#include <CyberRadio/pfb_channelizer_ccf.h>
+#include "fft_batch.h"
+#include <gnuradio/thread/thread.h>
+
+namespace gr {
+namespace CyberRadio {
+
+class pfb_channelizer_ccf_impl : public pfb_channelizer_ccf {
+private:
+  // Output samples whose folds share one batched FFT
+  enum { BATCH = 16 };
+
+  double d_in_rate;
+  double d_out_rate;
+  int d_num_channels;
+  int d_decim;
+  std::vector<float> d_taps;     // prototype, zero-padded to d_taps_len
+  size_t d_taps_len;             // a multiple of d_num_channels
+  // Time-reversed prototype stored once per float (re and im), so the fold
+  // is a float multiply-accumulate over the interleaved input window
+  float *d_coef;
+  gr_complex *d_twiddle;         // exp(-j*2*pi*r/num_channels)
+  std::vector<int> d_channels;   // per output, in [0, num_channels)
+  std::vector<bool> d_tag_pending;
+  bool d_use_fft;
+  gr_complex *d_dft;             // direct path: one DFT row per output
+  fft_batch *d_fft;              // inputs hold the folds on both paths
+  uint64_t d_phase;              // first window's start, mod num_channels
+  mutable gr::thread::mutex d_mutex;
+
+  int check_channel(int channel) const;
+  void update_channel_plan();
+  void rxChannelsMsg(pmt::pmt_t msg);
+
+public:
+  pfb_channelizer_ccf_impl(double in_rate, double out_rate, int num_channels,
+                           const std::vector<int> &channels,
+                           double attenuation_db, int nthreads);
+  ~pfb_channelizer_ccf_impl();
+
+  void set_channels(const std::vector<int> &channels);
+  std::vector<int> channels() const;
+  void set_channel(int output, int channel);
+  double channel_freq(int channel) const;
+  std::vector<float> taps() const { return d_taps; }
+  void set_nthreads(int nthreads);
+
+  int work(int noutput_items, gr_vector_const_void_star &input_items,
+           gr_vector_void_star &output_items);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_PFB_CHANNELIZER_CCF_IMPL_H */
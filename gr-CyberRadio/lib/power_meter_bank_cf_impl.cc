@@ -0,0 +1,169 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "power_meter_bank_cf_impl.h"
+#include "single_pole_iir_kernels.h"
+#include <algorithm>
+#include <cmath>
+#include <cstring>
+#include <gnuradio/io_signature.h>
+#include <stdexcept>
+#include <volk/volk.h>
+
+namespace gr {
+namespace CyberRadio {
+
+power_meter_bank_cf::sptr power_meter_bank_cf::make(int num_channels,
+                                                    double fs,
+                                                    double update_rate,
+                                                    double avg_gain_exp,
+                                                    int block_size) {
+  return gnuradio::get_initial_sptr(new power_meter_bank_cf_impl(
+      num_channels, fs, update_rate, avg_gain_exp, block_size));
+}
+
+/*
+ * The private constructor
+ */
+power_meter_bank_cf_impl::power_meter_bank_cf_impl(int num_channels,
+                                                   double fs,
+                                                   double update_rate,
+                                                   double avg_gain_exp,
+                                                   int block_size)
+    : gr::sync_block("power_meter_bank_cf",
+                     io_signature::make(num_channels, num_channels,
+                                        sizeof(gr_complex)),
+                     io_signature::make(0, 0, 0)),
+      d_num_channels(num_channels), d_block_size(block_size), d_fs(fs),
+      d_update_rate(update_rate), d_avg_gain_exp(avg_gain_exp),
+      d_block_fill(0), d_blocks_done(0), d_primed(false),
+      d_log(10.0f, 0.0f, -300.0f) {
+  if (num_channels < 1 || block_size < 1)
+    throw std::invalid_argument(
+        "power_meter_bank_cf: num_channels and block_size must be positive");
+  if (fs <= 0 || update_rate <= 0)
+    throw std::invalid_argument(
+        "power_meter_bank_cf: fs and update_rate must be positive");
+  size_t align = volk_get_alignment();
+  size_t bytes = sizeof(float) * num_channels;
+  d_sum = (float *)volk_malloc(bytes, align);
+  d_block_power = (float *)volk_malloc(bytes, align);
+  d_avg = (float *)volk_malloc(bytes, align);
+  d_levels = (float *)volk_malloc(bytes, align);
+  memset(d_sum, 0, bytes);
+  memset(d_avg, 0, bytes);
+  nlog10_kernel(d_levels, d_avg, d_log, num_channels);
+  update_derived();
+  message_port_register_out(pmt::mp("rssi"));
+}
+
+power_meter_bank_cf_impl::~power_meter_bank_cf_impl() {
+  volk_free(d_sum);
+  volk_free(d_block_power);
+  volk_free(d_avg);
+  volk_free(d_levels);
+}
+
+// Lock held
+void power_meter_bank_cf_impl::update_derived() {
+  double alpha = pow(2.0, -d_avg_gain_exp);
+  if (alpha > 1.0)
+    alpha = 1.0;
+  d_block_alpha = float(1.0 - pow(1.0 - alpha, double(d_block_size)));
+  double blocks = d_fs / (d_update_rate * d_block_size);
+  d_blocks_per_update = blocks < 1.0 ? 1 : int(blocks + 0.5);
+}
+
+void power_meter_bank_cf_impl::set_avg_gain_exp(double exp) {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_avg_gain_exp = exp;
+  update_derived();
+}
+
+void power_meter_bank_cf_impl::set_update_rate(double rate) {
+  if (rate <= 0)
+    throw std::invalid_argument(
+        "power_meter_bank_cf: update_rate must be positive");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_update_rate = rate;
+  update_derived();
+}
+
+void power_meter_bank_cf_impl::set_fs(double fs) {
+  if (fs <= 0)
+    throw std::invalid_argument("power_meter_bank_cf: fs must be positive");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_fs = fs;
+  update_derived();
+}
+
+std::vector<float> power_meter_bank_cf_impl::levels() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return std::vector<float>(d_levels, d_levels + d_num_channels);
+}
+
+// Lock held
+void power_meter_bank_cf_impl::finish_block() {
+  const int nch = d_num_channels;
+  volk_32f_s32f_multiply_32f(d_block_power, d_sum, 1.0f / d_block_size, nch);
+  memset(d_sum, 0, sizeof(float) * nch);
+  if (!d_primed) {
+    memcpy(d_avg, d_block_power, sizeof(float) * nch);
+    d_primed = true;
+  } else {
+    single_pole_iir_update(d_avg, NULL, d_block_power, d_block_alpha, nch);
+  }
+  d_block_fill = 0;
+  if (++d_blocks_done >= d_blocks_per_update) {
+    d_blocks_done = 0;
+    nlog10_kernel(d_levels, d_avg, d_log, nch);
+    message_port_pub(pmt::mp("rssi"), pmt::init_f32vector(nch, d_levels));
+  }
+}
+
+int power_meter_bank_cf_impl::work(int noutput_items,
+                                   gr_vector_const_void_star &input_items,
+                                   gr_vector_void_star &output_items) {
+  gr::thread::scoped_lock lock(d_mutex);
+  int done = 0;
+  while (done < noutput_items) {
+    int n = std::min(noutput_items - done, d_block_size - d_block_fill);
+    for (int ch = 0; ch < d_num_channels; ch++) {
+      // |x|^2 summed over the block is the float dot product of the
+      // interleaved I/Q with itself
+      const float *in = (const float *)input_items[ch] + 2 * done;
+      float power;
+      volk_32f_x2_dot_prod_32f(&power, in, in, 2 * n);
+      d_sum[ch] += power;
+    }
+    done += n;
+    d_block_fill += n;
+    if (d_block_fill == d_block_size)
+      finish_block();
+  }
+  return noutput_items;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
@@ -0,0 +1,73 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_POWER_METER_BANK_CF_IMPL_H
+#define INCLUDED_CYBERRADIO_POWER_METER_BANK_CF_IMPL_H
+
+#include <CyberRadio/power_meter_bank_cf.h>
+#include "nlog10_kernels.h"
+#include <gnuradio/thread/thread.h>
+
+namespace gr {
+namespace CyberRadio {
+
+class power_meter_bank_cf_impl : public power_meter_bank_cf {
+private:
+  int d_num_channels;
+  int d_block_size;
+  double d_fs;
+  double d_update_rate;
+  double d_avg_gain_exp;
+  float d_block_alpha;     // average update per full block
+  int d_blocks_per_update;
+  int d_block_fill;        // samples into the current block
+  int d_blocks_done;       // blocks since the last message
+  bool d_primed;
+  float *d_sum;            // power summed over the current block
+  float *d_block_power;    // mean power of the last block
+  float *d_avg;            // averaged power
+  float *d_levels;         // d_avg in dB at the last message
+  nlog10_params d_log;
+  mutable gr::thread::mutex d_mutex;
+
+  void update_derived();
+  void finish_block();
+
+public:
+  power_meter_bank_cf_impl(int num_channels, double fs, double update_rate,
+                           double avg_gain_exp, int block_size);
+  ~power_meter_bank_cf_impl();
+
+  void set_avg_gain_exp(double exp);
+  double avg_gain_exp() const { return d_avg_gain_exp; }
+  void set_update_rate(double rate);
+  double update_rate() const { return d_update_rate; }
+  void set_fs(double fs);
+  double fs() const { return d_fs; }
+  std::vector<float> levels() const;
+
+  int work(int noutput_items, gr_vector_const_void_star &input_items,
+           gr_vector_void_star &output_items);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_POWER_METER_BANK_CF_IMPL_H */
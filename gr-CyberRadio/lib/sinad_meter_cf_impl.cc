@@ -0,0 +1,243 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "sinad_meter_cf_impl.h"
+#include <algorithm>
+#include <cmath>
+#include <gnuradio/io_signature.h>
+#include <stdexcept>
+
+namespace gr {
+namespace CyberRadio {
+
+sinad_meter_cf::sptr sinad_meter_cf::make(int num_channels, double fs,
+                                          int block_size, double update_rate,
+                                          double notch_freq, double cutoff,
+                                          bool use_freq_estimate) {
+  return gnuradio::get_initial_sptr(
+      new sinad_meter_cf_impl(num_channels, fs, block_size, update_rate,
+                              notch_freq, cutoff, use_freq_estimate));
+}
+
+/*
+ * The private constructor
+ */
+sinad_meter_cf_impl::sinad_meter_cf_impl(int num_channels, double fs,
+                                         int block_size, double update_rate,
+                                         double notch_freq, double cutoff,
+                                         bool use_freq_estimate)
+    : gr::sync_block("sinad_meter_cf",
+                     io_signature::make(num_channels, num_channels,
+                                        sizeof(gr_complex)),
+                     io_signature::make(0, 0, 0)),
+      d_num_channels(num_channels), d_block_size(block_size), d_fs(fs),
+      d_update_rate(update_rate), d_notch_freq(notch_freq), d_cutoff(cutoff),
+      d_use_freq_estimate(use_freq_estimate), d_block_fill(0),
+      d_blocks_done(0), d_samples(0), d_phasor(num_channels, 1.0f),
+      d_step(num_channels, 1.0f), d_dc(num_channels, 0.0f),
+      d_prev(num_channels, 0.0f), d_primed(num_channels, false),
+      d_blk_total(num_channels, 0.0), d_blk_noise(num_channels, 0.0),
+      d_blk_lag(num_channels, 0.0), d_acc_total(num_channels, 0.0),
+      d_acc_noise(num_channels, 0.0), d_acc_lag(num_channels, 0.0) {
+  if (num_channels < 1 || block_size < 1)
+    throw std::invalid_argument(
+        "sinad_meter_cf: num_channels and block_size must be positive");
+  if (fs <= 0 || update_rate <= 0)
+    throw std::invalid_argument(
+        "sinad_meter_cf: fs and update_rate must be positive");
+  if (cutoff <= 0 || cutoff >= 0.5)
+    throw std::out_of_range("sinad_meter_cf: cutoff must be in (0, 0.5)");
+  update_derived();
+  for (int ch = 0; ch < num_channels; ch++)
+    set_notch(ch, notch_freq);
+  message_port_register_out(pmt::mp("status"));
+}
+
+sinad_meter_cf_impl::~sinad_meter_cf_impl() {}
+
+// Lock held
+void sinad_meter_cf_impl::update_derived() {
+  d_dc_alpha = float(1.0 - exp(-2.0 * M_PI * d_cutoff));
+  // The high-pass passes white noise with a power gain of 2/(2-alpha)
+  d_noise_scale = (2.0 - d_dc_alpha) / 2.0;
+  double blocks = d_fs / (d_update_rate * d_block_size);
+  d_blocks_per_update = blocks < 1.0 ? 1 : int(blocks + 0.5);
+}
+
+// Lock held
+void sinad_meter_cf_impl::set_notch(int ch, double freq) {
+  double w = -2.0 * M_PI * freq / d_fs;
+  d_step[ch] = gr_complex(float(cos(w)), float(sin(w)));
+}
+
+void sinad_meter_cf_impl::set_fs(double fs) {
+  if (fs <= 0)
+    throw std::invalid_argument("sinad_meter_cf: fs must be positive");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_fs = fs;
+  update_derived();
+  if (!d_use_freq_estimate)
+    for (int ch = 0; ch < d_num_channels; ch++)
+      set_notch(ch, d_notch_freq);
+}
+
+void sinad_meter_cf_impl::set_update_rate(double rate) {
+  if (rate <= 0)
+    throw std::invalid_argument("sinad_meter_cf: update_rate must be positive");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_update_rate = rate;
+  update_derived();
+}
+
+void sinad_meter_cf_impl::set_notch_freq(double freq) {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_notch_freq = freq;
+  if (!d_use_freq_estimate)
+    for (int ch = 0; ch < d_num_channels; ch++)
+      set_notch(ch, freq);
+}
+
+void sinad_meter_cf_impl::set_cutoff(double cutoff) {
+  if (cutoff <= 0 || cutoff >= 0.5)
+    throw std::out_of_range("sinad_meter_cf: cutoff must be in (0, 0.5)");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_cutoff = cutoff;
+  update_derived();
+}
+
+void sinad_meter_cf_impl::set_use_freq_estimate(bool use) {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_use_freq_estimate = use;
+  if (!use)
+    for (int ch = 0; ch < d_num_channels; ch++)
+      set_notch(ch, d_notch_freq);
+}
+
+// Lock held.  Fold the block into the message sums, and retune the notch to
+// the block's frequency estimate if asked to.
+void sinad_meter_cf_impl::finish_block() {
+  for (int ch = 0; ch < d_num_channels; ch++) {
+    d_acc_total[ch] += d_blk_total[ch];
+    d_acc_noise[ch] += d_blk_noise[ch];
+    d_acc_lag[ch] += d_blk_lag[ch];
+    if (d_use_freq_estimate && std::abs(d_blk_lag[ch]) > 0)
+      set_notch(ch, std::arg(d_blk_lag[ch]) / (2.0 * M_PI) * d_fs);
+    d_blk_total[ch] = d_blk_noise[ch] = 0.0;
+    d_blk_lag[ch] = 0.0;
+    // Keep the derotator on the unit circle
+    float mag = std::abs(d_phasor[ch]);
+    if (mag > 0)
+      d_phasor[ch] /= mag;
+  }
+  d_block_fill = 0;
+  if (++d_blocks_done >= d_blocks_per_update)
+    publish();
+}
+
+// Lock held
+void sinad_meter_cf_impl::publish() {
+  const double count = double(d_blocks_done) * d_block_size;
+  const double tiny = 1e-30;
+  std::vector<float> sinad(d_num_channels), snr(d_num_channels),
+      signal(d_num_channels), noise(d_num_channels), freq(d_num_channels);
+  for (int ch = 0; ch < d_num_channels; ch++) {
+    double total = d_acc_total[ch] / count + tiny;
+    double resid = d_acc_noise[ch] * d_noise_scale / count + tiny;
+    double tone = total - resid;
+    sinad[ch] = float(10.0 * log10(total / resid));
+    snr[ch] = float(10.0 * log10((tone > tiny ? tone : tiny) / resid));
+    signal[ch] = float(10.0 * log10(total));
+    noise[ch] = float(10.0 * log10(resid));
+    freq[ch] = float(std::arg(d_acc_lag[ch]) / (2.0 * M_PI) * d_fs);
+    d_acc_total[ch] = d_acc_noise[ch] = 0.0;
+    d_acc_lag[ch] = 0.0;
+  }
+  d_blocks_done = 0;
+  pmt::pmt_t msg = pmt::make_dict();
+  msg = pmt::dict_add(msg, pmt::mp("sinad"),
+                      pmt::init_f32vector(d_num_channels, sinad));
+  msg = pmt::dict_add(msg, pmt::mp("snr"),
+                      pmt::init_f32vector(d_num_channels, snr));
+  msg = pmt::dict_add(msg, pmt::mp("signal"),
+                      pmt::init_f32vector(d_num_channels, signal));
+  msg = pmt::dict_add(msg, pmt::mp("noise"),
+                      pmt::init_f32vector(d_num_channels, noise));
+  msg = pmt::dict_add(msg, pmt::mp("freq"),
+                      pmt::init_f32vector(d_num_channels, freq));
+  msg = pmt::dict_add(msg, pmt::mp("samples"), pmt::from_uint64(d_samples));
+  message_port_pub(pmt::mp("status"), msg);
+}
+
+int sinad_meter_cf_impl::work(int noutput_items,
+                              gr_vector_const_void_star &input_items,
+                              gr_vector_void_star &output_items) {
+  gr::thread::scoped_lock lock(d_mutex);
+  const float a = d_dc_alpha;
+  int done = 0;
+  while (done < noutput_items) {
+    int n = std::min(noutput_items - done, d_block_size - d_block_fill);
+    for (int ch = 0; ch < d_num_channels; ch++) {
+      const gr_complex *in = (const gr_complex *)input_items[ch] + done;
+      gr_complex phasor = d_phasor[ch];
+      const gr_complex step = d_step[ch];
+      gr_complex dc = d_dc[ch];
+      gr_complex prev = d_prev[ch];
+      if (!d_primed[ch] && n > 0) {
+        // Start the DC tracker on the first sample, not on zero
+        dc = in[0] * phasor;
+        prev = in[0];
+        d_primed[ch] = true;
+      }
+      double total = 0, noise = 0;
+      std::complex<double> lag = 0;
+      for (int k = 0; k < n; k++) {
+        const gr_complex x = in[k];
+        const gr_complex y = x * phasor; // tone to DC
+        phasor *= step;
+        const gr_complex e = y - dc;     // notched
+        dc += a * e;
+        total += std::norm(x);
+        noise += std::norm(e);
+        const gr_complex l = x * std::conj(prev);
+        lag += std::complex<double>(l.real(), l.imag());
+        prev = x;
+      }
+      d_blk_total[ch] += total;
+      d_blk_noise[ch] += noise;
+      d_blk_lag[ch] += lag;
+      d_phasor[ch] = phasor;
+      d_dc[ch] = dc;
+      d_prev[ch] = prev;
+    }
+    done += n;
+    d_samples += n;
+    d_block_fill += n;
+    if (d_block_fill == d_block_size)
+      finish_block();
+  }
+  return noutput_items;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
@@ -0,0 +1,91 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_SINAD_METER_CF_IMPL_H
+#define INCLUDED_CYBERRADIO_SINAD_METER_CF_IMPL_H
+
+#include <CyberRadio/sinad_meter_cf.h>
+#include <complex>
+#include <gnuradio/thread/thread.h>
+#include <vector>
+
+namespace gr {
+namespace CyberRadio {
+
+class sinad_meter_cf_impl : public sinad_meter_cf {
+private:
+  int d_num_channels;
+  int d_block_size;
+  double d_fs;
+  double d_update_rate;
+  double d_notch_freq;
+  double d_cutoff;
+  bool d_use_freq_estimate;
+  float d_dc_alpha;          // notch high-pass constant
+  double d_noise_scale;      // undoes the high-pass's white-noise gain
+  int d_blocks_per_update;
+  int d_block_fill;          // samples into the current block
+  int d_blocks_done;         // blocks since the last status message
+  uint64_t d_samples;
+
+  // Per-channel state, one entry per channel
+  std::vector<gr_complex> d_phasor;    // derotator
+  std::vector<gr_complex> d_step;      // derotator increment per sample
+  std::vector<gr_complex> d_dc;        // running DC of the derotated input
+  std::vector<gr_complex> d_prev;      // previous input, for the phase step
+  std::vector<bool> d_primed;
+  // Current block sums
+  std::vector<double> d_blk_total, d_blk_noise;
+  std::vector<std::complex<double> > d_blk_lag;
+  // Sums since the last status message
+  std::vector<double> d_acc_total, d_acc_noise;
+  std::vector<std::complex<double> > d_acc_lag;
+  gr::thread::mutex d_mutex;
+
+  void update_derived();
+  void set_notch(int ch, double freq);
+  void finish_block();
+  void publish();
+
+public:
+  sinad_meter_cf_impl(int num_channels, double fs, int block_size,
+                      double update_rate, double notch_freq, double cutoff,
+                      bool use_freq_estimate);
+  ~sinad_meter_cf_impl();
+
+  void set_fs(double fs);
+  double fs() const { return d_fs; }
+  void set_update_rate(double rate);
+  double update_rate() const { return d_update_rate; }
+  void set_notch_freq(double freq);
+  double notch_freq() const { return d_notch_freq; }
+  void set_cutoff(double cutoff);
+  double cutoff() const { return d_cutoff; }
+  void set_use_freq_estimate(bool use);
+  bool use_freq_estimate() const { return d_use_freq_estimate; }
+
+  int work(int noutput_items, gr_vector_const_void_star &input_items,
+           gr_vector_void_star &output_items);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_SINAD_METER_CF_IMPL_H */
@@ -23,7 +23,11 @@
 #endif
 
 #include "single_pole_iir_filter_ff_impl.h"
+#include "single_pole_iir_kernels.h"
+#include <cstring>
 #include <gnuradio/io_signature.h>
+#include <stdexcept>
+#include <volk/volk.h>
 
 namespace gr {
 namespace CyberRadio {
@@ -41,7 +45,16 @@ single_pole_iir_filter_ff_impl::single_pole_iir_filter_ff_impl(INPUT_ARGS_TYPE)
     : gr::sync_block("single_pole_iir_filter_ff",
                      io_signature::make(1, 1, sizeof(float) * vlen),
                      io_signature::make(1, 1, sizeof(float) * vlen)),
-      d_vlen(vlen), d_resetOnAlphaChange(resetOnAlphaChange), d_iir(vlen) {
+      d_resetOnAlphaChange(resetOnAlphaChange), d_vlen(vlen), d_alpha(1.0),
+      d_state(NULL), d_state_d(NULL), d_reset_output(true) {
+  size_t align = volk_get_alignment();
+  if (doublePrecision) {
+    d_state_d = (double *)volk_malloc(sizeof(double) * vlen, align);
+    memset(d_state_d, 0, sizeof(double) * vlen);
+  } else {
+    d_state = (float *)volk_malloc(sizeof(float) * vlen, align);
+    memset(d_state, 0, sizeof(float) * vlen);
+  }
   set_taps(alpha);
   // Create input port
   message_port_register_in(pmt::mp("reset"));
@@ -50,28 +63,31 @@ single_pole_iir_filter_ff_impl::single_pole_iir_filter_ff_impl(INPUT_ARGS_TYPE)
       boost::bind(&single_pole_iir_filter_ff_impl::rxResetMsg, this, _1));
 }
 
-single_pole_iir_filter_ff_impl::~single_pole_iir_filter_ff_impl() {}
+single_pole_iir_filter_ff_impl::~single_pole_iir_filter_ff_impl() {
+  if (d_state)
+    volk_free(d_state);
+  if (d_state_d)
+    volk_free(d_state_d);
+}
 
 void single_pole_iir_filter_ff_impl::set_taps(double alpha) {
-  for (unsigned int i = 0; i < d_vlen; i++) {
-    d_iir[i].set_taps(alpha);
-    if (d_resetOnAlphaChange) {
-      d_iir[i].reset();
-    }
+  if (alpha < 0 || alpha > 1)
+    throw std::out_of_range("Alpha must be in [0, 1]\n");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_alpha = alpha;
+  if (d_resetOnAlphaChange) {
+    d_reset_output = true;
   }
 }
 
 void single_pole_iir_filter_ff_impl::reset(bool reset) {
   if (reset) {
-    for (unsigned int i = 0; i < d_vlen; i++) {
-      d_iir[i].reset();
-    }
+    gr::thread::scoped_lock lock(d_mutex);
+    d_reset_output = true;
   }
 }
 
 void single_pole_iir_filter_ff_impl::rxResetMsg(pmt::pmt_t msg) {
-  pmt::pmt_t tag = pmt::car(msg);
-  pmt::pmt_t value = pmt::cdr(msg);
   this->reset(true);
 }
 
@@ -80,21 +96,30 @@ int single_pole_iir_filter_ff_impl::work(int noutput_items,
                                          gr_vector_void_star &output_items) {
   const float *in = (const float *)input_items[0];
   float *out = (float *)output_items[0];
-  unsigned int vlen = d_vlen;
+  const size_t vlen = d_vlen;
+  gr::thread::scoped_lock lock(d_mutex);
 
-  if (d_vlen == 1) {
-    for (int i = 0; i < noutput_items; i++) {
-      out[i] = d_iir[0].filter(in[i]);
-    }
-  } else {
-    for (int i = 0; i < noutput_items; i++) {
-      for (unsigned int j = 0; j < vlen; j++) {
-        *out++ = d_iir[j].filter(*in++);
+  for (int i = 0; i < noutput_items; i++) {
+    if (d_reset_output) {
+      // The first vector after a reset passes through and seeds the state
+      if (d_state_d) {
+        for (size_t k = 0; k < vlen; k++)
+          d_state_d[k] = in[k];
+      } else {
+        memcpy(d_state, in, sizeof(float) * vlen);
       }
+      memcpy(out, in, sizeof(float) * vlen);
+      d_reset_output = false;
+    } else if (d_state_d) {
+      single_pole_iir_update(d_state_d, out, in, d_alpha, vlen);
+    } else {
+      single_pole_iir_update(d_state, out, in, float(d_alpha), vlen);
     }
+    in += vlen;
+    out += vlen;
   }
   return noutput_items;
-};
+}
 
 } /* namespace CyberRadio */
 } /* namespace gr */
@@ -21,8 +21,8 @@
 #ifndef INCLUDED_CYBERRADIO_SINGLE_POLE_IIR_FILTER_FF_IMPL_H
 #define INCLUDED_CYBERRADIO_SINGLE_POLE_IIR_FILTER_FF_IMPL_H
 
-#include <CyberRadio/single_pole_iir.h>
 #include <CyberRadio/single_pole_iir_filter_ff.h>
+#include <gnuradio/thread/thread.h>
 
 namespace gr {
 namespace CyberRadio {
@@ -31,7 +31,14 @@ class single_pole_iir_filter_ff_impl : public single_pole_iir_filter_ff {
 private:
   bool d_resetOnAlphaChange;
   unsigned int d_vlen;
-  std::vector<single_pole_iir<float, float, double>> d_iir;
+  double d_alpha;
+  // Filter state for the whole vector, contiguous and aligned; only one of
+  // the two is allocated
+  float *d_state;
+  double *d_state_d;
+  // Set by reset; the next input vector seeds the state
+  bool d_reset_output;
+  gr::thread::mutex d_mutex;
   void rxResetMsg(pmt::pmt_t msg);
 
 public:
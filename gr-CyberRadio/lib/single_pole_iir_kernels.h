@@ -0,0 +1,89 @@
+/* -*- c++ -*- */
+/***************************************************************************
+ * \file single_pole_iir_kernels.h
+ *
+ * \brief Vectorized single-pole IIR update over whole arrays of state.
+ *
+ * \copyright Copyright (c) 2026 CyberRadio Solutions, Inc.
+ *
+ */
+
+#ifndef INCLUDED_CYBERRADIO_SINGLE_POLE_IIR_KERNELS_H
+#define INCLUDED_CYBERRADIO_SINGLE_POLE_IIR_KERNELS_H
+
+#include <cstddef>
+#include <cstring>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief y[k] += alpha * (x[k] - y[k]) for k in [0, n).
+ *
+ * This is y = alpha*x + (1-alpha)*y with one multiply.  When \p out is not
+ * null the updated state is also written there.  The float version works
+ * eight lanes at a time with GCC/Clang vector extensions (SSE/AVX/NEON as
+ * the target allows), whatever the optimization level; the buffers need not
+ * be aligned.
+ */
+inline void single_pole_iir_update(float *y, float *out, const float *x,
+                                   float alpha, size_t n) {
+  size_t k = 0;
+#if defined(__GNUC__)
+  typedef float v8sf __attribute__((vector_size(32)));
+  const v8sf a = {alpha, alpha, alpha, alpha, alpha, alpha, alpha, alpha};
+  for (; k + 8 <= n; k += 8) {
+    v8sf vy, vx;
+    memcpy(&vy, y + k, sizeof(vy));
+    memcpy(&vx, x + k, sizeof(vx));
+    vy += a * (vx - vy);
+    memcpy(y + k, &vy, sizeof(vy));
+    if (out)
+      memcpy(out + k, &vy, sizeof(vy));
+  }
+#endif
+  for (; k < n; k++) {
+    y[k] += alpha * (x[k] - y[k]);
+    if (out)
+      out[k] = y[k];
+  }
+}
+
+/*!
+ * \brief Double-precision state version of single_pole_iir_update().
+ *
+ * With small alpha the per-update correction is far below a float's
+ * resolution of y, so a float accumulator stalls short of the input level;
+ * keeping the state in double avoids that.
+ */
+inline void single_pole_iir_update(double *y, float *out, const float *x,
+                                   double alpha, size_t n) {
+  size_t k = 0;
+#if defined(__GNUC__)
+  typedef double v4df __attribute__((vector_size(32)));
+  const v4df a = {alpha, alpha, alpha, alpha};
+  for (; k + 4 <= n; k += 4) {
+    v4df vy;
+    memcpy(&vy, y + k, sizeof(vy));
+    const v4df vx = {x[k], x[k + 1], x[k + 2], x[k + 3]};
+    vy += a * (vx - vy);
+    memcpy(y + k, &vy, sizeof(vy));
+    if (out) {
+      out[k] = float(vy[0]);
+      out[k + 1] = float(vy[1]);
+      out[k + 2] = float(vy[2]);
+      out[k + 3] = float(vy[3]);
+    }
+  }
+#endif
+  for (; k < n; k++) {
+    y[k] += alpha * (double(x[k]) - y[k]);
+    if (out)
+      out[k] = float(y[k]);
+  }
+}
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_SINGLE_POLE_IIR_KERNELS_H */
@@ -0,0 +1,268 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "spectral_cache.h"
+#include "spectral_window.h"
+#include <algorithm>
+#include <boost/thread/mutex.hpp>
+#include <cmath>
+#include <cstdio>
+#include <cstdlib>
+#include <gnuradio/fft/fft.h>
+#include <gnuradio/filter/firdes.h>
+#include <list>
+#include <stdexcept>
+#include <utility>
+
+namespace gr {
+namespace CyberRadio {
+
+namespace {
+
+const size_t WINDOW_CACHE_SIZE = 32;
+const size_t PLAN_CACHE_SIZE = 16;
+const size_t DESIGN_CACHE_SIZE = 32;
+const long long MAX_RESAMPLER_PHASES = 1024;
+
+/*
+ * A small LRU map: most recently used entries at the front of the list.
+ * The caller provides the locking.
+ */
+template <typename K, typename V> class lru_cache {
+public:
+  explicit lru_cache(size_t capacity) : d_capacity(capacity) {}
+
+  bool get(const K &key, V &value) {
+    for (typename list_t::iterator it = d_items.begin(); it != d_items.end();
+         ++it) {
+      if (it->first == key) {
+        d_items.splice(d_items.begin(), d_items, it);
+        value = it->second;
+        return true;
+      }
+    }
+    return false;
+  }
+
+  //! Insert \p value; evicted values are appended to \p evicted
+  void put(const K &key, const V &value, std::vector<V> &evicted) {
+    d_items.push_front(std::make_pair(key, value));
+    while (d_items.size() > d_capacity) {
+      evicted.push_back(d_items.back().second);
+      d_items.pop_back();
+    }
+  }
+
+private:
+  typedef std::list<std::pair<K, V> > list_t;
+  size_t d_capacity;
+  list_t d_items;
+};
+
+struct window_key {
+  std::string type;
+  int size;
+  window_normalization norm;
+  bool operator==(const window_key &o) const {
+    return size == o.size && norm == o.norm && type == o.type;
+  }
+};
+
+struct plan_key {
+  int size, howmany, nthreads;
+  bool forward;
+  bool operator==(const plan_key &o) const {
+    return size == o.size && howmany == o.howmany && nthreads == o.nthreads &&
+           forward == o.forward;
+  }
+};
+
+struct design_key {
+  long long in_rate, out_rate;
+  double attenuation_db;
+  bool operator==(const design_key &o) const {
+    return in_rate == o.in_rate && out_rate == o.out_rate &&
+           attenuation_db == o.attenuation_db;
+  }
+};
+
+typedef boost::shared_ptr<fftwf_plan_s> plan_sptr;
+
+boost::mutex s_window_mutex;
+lru_cache<window_key, window_sptr> s_windows(WINDOW_CACHE_SIZE);
+// Guarded by gr::fft::planner::mutex()
+lru_cache<plan_key, plan_sptr> s_plans(PLAN_CACHE_SIZE);
+bool s_fftw_initialized = false;
+boost::mutex s_design_mutex;
+lru_cache<design_key, resampler_design_sptr> s_designs(DESIGN_CACHE_SIZE);
+
+std::string wisdom_filename() {
+  const char *env = getenv("CYBERRADIO_FFTW_WISDOM");
+  if (env && *env)
+    return env;
+  const char *home = getenv("HOME");
+  return std::string(home ? home : ".") + "/.gr_fftw_wisdom";
+}
+
+// Planner lock held.  Write to a temporary name and rename, so a reader
+// never sees a half-written file.
+void save_wisdom() {
+  std::string filename = wisdom_filename();
+  std::string tmp = filename + ".tmp";
+  if (fftwf_export_wisdom_to_filename(tmp.c_str()))
+    rename(tmp.c_str(), filename.c_str());
+}
+
+void destroy_plan(fftwf_plan plan) {
+  gr::fft::planner::scoped_lock lock(gr::fft::planner::mutex());
+  fftwf_destroy_plan(plan);
+}
+
+long long gcd(long long a, long long b) {
+  while (b) {
+    long long t = a % b;
+    a = b;
+    b = t;
+  }
+  return a;
+}
+
+resampler_design *design_resampler(const design_key &key) {
+  long long g = gcd(key.in_rate, key.out_rate);
+  long long interp = key.out_rate / g;
+  long long decim = key.in_rate / g;
+  if (interp > MAX_RESAMPLER_PHASES)
+    throw std::invalid_argument(
+        "cached_resampler_design: the rate ratio needs too many phases");
+  resampler_design *d = new resampler_design;
+  d->interp = int(interp);
+  d->decim = int(decim);
+  if (interp == decim) {
+    d->taps_per_phase = 1;
+    d->taps.assign(1, 1.0f);
+    return d;
+  }
+  // Designed at the upsampled rate; a gain of interp makes up for the
+  // zeros stuffed between input samples
+  double bw = double(std::min(key.in_rate, key.out_rate));
+  std::vector<float> h = gr::filter::firdes::low_pass_2(
+      double(interp), double(key.in_rate) * interp, 0.45 * bw, 0.1 * bw,
+      key.attenuation_db, gr::filter::firdes::WIN_KAISER,
+      kaiser_beta(key.attenuation_db));
+  const int K = int((h.size() + interp - 1) / interp);
+  d->taps_per_phase = K;
+  d->taps.assign(size_t(interp) * K, 0.0f);
+  for (size_t j = 0; j < h.size(); j++) {
+    size_t p = j % interp;
+    d->taps[p * K + (K - 1 - j / interp)] = h[j];
+  }
+  return d;
+}
+
+} // namespace
+
+window_sptr cached_window(const std::string &type, int size,
+                          window_normalization norm) {
+  window_key key = {type, size, norm};
+  std::vector<window_sptr> evicted;
+  boost::mutex::scoped_lock lock(s_window_mutex);
+  window_sptr w;
+  if (s_windows.get(key, w))
+    return w;
+  std::vector<float> *v = new std::vector<float>(spectral_window(type, size));
+  double sum = 0;
+  for (int k = 0; k < size; k++)
+    sum += (norm == WINDOW_NORM_ENERGY) ? double((*v)[k]) * (*v)[k]
+                                        : double((*v)[k]);
+  if (norm != WINDOW_NORM_NONE && sum != 0) {
+    float scale =
+        float(norm == WINDOW_NORM_ENERGY ? 1.0 / std::sqrt(sum) : 1.0 / sum);
+    for (int k = 0; k < size; k++)
+      (*v)[k] *= scale;
+  }
+  w.reset(v);
+  s_windows.put(key, w, evicted);
+  return w;
+}
+
+plan_sptr cached_fft_plan(int size, int howmany, bool forward, int nthreads) {
+  if (size < 1 || howmany < 1)
+    throw std::invalid_argument(
+        "cached_fft_plan: size and howmany must be >= 1");
+  plan_key key = {size, howmany, nthreads < 1 ? 1 : nthreads, forward};
+  // Evicted plans are released after the lock is dropped; destroying one
+  // takes the planner lock itself.
+  std::vector<plan_sptr> evicted;
+  gr::fft::planner::scoped_lock lock(gr::fft::planner::mutex());
+  plan_sptr plan;
+  if (s_plans.get(key, plan))
+    return plan;
+  if (!s_fftw_initialized) {
+    fftwf_init_threads();
+    fftwf_import_wisdom_from_filename(wisdom_filename().c_str());
+    s_fftw_initialized = true;
+  }
+  // FFTW_MEASURE scribbles on the buffers, so plan on scratch ones
+  size_t n = size_t(size) * howmany;
+  fftwf_complex *in = (fftwf_complex *)fftwf_malloc(sizeof(fftwf_complex) * n);
+  fftwf_complex *out =
+      (fftwf_complex *)fftwf_malloc(sizeof(fftwf_complex) * n);
+  if (!in || !out) {
+    fftwf_free(in);
+    fftwf_free(out);
+    throw std::bad_alloc();
+  }
+  fftwf_plan_with_nthreads(key.nthreads);
+  fftwf_plan p = fftwf_plan_many_dft(
+      1, &size, howmany, in, NULL, 1, size, out, NULL, 1, size,
+      forward ? FFTW_FORWARD : FFTW_BACKWARD, FFTW_MEASURE);
+  fftwf_free(in);
+  fftwf_free(out);
+  if (!p)
+    throw std::runtime_error("cached_fft_plan: FFTW planning failed");
+  plan.reset(p, destroy_plan);
+  s_plans.put(key, plan, evicted);
+  save_wisdom();
+  return plan;
+}
+
+resampler_design_sptr cached_resampler_design(double in_rate, double out_rate,
+                                              double attenuation_db) {
+  if (in_rate < 1 || out_rate < 1 || !(attenuation_db > 0))
+    throw std::invalid_argument("cached_resampler_design: rates must be at "
+                                "least 1 sps and attenuation positive");
+  design_key key = {std::llround(in_rate), std::llround(out_rate),
+                    attenuation_db};
+  std::vector<resampler_design_sptr> evicted;
+  boost::mutex::scoped_lock lock(s_design_mutex);
+  resampler_design_sptr d;
+  if (s_designs.get(key, d))
+    return d;
+  d.reset(design_resampler(key));
+  s_designs.put(key, d, evicted);
+  return d;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
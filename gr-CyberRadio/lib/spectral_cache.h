@@ -0,0 +1,101 @@
+/* -*- c++ -*- */
+/***************************************************************************
+ * \file spectral_cache.h
+ *
+ * \brief Process-wide LRU caches of FFT windows, FFTW plans and resampler
+ *        filter designs.
+ *
+ * \copyright Copyright (c) 2026 CyberRadio Solutions, Inc.
+ *
+ */
+
+#ifndef INCLUDED_CYBERRADIO_SPECTRAL_CACHE_H
+#define INCLUDED_CYBERRADIO_SPECTRAL_CACHE_H
+
+#include <boost/shared_ptr.hpp>
+#include <fftw3.h>
+#include <string>
+#include <vector>
+
+namespace gr {
+namespace CyberRadio {
+
+//! How cached_window() scales a window
+enum window_normalization {
+  WINDOW_NORM_NONE,   //!< as generated (peak near 1)
+  WINDOW_NORM_SUM,    //!< unit sum, for amplitude-calibrated spectra
+  WINDOW_NORM_ENERGY  //!< unit sum of squares, for power spectral density
+};
+
+typedef boost::shared_ptr<const std::vector<float> > window_sptr;
+
+/*!
+ * \brief spectral_window(\p type, \p size), scaled per \p norm, from cache.
+ *
+ * Windows are keyed by (type, size, normalization); the least recently
+ * used of the last few dozen are kept, so blocks that share a window, or a
+ * block rebuilt with the same settings, don't regenerate 2^17 points.  The
+ * returned vector is shared and must not be modified.
+ */
+window_sptr cached_window(const std::string &type, int size,
+                          window_normalization norm = WINDOW_NORM_NONE);
+
+/*!
+ * \brief A shared FFTW plan for \p howmany contiguous complex transforms.
+ *
+ * Plans are keyed by (size, howmany, direction, nthreads) and kept in an LRU
+ * cache; an evicted plan lives on until its last user lets go.  They are
+ * made out of place on fftwf_malloc() buffers, so run one with
+ * fftwf_execute_dft() on any pair of distinct fftwf_malloc() buffers laid
+ * out the same way.
+ *
+ * FFTW wisdom is loaded from disk before the first plan is made and saved
+ * after each new plan, so FFTW_MEASURE planning is paid once per machine,
+ * not once per flowgraph start.  The file is $CYBERRADIO_FFTW_WISDOM if set,
+ * otherwise ~/.gr_fftw_wisdom, which GNU Radio's own FFT blocks share.
+ *
+ * Takes GNU Radio's FFT planner lock.
+ */
+boost::shared_ptr<fftwf_plan_s> cached_fft_plan(int size, int howmany,
+                                                bool forward, int nthreads);
+
+/*!
+ * \brief A rational resampler's polyphase filter bank.
+ *
+ * Output n falls at input time n*decim/interp.  With phase p = n*decim mod
+ * interp and i = n*decim div interp it is the dot product of input samples
+ * [i - taps_per_phase + 1, i] with taps[p*taps_per_phase ...], which holds
+ * phase p of the prototype low pass time-reversed, oldest sample first.
+ */
+struct resampler_design {
+  int interp;
+  int decim;
+  int taps_per_phase;
+  std::vector<float> taps;  //!< interp * taps_per_phase
+};
+
+typedef boost::shared_ptr<const resampler_design> resampler_design_sptr;
+
+/*!
+ * \brief The polyphase design resampling \p in_rate to \p out_rate, from
+ * cache.
+ *
+ * Rates are rounded to whole samples per second and the ratio reduced, so
+ * 1.28 Msps to 48 ksps is 3/80.  The prototype is a Kaiser-window low pass
+ * with unity passband gain, passband to 0.4 and stopband from 0.5 times the
+ * lower of the two rates at \p attenuation_db.  Equal rates give a single
+ * unit tap.  Designs are keyed by (in_rate, out_rate, attenuation_db) and
+ * the least recently used of the last few dozen are kept, so a resampler
+ * following a radio back and forth between DDC rates designs each filter
+ * once.  The returned design is shared and must not be modified.
+ *
+ * \throws std::invalid_argument for rates below 1 sps, attenuation_db not
+ *         positive, or a ratio needing more than 1024 phases
+ */
+resampler_design_sptr cached_resampler_design(double in_rate, double out_rate,
+                                              double attenuation_db);
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_SPECTRAL_CACHE_H */
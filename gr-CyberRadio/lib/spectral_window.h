@@ -0,0 +1,109 @@
+/* -*- c++ -*- */
+/***************************************************************************
+ * \file spectral_window.h
+ *
+ * \brief Named FFT windows, matching scipy.signal.get_window().
+ *
+ * \copyright Copyright (c) 2026 CyberRadio Solutions, Inc.
+ *
+ */
+
+#ifndef INCLUDED_CYBERRADIO_SPECTRAL_WINDOW_H
+#define INCLUDED_CYBERRADIO_SPECTRAL_WINDOW_H
+
+#include <cmath>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Window \p type of length \p size.
+ *
+ * The names and shapes are scipy.signal.get_window()'s, and like it the
+ * windows are periodic (the DFT-even form used for spectral analysis), so
+ * the Python blocks that called scipy get the same coefficients from C++.
+ * Supported: boxcar (rectangular, rect, ones), hann (hanning), hamming,
+ * blackman, blackmanharris, nuttall, flattop and bartlett (triangle).
+ *
+ * \throws std::invalid_argument for an unknown name or a size below 1
+ */
+inline std::vector<float> spectral_window(const std::string &type, int size) {
+  if (size < 1)
+    throw std::invalid_argument("spectral_window: size must be positive");
+  std::vector<float> w(size, 1.0f);
+  if (type == "boxcar" || type == "rectangular" || type == "rect" ||
+      type == "ones")
+    return w;
+  if (type == "bartlett" || type == "triangle") {
+    for (int n = 0; n < size; n++) {
+      double x = 2.0 * n / size;
+      w[n] = float(x <= 1.0 ? x : 2.0 - x);
+    }
+    return w;
+  }
+  // Generalized cosine windows: sum_k (-1)^k a[k] cos(2 pi k n / size)
+  static const double hann[] = {0.5, 0.5};
+  static const double hamming[] = {0.54, 0.46};
+  static const double blackman[] = {0.42, 0.50, 0.08};
+  static const double blackmanharris[] = {0.35875, 0.48829, 0.14128,
+                                          0.01168};
+  static const double nuttall[] = {0.3635819, 0.4891775, 0.1365995,
+                                   0.0106411};
+  static const double flattop[] = {0.21557895, 0.41663158, 0.277263158,
+                                   0.083578947, 0.006947368};
+  const double *a;
+  int terms;
+  if (type == "hann" || type == "hanning") {
+    a = hann;
+    terms = 2;
+  } else if (type == "hamming") {
+    a = hamming;
+    terms = 2;
+  } else if (type == "blackman") {
+    a = blackman;
+    terms = 3;
+  } else if (type == "blackmanharris") {
+    a = blackmanharris;
+    terms = 4;
+  } else if (type == "nuttall") {
+    a = nuttall;
+    terms = 4;
+  } else if (type == "flattop") {
+    a = flattop;
+    terms = 5;
+  } else {
+    throw std::invalid_argument("spectral_window: unknown window type '" +
+                                type + "'");
+  }
+  for (int n = 0; n < size; n++) {
+    double phase = 2.0 * M_PI * n / size;
+    double sum = 0;
+    for (int k = 0; k < terms; k++)
+      sum += ((k & 1) ? -a[k] : a[k]) * cos(k * phase);
+    w[n] = float(sum);
+  }
+  return w;
+}
+
+/*!
+ * \brief Kaiser window beta for \p attenuation_db of stopband attenuation.
+ *
+ * Kaiser's empirical formula, as scipy.signal.kaiser_beta(), for FIR
+ * designs with firdes' WIN_KAISER.
+ */
+inline double kaiser_beta(double attenuation_db) {
+  double a = attenuation_db;
+  if (a > 50)
+    return 0.1102 * (a - 8.7);
+  if (a > 21)
+    return 0.5842 * pow(a - 21, 0.4) + 0.07886 * (a - 21);
+  return 0.0;
+}
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_SPECTRAL_WINDOW_H */
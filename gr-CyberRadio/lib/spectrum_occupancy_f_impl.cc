@@ -0,0 +1,262 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "spectrum_occupancy_f_impl.h"
+#include "trace_kernels.h"
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <cstring>
+#include <gnuradio/io_signature.h>
+#include <stdexcept>
+#include <volk/volk.h>
+
+namespace gr {
+namespace CyberRadio {
+
+static const char OCCUPANCY_MAGIC[4] = {'C', 'R', 'S', 'O'};
+static const uint32_t OCCUPANCY_VERSION = 1;
+
+static double unix_seconds() {
+  return std::chrono::duration<double>(
+             std::chrono::system_clock::now().time_since_epoch())
+      .count();
+}
+
+// dB in 0.01 dB steps, saturating
+static int16_t centi_db(float db) {
+  float v = std::round(db * 100.0f);
+  if (!(v > -32768.0f))
+    return -32768;
+  if (v > 32767.0f)
+    return 32767;
+  return int16_t(v);
+}
+
+spectrum_occupancy_f::sptr spectrum_occupancy_f::make(
+    int vlen, double threshold_db, double bucket_seconds,
+    const std::vector<float> &percentiles, const std::string &filename,
+    double hist_min_db, double hist_max_db, double hist_res_db) {
+  return gnuradio::get_initial_sptr(new spectrum_occupancy_f_impl(
+      vlen, threshold_db, bucket_seconds, percentiles, filename, hist_min_db,
+      hist_max_db, hist_res_db));
+}
+
+/*
+ * The private constructor
+ */
+spectrum_occupancy_f_impl::spectrum_occupancy_f_impl(
+    int vlen, double threshold_db, double bucket_seconds,
+    const std::vector<float> &percentiles, const std::string &filename,
+    double hist_min_db, double hist_max_db, double hist_res_db)
+    : gr::sync_block("spectrum_occupancy_f",
+                     io_signature::make(1, 1, sizeof(float) * vlen),
+                     io_signature::make(0, 0, 0)),
+      d_vlen(vlen), d_threshold_db(float(threshold_db)),
+      d_bucket_seconds(bucket_seconds), d_percentiles(percentiles),
+      d_hist_min_db(float(hist_min_db)), d_hist_res_db(float(hist_res_db)),
+      d_file(NULL), d_above(vlen), d_power_sum(vlen) {
+  if (vlen < 1)
+    throw std::invalid_argument("spectrum_occupancy_f: vlen must be positive");
+  if (bucket_seconds <= 0)
+    throw std::invalid_argument(
+        "spectrum_occupancy_f: bucket_seconds must be positive");
+  if (hist_res_db <= 0 || hist_max_db <= hist_min_db)
+    throw std::invalid_argument(
+        "spectrum_occupancy_f: empty percentile histogram range");
+  for (size_t p = 0; p < percentiles.size(); p++)
+    if (!(percentiles[p] >= 0 && percentiles[p] <= 1))
+      throw std::out_of_range(
+          "spectrum_occupancy_f: percentiles must be in [0, 1]");
+  d_hist_bins = int(std::ceil((hist_max_db - hist_min_db) / hist_res_db));
+  d_hist.resize(size_t(d_hist_bins) * vlen);
+  d_max = (float *)volk_malloc(sizeof(float) * vlen, volk_get_alignment());
+  if (!filename.empty()) {
+    d_file = fopen(filename.c_str(), "ab");
+    if (!d_file)
+      throw std::runtime_error("spectrum_occupancy_f: can't open " +
+                               filename);
+  }
+  clear_bucket();
+  message_port_register_out(pmt::mp("snapshot"));
+}
+
+spectrum_occupancy_f_impl::~spectrum_occupancy_f_impl() {
+  if (d_file)
+    fclose(d_file);
+  volk_free(d_max);
+}
+
+// Lock held
+void spectrum_occupancy_f_impl::clear_bucket() {
+  d_start = 0.0;
+  d_frames = 0;
+  std::fill(d_above.begin(), d_above.end(), 0);
+  std::fill(d_power_sum.begin(), d_power_sum.end(), 0.0);
+  std::fill(d_max, d_max + d_vlen, -HUGE_VALF);
+  std::fill(d_hist.begin(), d_hist.end(), 0);
+}
+
+void spectrum_occupancy_f_impl::set_threshold_db(double threshold_db) {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_threshold_db = float(threshold_db);
+}
+
+void spectrum_occupancy_f_impl::set_bucket_seconds(double seconds) {
+  if (seconds <= 0)
+    throw std::invalid_argument(
+        "spectrum_occupancy_f: bucket_seconds must be positive");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_bucket_seconds = seconds;
+}
+
+void spectrum_occupancy_f_impl::flush() {
+  gr::thread::scoped_lock lock(d_mutex);
+  snapshot(unix_seconds());
+}
+
+bool spectrum_occupancy_f_impl::stop() {
+  flush();
+  return true;
+}
+
+// Lock held
+void spectrum_occupancy_f_impl::write_record(
+    double stop, const std::vector<float> &occupancy,
+    const std::vector<float> &mean,
+    const std::vector<std::vector<float> > &levels) {
+  const uint32_t header[3] = {OCCUPANCY_VERSION, uint32_t(d_vlen),
+                              uint32_t(d_percentiles.size())};
+  fwrite(OCCUPANCY_MAGIC, 1, sizeof(OCCUPANCY_MAGIC), d_file);
+  fwrite(header, sizeof(header), 1, d_file);
+  fwrite(&d_start, sizeof(d_start), 1, d_file);
+  fwrite(&stop, sizeof(stop), 1, d_file);
+  fwrite(&d_frames, sizeof(d_frames), 1, d_file);
+  if (!d_percentiles.empty())
+    fwrite(&d_percentiles[0], sizeof(float), d_percentiles.size(), d_file);
+  std::vector<uint16_t> occ(d_vlen);
+  for (int k = 0; k < d_vlen; k++)
+    occ[k] = uint16_t(std::round(occupancy[k] * 65535.0f));
+  fwrite(&occ[0], sizeof(uint16_t), d_vlen, d_file);
+  std::vector<int16_t> db(d_vlen);
+  const float *rows[2] = {&mean[0], d_max};
+  for (int r = 0; r < 2 + int(levels.size()); r++) {
+    const float *row = r < 2 ? rows[r] : &levels[r - 2][0];
+    for (int k = 0; k < d_vlen; k++)
+      db[k] = centi_db(row[k]);
+    fwrite(&db[0], sizeof(int16_t), d_vlen, d_file);
+  }
+  if (fflush(d_file) != 0)
+    GR_LOG_WARN(d_logger, "snapshot: write failed");
+}
+
+/*
+ * Publish (and write) the bucket's statistics and start a new bucket.
+ * Nothing is sent for an empty bucket.  Lock held.
+ */
+void spectrum_occupancy_f_impl::snapshot(double stop) {
+  if (d_frames == 0)
+    return;
+  const int N = d_vlen;
+  const double frames = double(d_frames);
+  std::vector<float> occupancy(N), mean(N);
+  for (int k = 0; k < N; k++) {
+    occupancy[k] = float(d_above[k] / frames);
+    double p = d_power_sum[k] / frames;
+    mean[k] = p > 0 ? float(10.0 * log10(p)) : -HUGE_VALF;
+  }
+  // Percentiles from the cumulative histogram, interpolated within a step
+  std::vector<std::vector<float> > levels(d_percentiles.size(),
+                                          std::vector<float>(N));
+  for (int k = 0; k < N; k++) {
+    const uint32_t *h = &d_hist[size_t(k) * d_hist_bins];
+    for (size_t p = 0; p < d_percentiles.size(); p++) {
+      double target = d_percentiles[p] * frames;
+      double cum = 0;
+      int b = 0;
+      for (; b < d_hist_bins - 1; b++) {
+        if (h[b] && cum + h[b] >= target)
+          break;
+        cum += h[b];
+      }
+      double frac = h[b] ? std::min(1.0, (target - cum) / h[b]) : 0.0;
+      levels[p][k] = float(d_hist_min_db + d_hist_res_db * (b + frac));
+    }
+  }
+
+  pmt::pmt_t lv = pmt::make_vector(levels.size(), pmt::PMT_NIL);
+  for (size_t p = 0; p < levels.size(); p++)
+    pmt::vector_set(lv, p, pmt::init_f32vector(N, levels[p]));
+  pmt::pmt_t msg = pmt::make_dict();
+  msg = pmt::dict_add(msg, pmt::mp("start"), pmt::from_double(d_start));
+  msg = pmt::dict_add(msg, pmt::mp("stop"), pmt::from_double(stop));
+  msg = pmt::dict_add(msg, pmt::mp("frames"), pmt::from_uint64(d_frames));
+  msg = pmt::dict_add(msg, pmt::mp("occupancy"),
+                      pmt::init_f32vector(N, occupancy));
+  msg = pmt::dict_add(msg, pmt::mp("mean"), pmt::init_f32vector(N, mean));
+  msg = pmt::dict_add(msg, pmt::mp("max"), pmt::init_f32vector(N, d_max));
+  msg = pmt::dict_add(msg, pmt::mp("percentiles"),
+                      pmt::init_f32vector(d_percentiles.size(),
+                                          d_percentiles));
+  msg = pmt::dict_add(msg, pmt::mp("levels"), lv);
+  message_port_pub(pmt::mp("snapshot"), msg);
+  if (d_file)
+    write_record(stop, occupancy, mean, levels);
+  clear_bucket();
+}
+
+int spectrum_occupancy_f_impl::work(int noutput_items,
+                                    gr_vector_const_void_star &input_items,
+                                    gr_vector_void_star &output_items) {
+  gr::thread::scoped_lock lock(d_mutex);
+  const float *in = (const float *)input_items[0];
+  const int N = d_vlen;
+  const double now = unix_seconds();
+  if (d_frames > 0 && now - d_start >= d_bucket_seconds)
+    snapshot(now);
+  if (d_frames == 0)
+    d_start = now;
+
+  const float thr = d_threshold_db;
+  const float inv_res = 1.0f / d_hist_res_db;
+  const float ln10_10 = float(M_LN10 / 10.0);
+  for (int i = 0; i < noutput_items; i++) {
+    const float *x = in + size_t(i) * N;
+    uint32_t *h = &d_hist[0];
+    for (int k = 0; k < N; k++, h += d_hist_bins) {
+      const float v = x[k];
+      d_above[k] += v > thr;
+      d_power_sum[k] += std::exp(v * ln10_10);
+      float f = (v - d_hist_min_db) * inv_res;
+      int b = !(f >= 0.0f) ? 0 : f >= d_hist_bins ? d_hist_bins - 1 : int(f);
+      h[b]++;
+    }
+    trace_max_hold(d_max, x, N);
+  }
+  d_frames += noutput_items;
+  return noutput_items;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
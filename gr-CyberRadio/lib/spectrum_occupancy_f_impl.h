@@ -0,0 +1,78 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_SPECTRUM_OCCUPANCY_F_IMPL_H
+#define INCLUDED_CYBERRADIO_SPECTRUM_OCCUPANCY_F_IMPL_H
+
+#include <CyberRadio/spectrum_occupancy_f.h>
+#include <gnuradio/thread/thread.h>
+#include <cstdio>
+
+namespace gr {
+namespace CyberRadio {
+
+class spectrum_occupancy_f_impl : public spectrum_occupancy_f {
+private:
+  int d_vlen;
+  float d_threshold_db;
+  double d_bucket_seconds;
+  std::vector<float> d_percentiles;
+  float d_hist_min_db;
+  float d_hist_res_db;
+  int d_hist_bins;
+  FILE *d_file;
+  // Bucket state
+  double d_start;                   // Unix seconds; 0 before the first frame
+  uint64_t d_frames;
+  std::vector<uint32_t> d_above;
+  std::vector<double> d_power_sum;
+  float *d_max;
+  std::vector<uint32_t> d_hist;     // d_hist_bins per spectrum bin
+  gr::thread::mutex d_mutex;
+
+  void clear_bucket();
+  void snapshot(double stop);
+  void write_record(double stop, const std::vector<float> &occupancy,
+                    const std::vector<float> &mean,
+                    const std::vector<std::vector<float> > &levels);
+
+public:
+  spectrum_occupancy_f_impl(int vlen, double threshold_db,
+                            double bucket_seconds,
+                            const std::vector<float> &percentiles,
+                            const std::string &filename, double hist_min_db,
+                            double hist_max_db, double hist_res_db);
+  ~spectrum_occupancy_f_impl();
+
+  void set_threshold_db(double threshold_db);
+  double threshold_db() const { return d_threshold_db; }
+  void set_bucket_seconds(double seconds);
+  double bucket_seconds() const { return d_bucket_seconds; }
+  void flush();
+
+  bool stop();
+  int work(int noutput_items, gr_vector_const_void_star &input_items,
+           gr_vector_void_star &output_items);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_SPECTRUM_OCCUPANCY_F_IMPL_H */
@@ -0,0 +1,224 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "spectrum_trace_ff_impl.h"
+#include "single_pole_iir_kernels.h"
+#include "trace_kernels.h"
+#include <algorithm>
+#include <cstring>
+#include <gnuradio/io_signature.h>
+#include <stdexcept>
+#include <volk/volk.h>
+
+namespace gr {
+namespace CyberRadio {
+
+spectrum_trace_ff::sptr
+spectrum_trace_ff::make(int vlen, const std::vector<std::string> &modes,
+                        double avg_alpha, double decay) {
+  return gnuradio::get_initial_sptr(
+      new spectrum_trace_ff_impl(vlen, modes, avg_alpha, decay));
+}
+
+spectrum_trace_ff_impl::trace_mode_t
+spectrum_trace_ff_impl::parse_mode(const std::string &name) {
+  if (name == "write")
+    return MODE_WRITE;
+  if (name == "max_hold")
+    return MODE_MAX_HOLD;
+  if (name == "min_hold")
+    return MODE_MIN_HOLD;
+  if (name == "average")
+    return MODE_AVERAGE;
+  if (name == "peak_decay")
+    return MODE_PEAK_DECAY;
+  throw std::invalid_argument("spectrum_trace_ff: unknown mode '" + name +
+                              "'");
+}
+
+std::string spectrum_trace_ff_impl::mode_name(trace_mode_t mode) {
+  switch (mode) {
+  case MODE_MAX_HOLD:
+    return "max_hold";
+  case MODE_MIN_HOLD:
+    return "min_hold";
+  case MODE_AVERAGE:
+    return "average";
+  case MODE_PEAK_DECAY:
+    return "peak_decay";
+  default:
+    return "write";
+  }
+}
+
+/*
+ * The private constructor
+ */
+spectrum_trace_ff_impl::spectrum_trace_ff_impl(
+    int vlen, const std::vector<std::string> &modes, double avg_alpha,
+    double decay)
+    : gr::sync_block("spectrum_trace_ff",
+                     io_signature::make(1, 1, sizeof(float) * vlen),
+                     io_signature::make(1, modes.empty() ? 1 : modes.size(),
+                                        sizeof(float) * vlen)),
+      d_vlen(vlen), d_num_traces(modes.size()),
+      d_primed(modes.size(), false), d_alpha(1.0f), d_decay(0.0f) {
+  if (vlen < 1 || modes.empty())
+    throw std::invalid_argument(
+        "spectrum_trace_ff: vlen must be positive and modes non-empty");
+  for (size_t t = 0; t < modes.size(); t++)
+    d_modes.push_back(parse_mode(modes[t]));
+  d_traces = (float *)volk_malloc(sizeof(float) * d_num_traces * vlen,
+                                  volk_get_alignment());
+  memset(d_traces, 0, sizeof(float) * d_num_traces * vlen);
+  set_avg_alpha(avg_alpha);
+  set_decay(decay);
+  message_port_register_in(pmt::mp("reset"));
+  set_msg_handler(pmt::mp("reset"),
+                  boost::bind(&spectrum_trace_ff_impl::rxResetMsg, this, _1));
+  message_port_register_in(pmt::mp("mode"));
+  set_msg_handler(pmt::mp("mode"),
+                  boost::bind(&spectrum_trace_ff_impl::rxModeMsg, this, _1));
+}
+
+spectrum_trace_ff_impl::~spectrum_trace_ff_impl() { volk_free(d_traces); }
+
+void spectrum_trace_ff_impl::check_trace(int t) const {
+  if (t < 0 || t >= d_num_traces)
+    throw std::out_of_range("spectrum_trace_ff: no such trace");
+}
+
+void spectrum_trace_ff_impl::set_mode(int trace, const std::string &mode) {
+  check_trace(trace);
+  trace_mode_t m = parse_mode(mode);
+  gr::thread::scoped_lock lock(d_mutex);
+  d_modes[trace] = m;
+  d_primed[trace] = false;
+}
+
+std::string spectrum_trace_ff_impl::mode(int trace) const {
+  check_trace(trace);
+  return mode_name(d_modes[trace]);
+}
+
+void spectrum_trace_ff_impl::set_avg_alpha(double alpha) {
+  if (alpha <= 0 || alpha > 1)
+    throw std::out_of_range("Alpha must be in (0, 1]\n");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_alpha = float(alpha);
+}
+
+void spectrum_trace_ff_impl::set_decay(double decay) {
+  if (decay < 0)
+    throw std::out_of_range("spectrum_trace_ff: decay must be >= 0");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_decay = float(decay);
+}
+
+void spectrum_trace_ff_impl::reset(int trace) {
+  gr::thread::scoped_lock lock(d_mutex);
+  if (trace < 0) {
+    d_primed.assign(d_num_traces, false);
+  } else {
+    check_trace(trace);
+    d_primed[trace] = false;
+  }
+}
+
+void spectrum_trace_ff_impl::rxResetMsg(pmt::pmt_t msg) {
+  int trace = pmt::is_integer(msg) ? int(pmt::to_long(msg)) : -1;
+  if (trace >= d_num_traces) {
+    GR_LOG_WARN(d_logger, "reset: no such trace");
+    return;
+  }
+  reset(trace);
+}
+
+void spectrum_trace_ff_impl::rxModeMsg(pmt::pmt_t msg) {
+  pmt::pmt_t trace = pmt::PMT_NIL, mode = pmt::PMT_NIL;
+  if (pmt::is_dict(msg)) {
+    trace = pmt::dict_ref(msg, pmt::mp("trace"), pmt::PMT_NIL);
+    mode = pmt::dict_ref(msg, pmt::mp("mode"), pmt::PMT_NIL);
+  } else if (pmt::is_pair(msg)) {
+    trace = pmt::car(msg);
+    mode = pmt::cdr(msg);
+  }
+  if (!pmt::is_integer(trace) || !pmt::is_symbol(mode)) {
+    GR_LOG_WARN(d_logger, "mode: expected (trace . mode) or "
+                          "{\"trace\": n, \"mode\": mode}");
+    return;
+  }
+  try {
+    set_mode(int(pmt::to_long(trace)), pmt::symbol_to_string(mode));
+  } catch (std::exception &e) {
+    GR_LOG_WARN(d_logger, std::string("mode: ") + e.what());
+  }
+}
+
+int spectrum_trace_ff_impl::work(int noutput_items,
+                                 gr_vector_const_void_star &input_items,
+                                 gr_vector_void_star &output_items) {
+  gr::thread::scoped_lock lock(d_mutex);
+  const int N = d_vlen;
+  const int ntraces = std::min(d_num_traces, int(output_items.size()));
+  const size_t bytes = sizeof(float) * N;
+
+  for (int i = 0; i < noutput_items; i++) {
+    const float *in = (const float *)input_items[0] + i * N;
+    for (int t = 0; t < ntraces; t++) {
+      float *out = (float *)output_items[t] + i * N;
+      float *y = trace(t);
+      if (d_modes[t] == MODE_WRITE) {
+        memcpy(out, in, bytes);
+        continue;
+      }
+      if (!d_primed[t]) {
+        memcpy(y, in, bytes);
+        d_primed[t] = true;
+      } else {
+        switch (d_modes[t]) {
+        case MODE_MAX_HOLD:
+          trace_max_hold(y, in, N);
+          break;
+        case MODE_MIN_HOLD:
+          trace_min_hold(y, in, N);
+          break;
+        case MODE_AVERAGE:
+          single_pole_iir_update(y, NULL, in, d_alpha, N);
+          break;
+        case MODE_PEAK_DECAY:
+          trace_peak_decay(y, in, d_decay, N);
+          break;
+        default:
+          break;
+        }
+      }
+      memcpy(out, y, bytes);
+    }
+  }
+  return noutput_items;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
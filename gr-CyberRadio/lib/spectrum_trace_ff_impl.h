@@ -0,0 +1,77 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_SPECTRUM_TRACE_FF_IMPL_H
+#define INCLUDED_CYBERRADIO_SPECTRUM_TRACE_FF_IMPL_H
+
+#include <CyberRadio/spectrum_trace_ff.h>
+#include <gnuradio/thread/thread.h>
+
+namespace gr {
+namespace CyberRadio {
+
+class spectrum_trace_ff_impl : public spectrum_trace_ff {
+public:
+  enum trace_mode_t {
+    MODE_WRITE,
+    MODE_MAX_HOLD,
+    MODE_MIN_HOLD,
+    MODE_AVERAGE,
+    MODE_PEAK_DECAY
+  };
+  static trace_mode_t parse_mode(const std::string &name);
+  static std::string mode_name(trace_mode_t mode);
+
+private:
+  int d_vlen;
+  int d_num_traces;
+  std::vector<trace_mode_t> d_modes;
+  float *d_traces;             // d_num_traces * d_vlen, contiguous
+  std::vector<bool> d_primed;  // false until the first vector after reset
+  float d_alpha;
+  float d_decay;
+  gr::thread::mutex d_mutex;
+
+  float *trace(int t) const { return d_traces + size_t(t) * d_vlen; }
+  void check_trace(int t) const;
+  void rxResetMsg(pmt::pmt_t msg);
+  void rxModeMsg(pmt::pmt_t msg);
+
+public:
+  spectrum_trace_ff_impl(int vlen, const std::vector<std::string> &modes,
+                         double avg_alpha, double decay);
+  ~spectrum_trace_ff_impl();
+
+  void set_mode(int trace, const std::string &mode);
+  std::string mode(int trace) const;
+  void set_avg_alpha(double alpha);
+  double avg_alpha() const { return d_alpha; }
+  void set_decay(double decay);
+  double decay() const { return d_decay; }
+  void reset(int trace = -1);
+
+  int work(int noutput_items, gr_vector_const_void_star &input_items,
+           gr_vector_void_star &output_items);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_SPECTRUM_TRACE_FF_IMPL_H */
@@ -0,0 +1,267 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "tdoa_correlator_c_impl.h"
+#include <cmath>
+#include <cstring>
+#include <gnuradio/io_signature.h>
+#include <stdexcept>
+#include <volk/volk.h>
+
+namespace gr {
+namespace CyberRadio {
+
+tdoa_correlator_c::sptr tdoa_correlator_c::make(int num_channels,
+                                                int block_len, int hop,
+                                                int max_lag, int integrate,
+                                                bool interpolate, double fs,
+                                                int nthreads) {
+  return gnuradio::get_initial_sptr(
+      new tdoa_correlator_c_impl(num_channels, block_len, hop, max_lag,
+                                 integrate, interpolate, fs, nthreads));
+}
+
+// Smallest power of two of at least n
+static int next_pow2(int n) {
+  int m = 1;
+  while (m < n)
+    m <<= 1;
+  return m;
+}
+
+/*
+ * The private constructor
+ */
+tdoa_correlator_c_impl::tdoa_correlator_c_impl(int num_channels,
+                                               int block_len, int hop,
+                                               int max_lag, int integrate,
+                                               bool interpolate, double fs,
+                                               int nthreads)
+    : gr::sync_decimator(
+          "tdoa_correlator_c",
+          io_signature::make(num_channels, num_channels, sizeof(gr_complex)),
+          io_signature::make(0, 0, 0), hop > 0 ? hop : 1),
+      d_num_channels(num_channels),
+      d_num_pairs(num_channels * (num_channels - 1) / 2),
+      d_block_len(block_len), d_hop(hop), d_max_lag(max_lag),
+      d_fft_size(0), d_integrate(1), d_interpolate(interpolate),
+      d_fs(1.0), d_fwd(NULL), d_inv(NULL), d_prod(NULL), d_mag(NULL),
+      d_blocks(0), d_reports(0) {
+  if (num_channels < 2)
+    throw std::invalid_argument(
+        "tdoa_correlator_c: num_channels must be at least 2");
+  if (block_len < 2 || hop < 1)
+    throw std::invalid_argument(
+        "tdoa_correlator_c: block_len must be at least 2 and hop positive");
+  if (max_lag < 1 || max_lag >= block_len)
+    throw std::invalid_argument(
+        "tdoa_correlator_c: max_lag must be in [1, block_len)");
+  set_integrate(integrate);
+  set_fs(fs);
+  // Circular lag t picks up linear lag t - fft_size as well, which is zero
+  // for |t| <= max_lag once fft_size >= block_len + max_lag
+  d_fft_size = next_pow2(block_len + max_lag);
+  d_fwd = new fft_batch(d_fft_size, num_channels, true, nthreads);
+  d_inv = new fft_batch(d_fft_size, d_num_pairs, false, nthreads);
+  size_t align = volk_get_alignment();
+  d_prod = (gr_complex *)volk_malloc(sizeof(gr_complex) * d_fft_size, align);
+  d_mag = (float *)volk_malloc(sizeof(float) * (2 * max_lag + 1), align);
+  d_energy.assign(num_channels, 0.0);
+  d_delay.assign(d_num_pairs, 0.0f);
+  d_peak.assign(d_num_pairs, 0.0f);
+  d_phase.assign(d_num_pairs, 0.0f);
+  // Each output item's block ends at the last sample of its hop
+  set_history(block_len > hop ? block_len - hop + 1 : 1);
+  set_tag_propagation_policy(TPP_DONT);
+  message_port_register_out(pmt::mp("tdoa"));
+  message_port_register_in(pmt::mp("reset"));
+  set_msg_handler(pmt::mp("reset"),
+                  boost::bind(&tdoa_correlator_c_impl::rxResetMsg, this, _1));
+}
+
+tdoa_correlator_c_impl::~tdoa_correlator_c_impl() {
+  delete d_fwd;
+  delete d_inv;
+  volk_free(d_prod);
+  volk_free(d_mag);
+}
+
+void tdoa_correlator_c_impl::set_integrate(int blocks) {
+  if (blocks < 1)
+    throw std::out_of_range("tdoa_correlator_c: integrate must be positive");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_integrate = blocks;
+}
+
+void tdoa_correlator_c_impl::set_interpolate(bool interpolate) {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_interpolate = interpolate;
+}
+
+void tdoa_correlator_c_impl::set_fs(double fs) {
+  if (!(fs > 0))
+    throw std::out_of_range("tdoa_correlator_c: fs must be positive");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_fs = fs;
+}
+
+std::vector<float> tdoa_correlator_c_impl::delays() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return d_delay;
+}
+
+std::vector<float> tdoa_correlator_c_impl::peaks() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return d_peak;
+}
+
+std::vector<float> tdoa_correlator_c_impl::phases() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return d_phase;
+}
+
+void tdoa_correlator_c_impl::reset() {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_blocks = 0;
+  d_energy.assign(d_num_channels, 0.0);
+}
+
+void tdoa_correlator_c_impl::set_nthreads(int n) {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_fwd->set_nthreads(n);
+  d_inv->set_nthreads(n);
+}
+
+void tdoa_correlator_c_impl::rxResetMsg(pmt::pmt_t msg) { reset(); }
+
+/*
+ * Inverse transform the summed cross spectra, find each pair's peak and
+ * publish.  Called with d_mutex held.
+ */
+void tdoa_correlator_c_impl::report() {
+  const int M = d_fft_size;
+  const int K = d_max_lag;
+  d_inv->execute();
+  std::vector<int> pairs;
+  int p = 0;
+  for (int a = 0; a < d_num_channels; a++) {
+    for (int b = a + 1; b < d_num_channels; b++, p++) {
+      const gr_complex *r = d_inv->get_outbuf(p);
+      // Lags -K .. K in order
+      volk_32fc_magnitude_squared_32f(d_mag, r + M - K, K);
+      volk_32fc_magnitude_squared_32f(d_mag + K, r, K + 1);
+      uint32_t index = 0;
+      volk_32f_index_max_32u(&index, d_mag, 2 * K + 1);
+      const int lag = int(index) - K;
+      const gr_complex r0 = r[(lag + M) % M];
+      float y0 = std::abs(r0);
+      float delay = float(lag);
+      if (d_interpolate && lag > -K && lag < K) {
+        float ym = std::abs(r[(lag - 1 + M) % M]);
+        float yp = std::abs(r[(lag + 1) % M]);
+        float den = ym - 2.0f * y0 + yp;
+        if (den < 0) {
+          float delta = 0.5f * (ym - yp) / den;
+          delay += delta;
+          y0 -= 0.25f * (ym - yp) * delta;
+        }
+      }
+      // The unnormalized inverse FFT scales the correlation by fft_size
+      double norm = double(M) * sqrt(d_energy[a] * d_energy[b]);
+      d_delay[p] = delay;
+      d_peak[p] = norm > 0 ? float(y0 / norm) : 0.0f;
+      d_phase[p] = std::arg(r0);
+      pairs.push_back(a);
+      pairs.push_back(b);
+    }
+  }
+  std::vector<float> tdoa(d_num_pairs);
+  for (int q = 0; q < d_num_pairs; q++)
+    tdoa[q] = float(d_delay[q] / d_fs);
+
+  pmt::pmt_t msg = pmt::make_dict();
+  msg = pmt::dict_add(msg, pmt::mp("delay"),
+                      pmt::init_f32vector(d_delay.size(), d_delay));
+  msg = pmt::dict_add(msg, pmt::mp("tdoa"),
+                      pmt::init_f32vector(tdoa.size(), tdoa));
+  msg = pmt::dict_add(msg, pmt::mp("peak"),
+                      pmt::init_f32vector(d_peak.size(), d_peak));
+  msg = pmt::dict_add(msg, pmt::mp("phase"),
+                      pmt::init_f32vector(d_phase.size(), d_phase));
+  msg = pmt::dict_add(msg, pmt::mp("pairs"),
+                      pmt::init_s32vector(pairs.size(), pairs));
+  msg = pmt::dict_add(msg, pmt::mp("report"), pmt::from_uint64(d_reports));
+  message_port_pub(pmt::mp("tdoa"), msg);
+
+  d_reports++;
+  d_blocks = 0;
+  d_energy.assign(d_num_channels, 0.0);
+}
+
+int tdoa_correlator_c_impl::work(int noutput_items,
+                                 gr_vector_const_void_star &input_items,
+                                 gr_vector_void_star &output_items) {
+  gr::thread::scoped_lock lock(d_mutex);
+  const int L = d_block_len;
+  const int M = d_fft_size;
+  // Offset of output item 0's block from the start of the input buffer
+  const int skip = int(history()) - 1 + d_hop - L;
+
+  for (int i = 0; i < noutput_items; i++) {
+    // The padding beyond block_len is zeroed once; out-of-place complex
+    // plans leave their input alone
+    for (int c = 0; c < d_num_channels; c++) {
+      const gr_complex *x =
+          (const gr_complex *)input_items[c] + size_t(i) * d_hop + skip;
+      memcpy(d_fwd->get_inbuf(c), x, sizeof(gr_complex) * L);
+      gr_complex e;
+      volk_32fc_x2_conjugate_dot_prod_32fc(&e, x, x, L);
+      d_energy[c] += e.real();
+    }
+    d_fwd->execute();
+
+    int p = 0;
+    for (int a = 0; a < d_num_channels; a++) {
+      const gr_complex *xa = d_fwd->get_outbuf(a);
+      for (int b = a + 1; b < d_num_channels; b++, p++) {
+        gr_complex *sum = d_inv->get_inbuf(p);
+        if (d_blocks == 0) {
+          volk_32fc_x2_multiply_conjugate_32fc(sum, xa, d_fwd->get_outbuf(b),
+                                               M);
+        } else {
+          volk_32fc_x2_multiply_conjugate_32fc(d_prod, xa,
+                                               d_fwd->get_outbuf(b), M);
+          volk_32f_x2_add_32f((float *)sum, (const float *)sum,
+                              (const float *)d_prod, 2 * M);
+        }
+      }
+    }
+    if (++d_blocks >= d_integrate)
+      report();
+  }
+  return noutput_items;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
@@ -0,0 +1,84 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_TDOA_CORRELATOR_C_IMPL_H
+#define INCLUDED_CYBERRADIO_TDOA_CORRELATOR_C_IMPL_H
+
+#include <CyberRadio/tdoa_correlator_c.h>
+#include "fft_batch.h"
+#include <gnuradio/thread/thread.h>
+
+namespace gr {
+namespace CyberRadio {
+
+class tdoa_correlator_c_impl : public tdoa_correlator_c {
+private:
+  int d_num_channels;
+  int d_num_pairs;
+  int d_block_len;
+  int d_hop;
+  int d_max_lag;
+  int d_fft_size;
+  int d_integrate;
+  bool d_interpolate;
+  double d_fs;
+  fft_batch *d_fwd;  // transform c is channel c, zero padded
+  fft_batch *d_inv;  // transform p is pair p; also the cross-spectrum sum
+  gr_complex *d_prod;
+  float *d_mag;
+  std::vector<double> d_energy;  // per channel, over the report
+  int d_blocks;                  // blocks summed into the current report
+  uint64_t d_reports;
+  std::vector<float> d_delay;
+  std::vector<float> d_peak;
+  std::vector<float> d_phase;
+  mutable gr::thread::mutex d_mutex;
+
+  void report();
+  void rxResetMsg(pmt::pmt_t msg);
+
+public:
+  tdoa_correlator_c_impl(int num_channels, int block_len, int hop,
+                         int max_lag, int integrate, bool interpolate,
+                         double fs, int nthreads);
+  ~tdoa_correlator_c_impl();
+
+  void set_integrate(int blocks);
+  int integrate() const { return d_integrate; }
+  void set_interpolate(bool interpolate);
+  bool interpolate() const { return d_interpolate; }
+  void set_fs(double fs);
+  double fs() const { return d_fs; }
+  int fft_size() const { return d_fft_size; }
+  std::vector<float> delays() const;
+  std::vector<float> peaks() const;
+  std::vector<float> phases() const;
+  void reset();
+  void set_nthreads(int n);
+  int nthreads() const { return d_fwd->nthreads(); }
+
+  int work(int noutput_items, gr_vector_const_void_star &input_items,
+           gr_vector_void_star &output_items);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_TDOA_CORRELATOR_C_IMPL_H */
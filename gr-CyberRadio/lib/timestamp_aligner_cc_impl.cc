@@ -0,0 +1,343 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "timestamp_aligner_cc_impl.h"
+#include <algorithm>
+#include <climits>
+#include <cmath>
+#include <cstring>
+#include <gnuradio/io_signature.h>
+#include <map>
+#include <stdexcept>
+
+namespace gr {
+namespace CyberRadio {
+
+timestamp_aligner_cc::sptr timestamp_aligner_cc::make(int num_streams,
+                                                      double fs,
+                                                      double frac_rate,
+                                                      int tolerance) {
+  return gnuradio::get_initial_sptr(
+      new timestamp_aligner_cc_impl(num_streams, fs, frac_rate, tolerance));
+}
+
+/*
+ * The private constructor
+ */
+timestamp_aligner_cc_impl::timestamp_aligner_cc_impl(int num_streams,
+                                                     double fs,
+                                                     double frac_rate,
+                                                     int tolerance)
+    : gr::block(
+          "timestamp_aligner_cc",
+          io_signature::make(num_streams, num_streams, sizeof(gr_complex)),
+          io_signature::make(num_streams, num_streams, sizeof(gr_complex))),
+      d_num_streams(num_streams), d_fs(1.0), d_frac_rate(frac_rate),
+      d_tolerance(0), d_have_epoch(false), d_epoch(0), d_out_time(0),
+      d_aligned(false) {
+  if (num_streams < 1)
+    throw std::invalid_argument(
+        "timestamp_aligner_cc: num_streams must be positive");
+  if (!(frac_rate > 0))
+    throw std::invalid_argument(
+        "timestamp_aligner_cc: frac_rate must be positive");
+  set_fs(fs);
+  set_tolerance(tolerance);
+  d_timed.assign(num_streams, false);
+  d_in_time.assign(num_streams, 0);
+  d_error.assign(num_streams, 0);
+  d_inserted.assign(num_streams, 0);
+  d_dropped.assign(num_streams, 0);
+  set_tag_propagation_policy(TPP_DONT);
+  message_port_register_out(pmt::mp("alignment"));
+  message_port_register_in(pmt::mp("reset"));
+  set_msg_handler(pmt::mp("reset"), boost::bind(
+                                        &timestamp_aligner_cc_impl::rxResetMsg,
+                                        this, _1));
+}
+
+timestamp_aligner_cc_impl::~timestamp_aligner_cc_impl() {}
+
+void timestamp_aligner_cc_impl::set_fs(double fs) {
+  if (!(fs > 0))
+    throw std::out_of_range("timestamp_aligner_cc: fs must be positive");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_fs = fs;
+}
+
+void timestamp_aligner_cc_impl::set_tolerance(int tolerance) {
+  if (tolerance < 0)
+    throw std::out_of_range(
+        "timestamp_aligner_cc: tolerance must not be negative");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_tolerance = tolerance;
+}
+
+bool timestamp_aligner_cc_impl::aligned() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return d_aligned;
+}
+
+std::vector<int> timestamp_aligner_cc_impl::alignment_error() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return d_error;
+}
+
+uint64_t timestamp_aligner_cc_impl::samples_inserted(int stream) const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return d_inserted.at(stream);
+}
+
+uint64_t timestamp_aligner_cc_impl::samples_dropped(int stream) const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return d_dropped.at(stream);
+}
+
+void timestamp_aligner_cc_impl::reset() {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_have_epoch = false;
+  d_timed.assign(d_num_streams, false);
+  d_aligned = false;
+}
+
+void timestamp_aligner_cc_impl::rxResetMsg(pmt::pmt_t msg) { reset(); }
+
+/*
+ * The timestamps among this call's ninput samples of \p stream, as sample
+ * times counted from the first timestamp's whole second, which keeps them
+ * exact in a double for as long as the flowgraph runs.
+ */
+std::vector<timestamp_aligner_cc_impl::stamp>
+timestamp_aligner_cc_impl::timestamps(int stream, int ninput) {
+  const uint64_t start = nitems_read(stream);
+  std::vector<gr::tag_t> tags;
+  get_tags_in_range(tags, stream, start, start + ninput);
+  static const pmt::pmt_t TS = pmt::mp("timestamp");
+  static const pmt::pmt_t TS_INT = pmt::mp("timestamp_int");
+  static const pmt::pmt_t TS_FRAC = pmt::mp("timestamp_frac");
+  // (integer, fractional) by sample; -1 until seen
+  std::map<uint64_t, std::pair<int64_t, int64_t> > found;
+  for (size_t t = 0; t < tags.size(); t++) {
+    const pmt::pmt_t &v = tags[t].value;
+    std::pair<int64_t, int64_t> &ts =
+        found.insert(std::make_pair(tags[t].offset,
+                                    std::make_pair(int64_t(-1), int64_t(-1))))
+            .first->second;
+    if (pmt::eqv(tags[t].key, TS) && pmt::is_pair(v)) {
+      ts.first = pmt::to_long(pmt::car(v));
+      pmt::pmt_t frac = pmt::cdr(v);
+      ts.second = pmt::is_uint64(frac) ? int64_t(pmt::to_uint64(frac))
+                                       : int64_t(pmt::to_long(frac));
+    } else if (pmt::eqv(tags[t].key, TS_INT)) {
+      ts.first = pmt::to_long(v);
+    } else if (pmt::eqv(tags[t].key, TS_FRAC)) {
+      ts.second = pmt::is_uint64(v) ? int64_t(pmt::to_uint64(v))
+                                    : int64_t(pmt::to_long(v));
+    }
+  }
+  std::vector<stamp> stamps;
+  for (std::map<uint64_t, std::pair<int64_t, int64_t> >::const_iterator it =
+           found.begin();
+       it != found.end(); ++it) {
+    if (it->second.first < 0 || it->second.second < 0)
+      continue;
+    if (!d_have_epoch) {
+      d_epoch = it->second.first;
+      d_have_epoch = true;
+    }
+    stamp s;
+    s.rel = int(it->first - start);
+    s.time = std::llround(double(it->second.first - d_epoch) * d_fs +
+                          double(it->second.second) * d_fs / d_frac_rate);
+    stamps.push_back(s);
+  }
+  return stamps;
+}
+
+/*
+ * Run \p stream forward from the next output time for up to nmax outputs,
+ * returning how many it makes and setting *consumed.  Input behind the
+ * output time is dropped even once nmax is reached, so a stream catching
+ * up never stalls the others.  With \p out null nothing is written and no
+ * state changes, which is how general_work() finds how far every stream
+ * can go before committing any of them.
+ */
+int timestamp_aligner_cc_impl::advance(int stream, const gr_complex *in,
+                                       int ninput,
+                                       const std::vector<stamp> &stamps,
+                                       gr_complex *out, int nmax,
+                                       int *consumed) {
+  const bool commit = out != NULL;
+  const uint64_t in_start = nitems_read(stream);
+  const uint64_t out_start = nitems_written(stream);
+  std::vector<gr::tag_t> tags;
+  if (commit)
+    get_tags_in_range(tags, stream, in_start, in_start + ninput);
+  size_t next_tag = 0;
+
+  int64_t t_out = d_out_time;
+  int64_t t_in = d_in_time[stream];
+  uint64_t inserted = 0, dropped = 0;
+  int pos = 0, produced = 0;
+  size_t s = 0;
+  for (;;) {
+    for (; s < stamps.size() && stamps[s].rel <= pos; s++) {
+      int64_t err = stamps[s].time - t_in;
+      if (commit)
+        d_error[stream] =
+            int(std::max<int64_t>(INT_MIN, std::min<int64_t>(INT_MAX, err)));
+      if (err >= -d_tolerance && err <= d_tolerance)
+        continue;
+      t_in = stamps[s].time;
+      if (commit) {
+        pmt::pmt_t msg = pmt::make_dict();
+        msg = pmt::dict_add(msg, pmt::mp("event"),
+                            pmt::mp(err > 0 ? "gap" : "slip"));
+        msg = pmt::dict_add(msg, pmt::mp("stream"), pmt::from_long(stream));
+        msg = pmt::dict_add(msg, pmt::mp("error"), pmt::from_long(err));
+        msg = pmt::dict_add(msg, pmt::mp("offset"),
+                            pmt::from_uint64(out_start + produced));
+        message_port_pub(pmt::mp("alignment"), msg);
+      }
+    }
+    // Runs stop at the next timestamp so it is checked at its own sample
+    const int next = s < stamps.size() ? stamps[s].rel : ninput;
+    if (t_in < t_out) {
+      int k = int(std::min<int64_t>(t_out - t_in, next - pos));
+      if (k == 0)
+        break;
+      pos += k;
+      t_in += k;
+      dropped += k;
+      continue;
+    }
+    if (produced == nmax)
+      break;
+    if (t_in > t_out) {
+      int k = int(std::min<int64_t>(t_in - t_out, nmax - produced));
+      if (commit)
+        std::fill(out + produced, out + produced + k, gr_complex(0));
+      produced += k;
+      t_out += k;
+      inserted += k;
+      continue;
+    }
+    int k = std::min(nmax - produced, next - pos);
+    if (k == 0)
+      break;
+    if (commit) {
+      memcpy(out + produced, in + pos, sizeof(gr_complex) * k);
+      for (; next_tag < tags.size() &&
+             tags[next_tag].offset < in_start + pos + k;
+           next_tag++) {
+        const gr::tag_t &tag = tags[next_tag];
+        if (tag.offset < in_start + pos)
+          continue;
+        add_item_tag(stream, out_start + produced + (tag.offset - in_start) -
+                                 pos,
+                     tag.key, tag.value, tag.srcid);
+      }
+    }
+    pos += k;
+    produced += k;
+    t_out += k;
+    t_in += k;
+  }
+  if (commit) {
+    d_in_time[stream] = t_in;
+    d_inserted[stream] += inserted;
+    d_dropped[stream] += dropped;
+  }
+  *consumed = pos;
+  return produced;
+}
+
+void timestamp_aligner_cc_impl::forecast(
+    int noutput_items, gr_vector_int &ninput_items_required) {
+  for (size_t i = 0; i < ninput_items_required.size(); i++)
+    ninput_items_required[i] = noutput_items;
+}
+
+int timestamp_aligner_cc_impl::general_work(
+    int noutput_items, gr_vector_int &ninput_items,
+    gr_vector_const_void_star &input_items, gr_vector_void_star &output_items) {
+  gr::thread::scoped_lock lock(d_mutex);
+  const int S = d_num_streams;
+
+  if (!d_aligned) {
+    // Drop each untimed stream up to its first timestamp
+    bool all = true;
+    for (int i = 0; i < S; i++) {
+      if (d_timed[i])
+        continue;
+      std::vector<stamp> stamps = timestamps(i, ninput_items[i]);
+      if (stamps.empty()) {
+        d_dropped[i] += ninput_items[i];
+        consume(i, ninput_items[i]);
+        all = false;
+        continue;
+      }
+      d_dropped[i] += stamps[0].rel;
+      consume(i, stamps[0].rel);
+      d_in_time[i] = stamps[0].time;
+      d_timed[i] = true;
+    }
+    if (!all)
+      return 0;
+    // Start at the latest stream; advance() drops the others' lead-in
+    d_out_time = *std::max_element(d_in_time.begin(), d_in_time.end());
+    std::vector<int> lead(S);
+    for (int i = 0; i < S; i++)
+      lead[i] = int(std::min<int64_t>(INT_MAX, d_out_time - d_in_time[i]));
+    pmt::pmt_t msg = pmt::make_dict();
+    msg = pmt::dict_add(msg, pmt::mp("event"), pmt::mp("start"));
+    msg = pmt::dict_add(msg, pmt::mp("dropped"),
+                        pmt::init_s32vector(lead.size(), lead));
+    message_port_pub(pmt::mp("alignment"), msg);
+    d_error.assign(S, 0);
+    d_aligned = true;
+    return 0;
+  }
+
+  std::vector<std::vector<stamp> > stamps(S);
+  int n = noutput_items;
+  for (int i = 0; i < S; i++) {
+    int consumed;
+    stamps[i] = timestamps(i, ninput_items[i]);
+    n = std::min(n, advance(i, (const gr_complex *)input_items[i],
+                            ninput_items[i], stamps[i], NULL, noutput_items,
+                            &consumed));
+  }
+  for (int i = 0; i < S; i++) {
+    int consumed;
+    advance(i, (const gr_complex *)input_items[i], ninput_items[i],
+            stamps[i], (gr_complex *)output_items[i], n, &consumed);
+    consume(i, consumed);
+  }
+  d_out_time += n;
+  return n;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
@@ -0,0 +1,83 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_TIMESTAMP_ALIGNER_CC_IMPL_H
+#define INCLUDED_CYBERRADIO_TIMESTAMP_ALIGNER_CC_IMPL_H
+
+#include <CyberRadio/timestamp_aligner_cc.h>
+#include <gnuradio/thread/thread.h>
+
+namespace gr {
+namespace CyberRadio {
+
+class timestamp_aligner_cc_impl : public timestamp_aligner_cc {
+private:
+  //! A timestamp at input sample rel of this call, as a sample time
+  struct stamp {
+    int rel;
+    int64_t time;
+  };
+
+  int d_num_streams;
+  double d_fs;
+  double d_frac_rate;
+  int d_tolerance;
+  bool d_have_epoch;
+  int64_t d_epoch;              // integer seconds sample times count from
+  std::vector<bool> d_timed;    // stream has had a timestamp
+  std::vector<int64_t> d_in_time;  // time of each stream's next input
+  int64_t d_out_time;           // time of the next output, all streams
+  bool d_aligned;
+  std::vector<int> d_error;
+  std::vector<uint64_t> d_inserted;
+  std::vector<uint64_t> d_dropped;
+  mutable gr::thread::mutex d_mutex;
+
+  std::vector<stamp> timestamps(int stream, int ninput);
+  int advance(int stream, const gr_complex *in, int ninput,
+              const std::vector<stamp> &stamps, gr_complex *out, int nmax,
+              int *consumed);
+  void rxResetMsg(pmt::pmt_t msg);
+
+public:
+  timestamp_aligner_cc_impl(int num_streams, double fs, double frac_rate,
+                            int tolerance);
+  ~timestamp_aligner_cc_impl();
+
+  void set_fs(double fs);
+  double fs() const { return d_fs; }
+  void set_tolerance(int tolerance);
+  int tolerance() const { return d_tolerance; }
+  bool aligned() const;
+  std::vector<int> alignment_error() const;
+  uint64_t samples_inserted(int stream) const;
+  uint64_t samples_dropped(int stream) const;
+  void reset();
+
+  void forecast(int noutput_items, gr_vector_int &ninput_items_required);
+  int general_work(int noutput_items, gr_vector_int &ninput_items,
+                   gr_vector_const_void_star &input_items,
+                   gr_vector_void_star &output_items);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_TIMESTAMP_ALIGNER_CC_IMPL_H */
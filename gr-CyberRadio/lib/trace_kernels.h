@@ -0,0 +1,124 @@
+/* -*- c++ -*- */
+/***************************************************************************
+ * \file trace_kernels.h
+ *
+ * \brief In-place element-wise max/min hold, decaying peak hold and
+ *        streaming quantile tracking.
+ *
+ * \copyright Copyright (c) 2026 CyberRadio Solutions, Inc.
+ *
+ */
+
+#ifndef INCLUDED_CYBERRADIO_TRACE_KERNELS_H
+#define INCLUDED_CYBERRADIO_TRACE_KERNELS_H
+
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+
+namespace gr {
+namespace CyberRadio {
+
+#if defined(__GNUC__)
+typedef float trace_v8sf __attribute__((vector_size(32)));
+typedef int32_t trace_v8si __attribute__((vector_size(32)));
+// Lane-wise (mask ? a : b).  A macro rather than a function, so no 32-byte
+// vectors cross a call boundary when AVX is not enabled.
+#define TRACE_SELECT(mask, a, b)                                               \
+  ((trace_v8sf)(((trace_v8si)(a) & (mask)) | ((trace_v8si)(b) & ~(mask))))
+#endif
+
+//! y[k] = max(y[k], x[k]) for k in [0, n)
+inline void trace_max_hold(float *y, const float *x, size_t n) {
+  size_t k = 0;
+#if defined(__GNUC__)
+  for (; k + 8 <= n; k += 8) {
+    trace_v8sf vy, vx;
+    memcpy(&vy, y + k, sizeof(vy));
+    memcpy(&vx, x + k, sizeof(vx));
+    vy = TRACE_SELECT((trace_v8si)(vx > vy), vx, vy);
+    memcpy(y + k, &vy, sizeof(vy));
+  }
+#endif
+  for (; k < n; k++)
+    if (x[k] > y[k])
+      y[k] = x[k];
+}
+
+//! y[k] = min(y[k], x[k]) for k in [0, n)
+inline void trace_min_hold(float *y, const float *x, size_t n) {
+  size_t k = 0;
+#if defined(__GNUC__)
+  for (; k + 8 <= n; k += 8) {
+    trace_v8sf vy, vx;
+    memcpy(&vy, y + k, sizeof(vy));
+    memcpy(&vx, x + k, sizeof(vx));
+    vy = TRACE_SELECT((trace_v8si)(vx < vy), vx, vy);
+    memcpy(y + k, &vy, sizeof(vy));
+  }
+#endif
+  for (; k < n; k++)
+    if (x[k] < y[k])
+      y[k] = x[k];
+}
+
+/*!
+ * \brief y[k] = max(y[k] - decay, x[k]) for k in [0, n).
+ *
+ * On a dB trace a constant step down is an exponential decay of the held
+ * power, so peaks fade at \p decay dB per update instead of holding forever.
+ */
+inline void trace_peak_decay(float *y, const float *x, float decay,
+                             size_t n) {
+  size_t k = 0;
+#if defined(__GNUC__)
+  const trace_v8sf d = {decay, decay, decay, decay,
+                        decay, decay, decay, decay};
+  for (; k + 8 <= n; k += 8) {
+    trace_v8sf vy, vx;
+    memcpy(&vy, y + k, sizeof(vy));
+    memcpy(&vx, x + k, sizeof(vx));
+    vy -= d;
+    vy = TRACE_SELECT((trace_v8si)(vx > vy), vx, vy);
+    memcpy(y + k, &vy, sizeof(vy));
+  }
+#endif
+  for (; k < n; k++) {
+    float v = y[k] - decay;
+    y[k] = (x[k] > v) ? x[k] : v;
+  }
+}
+
+/*!
+ * \brief q[k] += (x[k] < q[k]) ? -down : up for k in [0, n).
+ *
+ * Stochastic-approximation quantile tracking: each update moves the
+ * estimate toward the input by a fixed step, and it settles where steps up
+ * and down balance, P(x < q) = up / (up + down).  For the p quantile with a
+ * step of s per update use up = s*p, down = s*(1-p).  One compare per bin,
+ * no stored history, so a per-bin percentile of a spectrum costs about as
+ * much as a max hold.
+ */
+inline void trace_quantile_track(float *q, const float *x, float up,
+                                 float down, size_t n) {
+  size_t k = 0;
+#if defined(__GNUC__)
+  const trace_v8sf u = {up, up, up, up, up, up, up, up};
+  const trace_v8sf d = {-down, -down, -down, -down,
+                        -down, -down, -down, -down};
+  for (; k + 8 <= n; k += 8) {
+    trace_v8sf vq, vx;
+    memcpy(&vq, q + k, sizeof(vq));
+    memcpy(&vx, x + k, sizeof(vx));
+    vq += TRACE_SELECT((trace_v8si)(vx < vq), d, u);
+    memcpy(q + k, &vq, sizeof(vq));
+  }
+#endif
+  for (; k < n; k++)
+    q[k] += (x[k] < q[k]) ? -down : up;
+}
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_TRACE_KERNELS_H */
@@ -0,0 +1,177 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "vector_integrate_ff_impl.h"
+#include "trace_kernels.h"
+#include <cmath>
+#include <cstring>
+#include <gnuradio/io_signature.h>
+#include <stdexcept>
+#include <volk/volk.h>
+
+namespace gr {
+namespace CyberRadio {
+
+vector_integrate_ff::sptr vector_integrate_ff::make(int vlen, int k,
+                                                    const std::string &mode) {
+  return gnuradio::get_initial_sptr(
+      new vector_integrate_ff_impl(vlen, k, mode));
+}
+
+vector_integrate_ff_impl::integrate_mode_t
+vector_integrate_ff_impl::parse_mode(const std::string &name) {
+  if (name == "mean")
+    return MODE_MEAN;
+  if (name == "max")
+    return MODE_MAX;
+  if (name == "min")
+    return MODE_MIN;
+  throw std::invalid_argument("vector_integrate_ff: unknown mode '" + name +
+                              "'");
+}
+
+std::string vector_integrate_ff_impl::mode_name(integrate_mode_t mode) {
+  switch (mode) {
+  case MODE_MAX:
+    return "max";
+  case MODE_MIN:
+    return "min";
+  default:
+    return "mean";
+  }
+}
+
+/*
+ * The private constructor
+ */
+vector_integrate_ff_impl::vector_integrate_ff_impl(int vlen, int k,
+                                                   const std::string &mode)
+    : gr::block("vector_integrate_ff",
+                io_signature::make(1, 1, sizeof(float) * vlen),
+                io_signature::make(1, 1, sizeof(float) * vlen)),
+      d_vlen(vlen), d_k(1), d_mode(parse_mode(mode)), d_count(0) {
+  if (vlen < 1)
+    throw std::invalid_argument("vector_integrate_ff: vlen must be positive");
+  d_acc = (float *)volk_malloc(sizeof(float) * vlen, volk_get_alignment());
+  set_k(k);
+  message_port_register_in(pmt::mp("k"));
+  set_msg_handler(pmt::mp("k"),
+                  boost::bind(&vector_integrate_ff_impl::rxKMsg, this, _1));
+}
+
+vector_integrate_ff_impl::~vector_integrate_ff_impl() { volk_free(d_acc); }
+
+void vector_integrate_ff_impl::set_k(int k) {
+  if (k < 1)
+    throw std::out_of_range("vector_integrate_ff: k must be positive");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_k = k;
+  set_relative_rate(1.0 / k);
+}
+
+void vector_integrate_ff_impl::set_update_period(double period,
+                                                 double frame_rate) {
+  if (period <= 0 || frame_rate <= 0)
+    throw std::out_of_range(
+        "vector_integrate_ff: period and frame_rate must be positive");
+  double k = std::round(period * frame_rate);
+  set_k(k < 1 ? 1 : k > 1e9 ? 1000000000 : int(k));
+}
+
+void vector_integrate_ff_impl::set_mode(const std::string &mode) {
+  integrate_mode_t m = parse_mode(mode);
+  gr::thread::scoped_lock lock(d_mutex);
+  if (m != d_mode)
+    d_count = 0;
+  d_mode = m;
+}
+
+std::string vector_integrate_ff_impl::mode() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  return mode_name(d_mode);
+}
+
+void vector_integrate_ff_impl::rxKMsg(pmt::pmt_t msg) {
+  if (!pmt::is_integer(msg)) {
+    GR_LOG_WARN(d_logger, "k: expected an integer");
+    return;
+  }
+  try {
+    set_k(int(pmt::to_long(msg)));
+  } catch (std::exception &e) {
+    GR_LOG_WARN(d_logger, std::string("k: ") + e.what());
+  }
+}
+
+void vector_integrate_ff_impl::forecast(int noutput_items,
+                                        gr_vector_int &ninput_items_required) {
+  // general_work() integrates across calls, so ask for no more than the
+  // buffers sized at construction can hold, whatever k is now
+  ninput_items_required[0] = noutput_items;
+}
+
+int vector_integrate_ff_impl::general_work(
+    int noutput_items, gr_vector_int &ninput_items,
+    gr_vector_const_void_star &input_items, gr_vector_void_star &output_items) {
+  gr::thread::scoped_lock lock(d_mutex);
+  const float *in = (const float *)input_items[0];
+  float *out = (float *)output_items[0];
+  const int N = d_vlen;
+  const int nin = ninput_items[0];
+  int consumed = 0, produced = 0;
+
+  while (consumed < nin && produced < noutput_items) {
+    const float *x = in + size_t(consumed) * N;
+    consumed++;
+    if (d_count == 0) {
+      memcpy(d_acc, x, sizeof(float) * N);
+    } else {
+      switch (d_mode) {
+      case MODE_MAX:
+        trace_max_hold(d_acc, x, N);
+        break;
+      case MODE_MIN:
+        trace_min_hold(d_acc, x, N);
+        break;
+      default:
+        volk_32f_x2_add_32f(d_acc, d_acc, x, N);
+        break;
+      }
+    }
+    if (++d_count < d_k)
+      continue;
+    float *y = out + size_t(produced) * N;
+    if (d_mode == MODE_MEAN)
+      volk_32f_s32f_multiply_32f(y, d_acc, 1.0f / d_count, N);
+    else
+      memcpy(y, d_acc, sizeof(float) * N);
+    produced++;
+    d_count = 0;
+  }
+  consume_each(consumed);
+  return produced;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
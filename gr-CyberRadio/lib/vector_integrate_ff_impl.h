@@ -0,0 +1,65 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_VECTOR_INTEGRATE_FF_IMPL_H
+#define INCLUDED_CYBERRADIO_VECTOR_INTEGRATE_FF_IMPL_H
+
+#include <CyberRadio/vector_integrate_ff.h>
+#include <gnuradio/thread/thread.h>
+
+namespace gr {
+namespace CyberRadio {
+
+class vector_integrate_ff_impl : public vector_integrate_ff {
+public:
+  enum integrate_mode_t { MODE_MEAN, MODE_MAX, MODE_MIN };
+  static integrate_mode_t parse_mode(const std::string &name);
+  static std::string mode_name(integrate_mode_t mode);
+
+private:
+  int d_vlen;
+  int d_k;
+  integrate_mode_t d_mode;
+  float *d_acc;
+  int d_count;   // vectors in d_acc
+  mutable gr::thread::mutex d_mutex;
+
+  void rxKMsg(pmt::pmt_t msg);
+
+public:
+  vector_integrate_ff_impl(int vlen, int k, const std::string &mode);
+  ~vector_integrate_ff_impl();
+
+  void set_k(int k);
+  int k() const { return d_k; }
+  void set_update_period(double period, double frame_rate);
+  void set_mode(const std::string &mode);
+  std::string mode() const;
+
+  void forecast(int noutput_items, gr_vector_int &ninput_items_required);
+  int general_work(int noutput_items, gr_vector_int &ninput_items,
+                   gr_vector_const_void_star &input_items,
+                   gr_vector_void_star &output_items);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_VECTOR_INTEGRATE_FF_IMPL_H */
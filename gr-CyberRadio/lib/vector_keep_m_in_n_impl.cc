@@ -23,6 +23,7 @@
 #endif
 
 #include "vector_keep_m_in_n_impl.h"
+#include <cstring>
 #include <gnuradio/io_signature.h>
 
 namespace gr {
@@ -77,20 +78,33 @@ int vector_keep_m_in_n_impl::work(int noutput_items,
                                   gr_vector_void_star &output_items) {
   uint8_t *out = (uint8_t *)output_items[0];
   const uint8_t *in = (const uint8_t *)input_items[0];
-  memcpy(out, in + d_offset * d_itemsize, d_m * d_itemsize);
+  const size_t in_bytes = size_t(d_n) * d_itemsize;
+  const size_t out_bytes = size_t(d_m) * d_itemsize;
+
+  if (d_m == d_n) {
+    // Nothing is dropped: the whole call is a single copy
+    memcpy(out, in, out_bytes * noutput_items);
+    return noutput_items;
+  }
+  // GNU Radio 3.8 buffers can't alias one another, so the kept slice of
+  // each vector is copied; one pass over every vector in the call
+  in += size_t(d_offset) * d_itemsize;
+  for (int i = 0; i < noutput_items; i++) {
+    memcpy(out, in, out_bytes);
+    in += in_bytes;
+    out += out_bytes;
+  }
   return noutput_items;
 }
 
 void vector_keep_m_in_n_impl::set_offset(int offset) {
-  if (d_offset != offset) {
-    d_offset = offset;
-    if (d_offset > (d_n - d_m)) {
-      std::string s = boost::str(
-          boost::format("keep_m_in_n: offset (%1%) <= n (%2%) - m (%3%)") %
-          d_offset % d_n % d_m);
-      throw std::runtime_error(s);
-    }
+  if (offset < 0 || offset > (d_n - d_m)) {
+    std::string s = boost::str(
+        boost::format("keep_m_in_n: offset (%1%) <= n (%2%) - m (%3%)") %
+        offset % d_n % d_m);
+    throw std::runtime_error(s);
   }
+  d_offset = offset;
 }
 
 } /* namespace CyberRadio */
@@ -24,28 +24,26 @@
 
 #include "vector_mag_squared_log10_cf_impl.h"
 #include <gnuradio/io_signature.h>
-#include <volk/volk.h>
 
 namespace gr {
 namespace CyberRadio {
 
 vector_mag_squared_log10_cf::sptr
-vector_mag_squared_log10_cf::make(float n, size_t vlen, float k) {
+vector_mag_squared_log10_cf::make(float n, size_t vlen, float k,
+                                  float floor_db) {
   return gnuradio::get_initial_sptr(
-      new vector_mag_squared_log10_cf_impl(n, vlen, k));
+      new vector_mag_squared_log10_cf_impl(n, vlen, k, floor_db));
 }
 
 /*
  * The private constructor
  */
-vector_mag_squared_log10_cf_impl::vector_mag_squared_log10_cf_impl(float n,
-                                                                   size_t vlen,
-                                                                   float k)
+vector_mag_squared_log10_cf_impl::vector_mag_squared_log10_cf_impl(
+    float n, size_t vlen, float k, float floor_db)
     : gr::sync_block("vector_mag_squared_log10_cf",
                      io_signature::make(1, 1, sizeof(gr_complex) * vlen),
                      io_signature::make(1, 1, sizeof(float) * vlen)),
-      //~ d_n(n/log2(10)),
-      d_n(log2(10) / n), d_vlen(vlen), d_k(k) {}
+      d_vlen(vlen), d_params(n, k, floor_db) {}
 
 /*
  * Our virtual destructor.
@@ -57,14 +55,7 @@ int vector_mag_squared_log10_cf_impl::work(
     gr_vector_void_star &output_items) {
   const gr_complex *in = (const gr_complex *)input_items[0];
   float *out = (float *)output_items[0];
-  int noi = noutput_items * d_vlen;
-  int size = noutput_items * d_vlen;
-  float n = d_n;
-  float k = d_k;
-
-  volk_32fc_magnitude_squared_32f(out, in, noi);
-  volk_32f_log2_32f(out, out, noi);
-  volk_32f_s32f_normalize(out, d_n, noi);
+  mag_squared_nlog10_kernel(out, in, d_params, noutput_items * d_vlen);
   return noutput_items;
 }
 
@@ -22,18 +22,18 @@
 #define INCLUDED_CYBERRADIO_VECTOR_MAG_SQUARED_LOG10_CF_IMPL_H
 
 #include <CyberRadio/vector_mag_squared_log10_cf.h>
+#include "nlog10_kernels.h"
 
 namespace gr {
 namespace CyberRadio {
 
 class vector_mag_squared_log10_cf_impl : public vector_mag_squared_log10_cf {
 private:
-  float d_n;
   size_t d_vlen;
-  float d_k;
+  nlog10_params d_params;
 
 public:
-  vector_mag_squared_log10_cf_impl(float n, size_t vlen, float k);
+  vector_mag_squared_log10_cf_impl(float n, size_t vlen, float k, float floor_db);
   ~vector_mag_squared_log10_cf_impl();
 
   // Where all the action really happens
@@ -24,24 +24,25 @@
 
 #include "vector_nlog10_ff_impl.h"
 #include <gnuradio/io_signature.h>
-#include <volk/volk.h>
 
 namespace gr {
 namespace CyberRadio {
 
-vector_nlog10_ff::sptr vector_nlog10_ff::make(float n, size_t vlen, float k) {
-  return gnuradio::get_initial_sptr(new vector_nlog10_ff_impl(n, vlen, k));
+vector_nlog10_ff::sptr vector_nlog10_ff::make(float n, size_t vlen, float k,
+                                              float floor_db) {
+  return gnuradio::get_initial_sptr(
+      new vector_nlog10_ff_impl(n, vlen, k, floor_db));
 }
 
 /*
  * The private constructor
  */
-vector_nlog10_ff_impl::vector_nlog10_ff_impl(float n, size_t vlen, float k)
+vector_nlog10_ff_impl::vector_nlog10_ff_impl(float n, size_t vlen, float k,
+                                             float floor_db)
     : gr::sync_block("vector_nlog10_ff",
                      io_signature::make(1, 1, sizeof(float) * vlen),
                      io_signature::make(1, 1, sizeof(float) * vlen)),
-      //~ d_n(n/log2(10)),
-      d_n(log2(10) / n), d_vlen(vlen), d_k(k) {}
+      d_vlen(vlen), d_params(n, k, floor_db) {}
 
 /*
  * Our virtual destructor.
@@ -53,13 +54,7 @@ int vector_nlog10_ff_impl::work(int noutput_items,
                                 gr_vector_void_star &output_items) {
   const float *in = (const float *)input_items[0];
   float *out = (float *)output_items[0];
-  int noi = noutput_items * d_vlen;
-  int size = noutput_items * d_vlen;
-  float n = d_n;
-  float k = d_k;
-
-  volk_32f_log2_32f(out, in, noi);
-  volk_32f_s32f_normalize(out, d_n, noi);
+  nlog10_kernel(out, in, d_params, noutput_items * d_vlen);
   return noutput_items;
 }
 
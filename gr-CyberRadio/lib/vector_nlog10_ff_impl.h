@@ -22,18 +22,18 @@
 #define INCLUDED_CYBERRADIO_VECTOR_NLOG10_FF_IMPL_H
 
 #include <CyberRadio/vector_nlog10_ff.h>
+#include "nlog10_kernels.h"
 
 namespace gr {
 namespace CyberRadio {
 
 class vector_nlog10_ff_impl : public vector_nlog10_ff {
 private:
-  float d_n;
   size_t d_vlen;
-  float d_k;
+  nlog10_params d_params;
 
 public:
-  vector_nlog10_ff_impl(float n, size_t vlen, float k);
+  vector_nlog10_ff_impl(float n, size_t vlen, float k, float floor_db);
   ~vector_nlog10_ff_impl();
 
   // Where all the action really happens
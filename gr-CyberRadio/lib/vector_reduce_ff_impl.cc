@@ -0,0 +1,150 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "vector_reduce_ff_impl.h"
+#include <gnuradio/io_signature.h>
+#include <stdexcept>
+#include <volk/volk.h>
+
+namespace gr {
+namespace CyberRadio {
+
+vector_reduce_ff::sptr vector_reduce_ff::make(int vlen, int out_len,
+                                              const std::string &mode,
+                                              int start, int stop) {
+  return gnuradio::get_initial_sptr(
+      new vector_reduce_ff_impl(vlen, out_len, mode, start, stop));
+}
+
+bool vector_reduce_ff_impl::parse_mode(const std::string &mode) {
+  if (mode == "mean")
+    return true;
+  if (mode == "max")
+    return false;
+  throw std::invalid_argument("vector_reduce_ff: unknown mode '" + mode +
+                              "'");
+}
+
+/*
+ * The private constructor
+ */
+vector_reduce_ff_impl::vector_reduce_ff_impl(int vlen, int out_len,
+                                             const std::string &mode,
+                                             int start, int stop)
+    : gr::sync_block("vector_reduce_ff",
+                     io_signature::make(1, 1, sizeof(float) * vlen),
+                     io_signature::make(1, 1, sizeof(float) * out_len)),
+      d_vlen(vlen), d_out_len(out_len), d_mean(parse_mode(mode)),
+      d_first(out_len), d_count(out_len), d_scale(out_len) {
+  if (vlen < 1 || out_len < 1)
+    throw std::invalid_argument(
+        "vector_reduce_ff: vlen and out_len must be positive");
+  set_zoom(start, stop);
+  message_port_register_in(pmt::mp("zoom"));
+  set_msg_handler(pmt::mp("zoom"),
+                  boost::bind(&vector_reduce_ff_impl::rxZoomMsg, this, _1));
+}
+
+vector_reduce_ff_impl::~vector_reduce_ff_impl() {}
+
+/*
+ * Output bin j covers input bins [start + j*W/P, start + (j+1)*W/P) for a
+ * window of W bins and P outputs, or the single bin start + j*W/P when
+ * that run is empty (W < P).
+ */
+void vector_reduce_ff_impl::set_zoom(int start, int stop) {
+  if (stop == 0)
+    stop = d_vlen;
+  if (start < 0 || stop > d_vlen || start >= stop)
+    throw std::out_of_range(
+        "vector_reduce_ff: zoom must satisfy 0 <= start < stop <= vlen");
+  gr::thread::scoped_lock lock(d_mutex);
+  const int64_t W = stop - start, P = d_out_len;
+  for (int j = 0; j < d_out_len; j++) {
+    int first = start + int(j * W / P);
+    int next = start + int((j + 1) * W / P);
+    d_first[j] = first;
+    d_count[j] = next > first ? next - first : 1;
+    d_scale[j] = 1.0f / d_count[j];
+  }
+  d_start = start;
+  d_stop = stop;
+}
+
+void vector_reduce_ff_impl::set_mode(const std::string &mode) {
+  bool mean = parse_mode(mode);
+  gr::thread::scoped_lock lock(d_mutex);
+  d_mean = mean;
+}
+
+std::vector<int> vector_reduce_ff_impl::bin_edges() const {
+  gr::thread::scoped_lock lock(d_mutex);
+  std::vector<int> edges(d_first);
+  edges.push_back(d_stop);
+  return edges;
+}
+
+void vector_reduce_ff_impl::rxZoomMsg(pmt::pmt_t msg) {
+  if (!pmt::is_pair(msg) || !pmt::is_integer(pmt::car(msg)) ||
+      !pmt::is_integer(pmt::cdr(msg))) {
+    GR_LOG_WARN(d_logger, "zoom: expected (start . stop)");
+    return;
+  }
+  try {
+    set_zoom(int(pmt::to_long(pmt::car(msg))),
+             int(pmt::to_long(pmt::cdr(msg))));
+  } catch (std::exception &e) {
+    GR_LOG_WARN(d_logger, std::string("zoom: ") + e.what());
+  }
+}
+
+int vector_reduce_ff_impl::work(int noutput_items,
+                                gr_vector_const_void_star &input_items,
+                                gr_vector_void_star &output_items) {
+  gr::thread::scoped_lock lock(d_mutex);
+  const float *in = (const float *)input_items[0];
+  float *out = (float *)output_items[0];
+  const int P = d_out_len;
+  for (int i = 0; i < noutput_items; i++) {
+    const float *x = in + size_t(i) * d_vlen;
+    float *y = out + size_t(i) * P;
+    for (int j = 0; j < P; j++) {
+      const float *run = x + d_first[j];
+      if (d_count[j] == 1) {
+        y[j] = run[0];
+      } else if (d_mean) {
+        volk_32f_accumulator_s32f(y + j, run, d_count[j]);
+        y[j] *= d_scale[j];
+      } else {
+        uint32_t k;
+        volk_32f_index_max_32u(&k, run, d_count[j]);
+        y[j] = run[k];
+      }
+    }
+  }
+  return noutput_items;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
@@ -0,0 +1,64 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_VECTOR_REDUCE_FF_IMPL_H
+#define INCLUDED_CYBERRADIO_VECTOR_REDUCE_FF_IMPL_H
+
+#include <CyberRadio/vector_reduce_ff.h>
+#include <gnuradio/thread/thread.h>
+
+namespace gr {
+namespace CyberRadio {
+
+class vector_reduce_ff_impl : public vector_reduce_ff {
+private:
+  int d_vlen;
+  int d_out_len;
+  bool d_mean;
+  int d_start;
+  int d_stop;
+  std::vector<int> d_first;     // first input bin of each output bin
+  std::vector<int> d_count;     // input bins in each output bin
+  std::vector<float> d_scale;   // 1/d_count, for the mean
+  mutable gr::thread::mutex d_mutex;
+
+  static bool parse_mode(const std::string &mode);
+  void rxZoomMsg(pmt::pmt_t msg);
+
+public:
+  vector_reduce_ff_impl(int vlen, int out_len, const std::string &mode,
+                        int start, int stop);
+  ~vector_reduce_ff_impl();
+
+  void set_zoom(int start, int stop);
+  int start() const { return d_start; }
+  int stop() const { return d_stop; }
+  void set_mode(const std::string &mode);
+  std::string mode() const { return d_mean ? "mean" : "max"; }
+  std::vector<int> bin_edges() const;
+
+  int work(int noutput_items, gr_vector_const_void_star &input_items,
+           gr_vector_void_star &output_items);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_VECTOR_REDUCE_FF_IMPL_H */
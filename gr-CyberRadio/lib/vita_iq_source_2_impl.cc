@@ -286,19 +286,17 @@ static int count = 0;
 
 int vita_iq_source_2_impl::_parse_vita_and_tag(char *output_buffer,
                                                int packetNumber) {
-  char *out = output_buffer;
+  //  The radio sends its VITA words in host (little-endian) order.
+  vita49_view vp(output_buffer, d_packetSize, false);
   //  Check header ID.
-  if ((out[0] != 'P') || (out[1] != 'L') || (out[2] != 'R') ||
-      (out[3] != 'V')) {
+  if (!vp.has_framing()) {
     char msg[100];
-    sprintf(msg, "Wrong packet header: %02x%02x%02x%02x  packet count: %i",
-            (uint16_t)out[0], (uint16_t)out[1], (uint16_t)out[2],
-            (uint16_t)out[3], count);
+    sprintf(msg, "Wrong packet header: %08x  packet count: %i", vp.word(0),
+            count);
     GR_LOG_WARN(d_logger, msg);
   }
   //  Check for lost frames.
-  unsigned short int frame_count =
-      ((out[7] << 4) | (out[6] & 0xf0) >> 4) & 0xfff;
+  unsigned short int frame_count = vp.frame_count();
   int old_frame_count = d_frame_count;
   int dropped = 0;
   if (old_frame_count == 0xffff) {
@@ -320,13 +318,11 @@ int vita_iq_source_2_impl::_parse_vita_and_tag(char *output_buffer,
 
   //  Get other VITA values and add tags to the stream.
   if ((packetNumber == 1) && (d_tagOutput)) {
-    int packet_count = (out[10] & 0xf);
-    char time_frac_type = (out[10] & 0x30) >> 4;
-    long int stream_id = *((unsigned int *)&out[12]);
-    long int time_int = *((unsigned int *)&out[16]);
-    long unsigned int time_frac_msw = *((unsigned int *)&out[20]);
-    long unsigned int time_frac_lsw = *((unsigned int *)&out[24]);
-    uint64_t time_frac_i = ((uint64_t)time_frac_msw << 32) | time_frac_lsw;
+    int packet_count = vp.packet_count();
+    char time_frac_type = vp.tsf();
+    long int stream_id = vp.stream_id();
+    long int time_int = vp.timestamp_int();
+    uint64_t time_frac_i = vp.timestamp_frac();
 
     double time_frac = (double)time_frac_i;
     if (time_frac_type == 2) {
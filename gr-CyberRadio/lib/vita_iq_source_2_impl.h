@@ -12,8 +12,8 @@
 #ifndef INCLUDED_CYBERRADIO_VITA_IQ_SOURCE_2_IMPL_H
 #define INCLUDED_CYBERRADIO_VITA_IQ_SOURCE_2_IMPL_H
 
+#include <CyberRadio/vita49_view.h>
 #include <CyberRadio/vita_iq_source_2.h>
-#include <LibCyberRadio/Common/Vita49Packet.h>
 #include <boost/asio.hpp>
 #include <boost/format.hpp>
 #include <boost/thread.hpp>
@@ -23,8 +23,6 @@
 #include <time.h>
 #include <vector>
 
-typedef LibCyberRadio::Vita49Packet Vita49Packet;
-
 namespace gr {
 namespace CyberRadio {
 
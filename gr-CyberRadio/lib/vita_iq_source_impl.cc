@@ -99,6 +99,28 @@ void vita_iq_udp_port::read_data() {
   }
 }
 
+void vita_iq_udp_port::read_datagram() {
+  // Like read_data(), but takes whatever single datagram is waiting, for
+  // when the packet size isn't known yet
+  int socket_fd, result;
+  fd_set readset;
+  struct timeval timeout;
+  timeout.tv_sec = 0;
+  timeout.tv_usec = 0;
+
+  socket_fd = socket->native_handle();
+  do {
+    FD_ZERO(&readset);
+    FD_SET(socket_fd, &readset);
+    result = select(socket_fd + 1, &readset, NULL, NULL, &timeout);
+  } while (result == -1 && errno == EINTR);
+
+  if ((result > 0) && FD_ISSET(socket_fd, &readset)) {
+    bytes_recvd =
+        socket->receive(boost::asio::buffer((void *)recv_buffer, packet_size));
+  }
+}
+
 void vita_iq_udp_port::clear_buffer() {
   memset(recv_buffer, 0, packet_size);
   bytes_recvd = 0;
@@ -126,10 +148,12 @@ vita_iq_source::sptr vita_iq_source::make(
     int vita_type, size_t payload_size, size_t vita_header_size,
     size_t vita_tail_size, bool byte_swapped, bool iq_swapped,
     float iq_scale_factor, const std::string &host,
-    const std::vector<unsigned short> &port_list, bool tagged, bool debug) {
+    const std::vector<unsigned short> &port_list, bool debug, bool tagged,
+    bool auto_detect) {
   return gnuradio::get_initial_sptr(new vita_iq_source_impl(
       vita_type, payload_size, vita_header_size, vita_tail_size, byte_swapped,
-      iq_swapped, iq_scale_factor, host, port_list, tagged, debug));
+      iq_swapped, iq_scale_factor, host, port_list, tagged, debug,
+      auto_detect));
 }
 
 /*
@@ -139,7 +163,8 @@ vita_iq_source_impl::vita_iq_source_impl(
     int vita_type, size_t payload_size, size_t vita_header_size,
     size_t vita_tail_size, bool byte_swapped, bool iq_swapped,
     float iq_scale_factor, const std::string &host,
-    const std::vector<unsigned short> &port_list, bool tagged, bool debug)
+    const std::vector<unsigned short> &port_list, bool tagged, bool debug,
+    bool auto_detect)
     : gr::sync_block("[CyberRadio] VITA I/Q Source",
                      gr::io_signature::make(0, 0, 0),
                      gr::io_signature::make(0, 0, 0)),
@@ -148,7 +173,8 @@ vita_iq_source_impl::vita_iq_source_impl(
       d_byte_swapped(byte_swapped), d_iq_swapped(iq_swapped),
       d_iq_scale_factor(iq_scale_factor), d_num_outputs(0), d_host(host),
       d_port_list(port_list), d_packet_size(0), d_tagged(tagged),
-      d_debug(debug) {
+      d_debug(debug), d_auto_detect(auto_detect),
+      d_layout_locked(!auto_detect), d_detector() {
   this->debug("construction\n");
   // Get number of outputs
   d_num_outputs = (int)d_port_list.size();
@@ -156,6 +182,13 @@ vita_iq_source_impl::vita_iq_source_impl(
   d_packet_size =
       (vita_type == 0 ? payload_size
                       : vita_header_size + payload_size + vita_tail_size);
+  if (d_auto_detect) {
+    // Size the receive buffers for any datagram until the layout is known,
+    // and make sure the output buffers can take two of the largest packets
+    d_packet_size = vita_layout_detector::max_datagram_bytes;
+    this->set_min_output_buffer(
+        2 * long(vita_layout_detector::max_datagram_bytes / 4));
+  }
   // this->set_output_signature(gr::io_signature::make(1, d_num_outputs,
   // sizeof(unsigned short) * d_payload_size / 2));
   this->set_output_signature(
@@ -182,6 +215,11 @@ vita_iq_source_impl::~vita_iq_source_impl() {
 int vita_iq_source_impl::work(int noutput_items,
                               gr_vector_const_void_star &input_items,
                               gr_vector_void_star &output_items) {
+  // Nothing can be decoded until the packet layout is known
+  if (!d_layout_locked) {
+    detect_layout();
+    return 0;
+  }
   // Pointer to output buffer -- this gets assigned by output
   gr_complex *out;
   // Number of samples in a given data packet
@@ -208,23 +246,18 @@ int vita_iq_source_impl::work(int noutput_items,
         // Fill the output with data from the UDP port if
         // available, or zeros if not
         if (d_udp_ports[output]->is_packet_ready()) {
-          // Decode received packet
-          Vita49Packet vp(d_vita_type, d_payload_size, d_vita_header_size,
-                          d_vita_tail_size, d_byte_swapped, d_iq_swapped,
-                          (unsigned char *)(d_udp_ports[output]->recv_buffer),
-                          d_packet_size);
-          // Copy the packet's sample data to the correct output stream
-          for (sample = 0; sample < samples_in_packet; sample++) {
-            out[sample + noutput_items_processed[output]].real(
-                vp.getSampleI(sample) * d_iq_scale_factor);
-            out[sample + noutput_items_processed[output]].imag(
-                vp.getSampleQ(sample) * d_iq_scale_factor);
-          }
           // Do tagging on the output stream if desired and if
-          // VITA 49 frames are being received
+          // VITA 49 frames are being received.  The header is only
+          // decoded when tags are wanted.
           if (d_tagged && (d_vita_type != 0)) {
-            generate_vita_tags(output, vp);
+            generate_vita_tags(output,
+                               vita49_view(d_udp_ports[output]->recv_buffer,
+                                           d_packet_size, d_byte_swapped));
           }
+          // Copy the packet's sample data to the correct output stream
+          convert_samples(d_udp_ports[output]->recv_buffer,
+                          out + noutput_items_processed[output],
+                          samples_in_packet);
           // Increase number of items available
           noutput_items_processed[output] += samples_in_packet;
           // Reset the UDP port buffer
@@ -277,6 +310,63 @@ float vita_iq_source_impl::get_realtime_sample_rate(int output) {
   return d_realtime_sample_rates[output];
 }
 
+std::string vita_iq_source_impl::get_detected_layout() {
+  boost::mutex::scoped_lock lock(d_udp_port_mtx);
+  return d_layout_str;
+}
+
+void vita_iq_source_impl::detect_layout() {
+  if (!d_udp_port_mtx.try_lock())
+    return;
+  for (int output = 0; (output < d_num_outputs) && !d_detector.locked();
+       output++) {
+    vita_iq_udp_port *port = d_udp_ports[output];
+    port->read_datagram();
+    if (port->bytes_recvd > 0)
+      d_detector.add((const uint8_t *)port->recv_buffer, port->bytes_recvd);
+    port->clear_buffer();
+  }
+  if (d_detector.locked()) {
+    const vita_layout &layout = d_detector.layout();
+    if (layout.is_vita) {
+      // Keep the caller's VITA type if one was given
+      if (d_vita_type == 0)
+        d_vita_type = 1;
+      d_vita_header_size = layout.header_bytes;
+      d_vita_tail_size = layout.tail_bytes;
+    } else {
+      d_vita_type = 0;
+      d_vita_header_size = 0;
+      d_vita_tail_size = 0;
+    }
+    d_payload_size = layout.payload_bytes;
+    d_byte_swapped = layout.byte_swapped;
+    d_packet_size = layout.frame_bytes;
+    // The receive buffers are already big enough for any datagram
+    for (int output = 0; output < d_num_outputs; output++)
+      d_udp_ports[output]->packet_size = (int)d_packet_size;
+    d_layout_str = layout.to_string();
+    this->set_output_multiple(layout.samples_per_packet);
+    d_layout_locked = true;
+    printf("[%s] detected %s\n", this->name().c_str(), d_layout_str.c_str());
+  }
+  d_udp_port_mtx.unlock();
+}
+
+void vita_iq_source_impl::convert_samples(char *packet, gr_complex *out,
+                                          int nsamples) {
+  size_t offset = (d_vita_type == 0 ? 0 : d_vita_header_size);
+  int16_t *iq = (int16_t *)(packet + offset);
+  // Same in-place swap as vita_udp_rx: a 32-bit swap exchanges I and Q (and
+  // the bytes within each), a 16-bit swap fixes the byte order
+  if (d_iq_swapped)
+    volk_32u_byteswap((uint32_t *)iq, nsamples);
+  if (d_byte_swapped != d_iq_swapped)
+    volk_16u_byteswap((uint16_t *)iq, 2 * nsamples);
+  volk_16i_s32f_convert_32f((float *)out, iq, 1.0f / d_iq_scale_factor,
+                            2 * nsamples);
+}
+
 int vita_iq_source_impl::debug(const char *format, ...) {
   int ret = 0;
   if (d_debug) {
@@ -325,7 +415,7 @@ void vita_iq_source_impl::disconnect_udp_ports() {
 }
 
 void vita_iq_source_impl::generate_vita_tags(int output,
-                                             const Vita49Packet &vp) {
+                                             const vita49_view &vp) {
   uint64_t absolute_sample_num = nitems_written(output);
   pmt::pmt_t srcid = pmt::string_to_symbol(alias());
   add_item_tag(output, absolute_sample_num,
@@ -333,42 +423,42 @@ void vita_iq_source_impl::generate_vita_tags(int output,
                pmt::from_uint64(absolute_sample_num), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("frame_counter"),
-               pmt::from_long(vp.frameCount), srcid);
+               pmt::from_long(vp.frame_count()), srcid);
   add_item_tag(output, absolute_sample_num, pmt::string_to_symbol("frame_size"),
-               pmt::from_long(vp.frameSize), srcid);
+               pmt::from_long(vp.frame_size()), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("packet_type"),
-               pmt::from_long(vp.packetType), srcid);
+               pmt::from_long(vp.packet_type()), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("packet_counter"),
-               pmt::from_long(vp.packetCount), srcid);
+               pmt::from_long(vp.packet_count()), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("packet_size"),
-               pmt::from_long(vp.packetSize), srcid);
+               pmt::from_long(vp.packet_size()), srcid);
   add_item_tag(output, absolute_sample_num, pmt::string_to_symbol("stream_id"),
-               pmt::from_long(vp.streamId), srcid);
+               pmt::from_long(vp.stream_id()), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("timestamp_int_type"),
-               pmt::from_long(vp.timestampIntType), srcid);
+               pmt::from_long(vp.tsi()), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("timestamp_int"),
-               pmt::from_long(vp.timestampInt), srcid);
+               pmt::from_long(vp.timestamp_int()), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("timestamp_frac_type"),
-               pmt::from_long(vp.timestampFracType), srcid);
+               pmt::from_long(vp.tsf()), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("timestamp_frac"),
-               pmt::from_uint64(vp.timestampFrac), srcid);
-  if (vp.hasClassId != 0) {
+               pmt::from_uint64(vp.timestamp_frac()), srcid);
+  if (vp.has_class_id()) {
     add_item_tag(output, absolute_sample_num,
                  pmt::string_to_symbol("organizationally_unique_id"),
-                 pmt::from_long(vp.organizationallyUniqueId), srcid);
+                 pmt::from_long(vp.oui()), srcid);
     add_item_tag(output, absolute_sample_num,
                  pmt::string_to_symbol("information_class_code"),
-                 pmt::from_long(vp.informationClassCode), srcid);
+                 pmt::from_long(vp.icc()), srcid);
     add_item_tag(output, absolute_sample_num,
                  pmt::string_to_symbol("packet_class_code"),
-                 pmt::from_long(vp.packetClassCode), srcid);
+                 pmt::from_long(vp.pcc()), srcid);
   }
 }
 
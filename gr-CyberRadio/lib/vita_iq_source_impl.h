@@ -12,8 +12,9 @@
 #ifndef INCLUDED_CYBERRADIO_VITA_IQ_SOURCE_IMPL_H
 #define INCLUDED_CYBERRADIO_VITA_IQ_SOURCE_IMPL_H
 
+#include "vita_layout.h"
+#include <CyberRadio/vita49_view.h>
 #include <CyberRadio/vita_iq_source.h>
-#include <LibCyberRadio/Common/Vita49Packet.h>
 #include <boost/asio.hpp>
 #include <boost/format.hpp>
 #include <boost/thread.hpp>
@@ -23,8 +24,6 @@
 #include <time.h>
 #include <vector>
 
-typedef LibCyberRadio::Vita49Packet Vita49Packet;
-
 namespace gr {
 namespace CyberRadio {
 
@@ -37,6 +36,7 @@ public:
                    int packet_size = 8192, bool debug = false);
   ~vita_iq_udp_port();
   void read_data();
+  void read_datagram();
   void clear_buffer();
   bool is_packet_ready() const;
 
@@ -64,12 +64,13 @@ public:
                       bool byte_swapped, bool iq_swapped, float iq_scale_factor,
                       const std::string &host,
                       const std::vector<unsigned short> &port_list, bool tagged,
-                      bool debug);
+                      bool debug, bool auto_detect);
   ~vita_iq_source_impl();
   // Where all the action really happens
   int work(int noutput_items, gr_vector_const_void_star &input_items,
            gr_vector_void_star &output_items);
   float get_realtime_sample_rate(int output);
+  std::string get_detected_layout();
 
 protected:
   // Debug output helper
@@ -82,7 +83,12 @@ protected:
   void disconnect_udp_ports();
   // Generate tags for an output stream from a Vita 49
   // packet
-  void generate_vita_tags(int output, const Vita49Packet &vp);
+  void generate_vita_tags(int output, const vita49_view &vp);
+  // Feed received datagrams to the layout detector until it locks
+  void detect_layout();
+  // Convert a packet's samples straight from the receive buffer, swapping
+  // in place as needed
+  void convert_samples(char *packet, gr_complex *out, int nsamples);
 
 private:
   int d_vita_type;
@@ -103,6 +109,10 @@ private:
   std::vector<float> d_realtime_sample_rates;
   std::vector<long> d_realtime_sample_counts;
   time_t d_realtime_last_time;
+  bool d_auto_detect;
+  bool d_layout_locked;
+  vita_layout_detector d_detector;
+  std::string d_layout_str;
 };
 
 } // namespace CyberRadio
@@ -0,0 +1,218 @@
+/* -*- c++ -*- */
+/***************************************************************************
+ * \file vita_layout.h
+ *
+ * \brief Detects the layout of VITA 49 I/Q packets from their headers.
+ *
+ * \copyright Copyright (c) 2026 CyberRadio Solutions, Inc.
+ *
+ */
+
+#ifndef INCLUDED_CYBERRADIO_VITA_LAYOUT_H
+#define INCLUDED_CYBERRADIO_VITA_LAYOUT_H
+
+#include <CyberRadio/vita49_view.h>
+#include <cstddef>
+#include <cstdint>
+#include <sstream>
+#include <string>
+
+namespace gr {
+namespace CyberRadio {
+
+/*!
+ * \brief Layout of a VITA 49 I/Q packet, as found on the wire.
+ *
+ * Sizes are in bytes.  header_bytes is the offset from the start of the
+ * datagram to the first sample, so it includes any VRLP framing word;
+ * tail_bytes likewise includes the VEND word.
+ */
+struct vita_layout {
+  bool is_vita = false;       //!< false if the datagram is raw I/Q
+  bool vrlp = false;          //!< VITA 49.1 VRLP/VEND framing present
+  bool big_endian = true;     //!< byte order of the header words
+  bool byte_swapped = false;  //!< wire byte order differs from the host's
+  bool has_stream_id = false; //!< stream ID word present
+  bool has_class_id = false;  //!< C bit
+  bool has_trailer = false;   //!< T bit
+  int packet_type = 0;        //!< VRT packet type
+  int tsi = 0;                //!< integer timestamp type
+  int tsf = 0;                //!< fractional timestamp type
+  size_t frame_bytes = 0;     //!< total datagram size
+  size_t header_bytes = 0;    //!< bytes preceding the first sample
+  size_t payload_bytes = 0;   //!< I/Q payload size
+  size_t tail_bytes = 0;      //!< bytes following the last sample
+  int samples_per_packet = 0; //!< 16-bit complex samples per packet
+
+  bool operator==(const vita_layout &o) const {
+    return is_vita == o.is_vita && vrlp == o.vrlp &&
+           big_endian == o.big_endian && has_stream_id == o.has_stream_id &&
+           has_class_id == o.has_class_id && has_trailer == o.has_trailer &&
+           packet_type == o.packet_type && tsi == o.tsi && tsf == o.tsf &&
+           frame_bytes == o.frame_bytes && header_bytes == o.header_bytes &&
+           payload_bytes == o.payload_bytes && tail_bytes == o.tail_bytes;
+  }
+  bool operator!=(const vita_layout &o) const { return !(*this == o); }
+
+  //! Human-readable summary, suitable for pinning the configuration
+  std::string to_string() const {
+    std::ostringstream ss;
+    if (!is_vita) {
+      ss << "raw I/Q: bytes_per_packet=" << frame_bytes
+         << " samples_per_packet=" << samples_per_packet;
+      return ss.str();
+    }
+    ss << "VITA 49" << (vrlp ? ".1 (VRLP)" : ".0") << ": "
+       << "byte_order=" << (big_endian ? "big" : "little")
+       << " swap_bytes=" << (byte_swapped ? "True" : "False")
+       << " header_byte_offset=" << header_bytes
+       << " payload_bytes=" << payload_bytes << " tail_bytes=" << tail_bytes
+       << " bytes_per_packet=" << frame_bytes
+       << " samples_per_packet=" << samples_per_packet
+       << " packet_type=" << packet_type << " C=" << has_class_id
+       << " T=" << has_trailer << " TSI=" << tsi << " TSF=" << tsf;
+    return ss.str();
+  }
+};
+
+namespace vita_layout_detail {
+
+inline bool host_is_big_endian() {
+#if defined(__BYTE_ORDER__) && (__BYTE_ORDER__ == __ORDER_BIG_ENDIAN__)
+  return true;
+#else
+  return false;
+#endif
+}
+
+// Try to interpret the datagram with the given byte order.  Returns false if
+// the header words are not self-consistent.
+inline bool try_order(const uint8_t *buf, size_t len, bool big_endian,
+                      int samples_hint, vita_layout &out) {
+  if (len < 8 || len % 4 != 0)
+    return false;
+  vita49_view v(buf, len, big_endian != host_is_big_endian());
+  // I/Q arrives in signal data packets (types 0 to 3)
+  if (v.packet_type() > 3)
+    return false;
+  if (v.has_framing()) {
+    if (v.frame_size() * size_t(4) != len ||
+        v.word(len / 4 - 1) != vita49_view::vend_word)
+      return false;
+    if (4 * size_t(v.packet_size()) + 12 != len)
+      return false;
+  } else if (4 * size_t(v.packet_size()) != len) {
+    return false;
+  }
+  if (!v.valid())
+    return false;
+
+  vita_layout l;
+  l.is_vita = true;
+  l.vrlp = v.has_framing();
+  l.big_endian = big_endian;
+  l.byte_swapped = (big_endian != host_is_big_endian());
+  l.packet_type = v.packet_type();
+  l.has_stream_id = v.has_stream_id();
+  l.has_class_id = v.has_class_id();
+  l.has_trailer = v.has_trailer();
+  l.tsi = v.tsi();
+  l.tsf = v.tsf();
+  l.frame_bytes = len;
+  l.header_bytes = v.header_bytes();
+  l.tail_bytes = v.trailer_bytes();
+  l.payload_bytes = v.payload_bytes();
+  // Some radios carry vendor-specific words between the standard header
+  // fields and the samples; the header bits can't reveal them, so a sample
+  // count hint moves the excess into the header.
+  if (samples_hint > 0 && l.payload_bytes > size_t(samples_hint) * 4) {
+    l.header_bytes += l.payload_bytes - size_t(samples_hint) * 4;
+    l.payload_bytes = size_t(samples_hint) * 4;
+  }
+  if (l.payload_bytes % 4 != 0)
+    return false;
+  l.samples_per_packet = int(l.payload_bytes / 4);
+  out = l;
+  return true;
+}
+
+} // namespace vita_layout_detail
+
+/*!
+ * \brief Determine the layout of a single datagram.
+ *
+ * Looks for VRLP framing, then checks the frameSize and packetSize words
+ * against the datagram length in both byte orders.  Anything that doesn't
+ * parse as VITA 49 is reported as raw I/Q.
+ *
+ * \param buf the datagram
+ * \param len datagram length in bytes
+ * \param samples_hint expected samples per packet, or 0 if unknown
+ */
+inline vita_layout detect_vita_layout(const uint8_t *buf, size_t len,
+                                      int samples_hint = 0) {
+  using namespace vita_layout_detail;
+  vita_layout l;
+  // Network byte order is the norm, so prefer it when both parse
+  if (try_order(buf, len, true, samples_hint, l) ||
+      try_order(buf, len, false, samples_hint, l))
+    return l;
+  l = vita_layout();
+  l.frame_bytes = len;
+  l.payload_bytes = len;
+  l.samples_per_packet = int(len / 4);
+  return l;
+}
+
+/*!
+ * \brief Locks onto a packet layout once several datagrams agree.
+ */
+class vita_layout_detector {
+public:
+  //! Largest datagram the detector will be fed
+  static constexpr size_t max_datagram_bytes = 65536;
+
+  explicit vita_layout_detector(int samples_hint = 0, int packets_required = 4)
+      : d_samples_hint(samples_hint), d_required(packets_required) {
+    reset();
+  }
+
+  void reset() {
+    d_agreeing = 0;
+    d_locked = false;
+    d_layout = vita_layout();
+  }
+
+  /*!
+   * \brief Feed one datagram.
+   * \return true once the layout is locked
+   */
+  bool add(const uint8_t *buf, size_t len) {
+    if (d_locked)
+      return true;
+    vita_layout l = detect_vita_layout(buf, len, d_samples_hint);
+    if (d_agreeing > 0 && l == d_layout) {
+      d_agreeing++;
+    } else {
+      d_layout = l;
+      d_agreeing = 1;
+    }
+    d_locked = (d_agreeing >= d_required);
+    return d_locked;
+  }
+
+  bool locked() const { return d_locked; }
+  const vita_layout &layout() const { return d_layout; }
+
+private:
+  int d_samples_hint;
+  int d_required;
+  int d_agreeing;
+  bool d_locked;
+  vita_layout d_layout;
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_VITA_LAYOUT_H */
@@ -283,29 +283,24 @@ int vita_multifile_iq_source_impl::read_output_items_immediate(
   }
   // Continue processing if we did get a full VITA packet
   if (d_buffer_offset >= d_packet_size) {
-    // Use the VITA packet to populate output items
-    Vita49Packet vp(d_vita_type, d_payload_size, d_vita_header_size,
-                    d_vita_tail_size, d_byte_swapped, d_iq_swapped, d_buffer,
-                    d_packet_size);
-    // Copy the packet's sample data to the correct output stream
-#if 0
-		for (int sample = 0; sample < samples_in_packet; sample++) {
-			out[sample].real(vp.getSampleI(sample) * d_iq_scale_factor);
-			out[sample].imag(vp.getSampleQ(sample) * d_iq_scale_factor);
-		}
-#else
-    // This should significantly decrease CPU usage - PKN
-    // *2 because each complex sample results in 2 pieces of data
-    volk_16i_s32f_convert_32f((float *)out, vp.sampleData,
-                              1 / d_iq_scale_factor, samples_in_packet * 2);
-#endif
     // Do tagging on the output stream if desired and if
-    // VITA 49 frames are being received
+    // VITA 49 frames are being received.  The header is only decoded
+    // when tags are wanted.
     if (d_tagged && (d_vita_type != 0)) {
-      //          debug("VITA: timestamp_int=%lu  timestamp_frac=%llu\n",
-      //              vp.timestampInt, vp.timestampFrac);
-      generate_vita_tags(0, vp);
+      generate_vita_tags(0,
+                         vita49_view(d_buffer, d_packet_size, d_byte_swapped));
     }
+    // Swap the samples in place: a 32-bit swap exchanges I and Q (and the
+    // bytes within each), a 16-bit swap fixes the byte order
+    int16_t *iq = (int16_t *)(d_buffer +
+                              (d_vita_type == 0 ? 0 : d_vita_header_size));
+    if (d_iq_swapped)
+      volk_32u_byteswap((uint32_t *)iq, samples_in_packet);
+    if (d_byte_swapped != d_iq_swapped)
+      volk_16u_byteswap((uint16_t *)iq, samples_in_packet * 2);
+    // *2 because each complex sample results in 2 pieces of data
+    volk_16i_s32f_convert_32f((float *)out, iq, 1 / d_iq_scale_factor,
+                              samples_in_packet * 2);
     noutput_items_processed += samples_in_packet;
     // Calculate real-time sample rate
     time_t now = time(NULL);
@@ -330,7 +325,7 @@ float vita_multifile_iq_source_impl::get_realtime_sample_rate() {
 }
 
 void vita_multifile_iq_source_impl::generate_vita_tags(int output,
-                                                       const Vita49Packet &vp) {
+                                                       const vita49_view &vp) {
   uint64_t absolute_sample_num = nitems_written(output);
   pmt::pmt_t srcid = pmt::string_to_symbol(alias());
   add_item_tag(output, absolute_sample_num,
@@ -343,42 +338,42 @@ void vita_multifile_iq_source_impl::generate_vita_tags(int output,
                pmt::string_to_symbol(d_filenames[d_filename_index]), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("frame_counter"),
-               pmt::from_long(vp.frameCount), srcid);
+               pmt::from_long(vp.frame_count()), srcid);
   add_item_tag(output, absolute_sample_num, pmt::string_to_symbol("frame_size"),
-               pmt::from_long(vp.frameSize), srcid);
+               pmt::from_long(vp.frame_size()), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("packet_type"),
-               pmt::from_long(vp.packetType), srcid);
+               pmt::from_long(vp.packet_type()), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("packet_counter"),
-               pmt::from_long(vp.packetCount), srcid);
+               pmt::from_long(vp.packet_count()), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("packet_size"),
-               pmt::from_long(vp.packetSize), srcid);
+               pmt::from_long(vp.packet_size()), srcid);
   add_item_tag(output, absolute_sample_num, pmt::string_to_symbol("stream_id"),
-               pmt::from_long(vp.streamId), srcid);
+               pmt::from_long(vp.stream_id()), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("timestamp_int_type"),
-               pmt::from_long(vp.timestampIntType), srcid);
+               pmt::from_long(vp.tsi()), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("timestamp_int"),
-               pmt::from_long(vp.timestampInt), srcid);
+               pmt::from_long(vp.timestamp_int()), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("timestamp_frac_type"),
-               pmt::from_long(vp.timestampFracType), srcid);
+               pmt::from_long(vp.tsf()), srcid);
   add_item_tag(output, absolute_sample_num,
                pmt::string_to_symbol("timestamp_frac"),
-               pmt::from_uint64(vp.timestampFrac), srcid);
-  if (vp.hasClassId != 0) {
+               pmt::from_uint64(vp.timestamp_frac()), srcid);
+  if (vp.has_class_id()) {
     add_item_tag(output, absolute_sample_num,
                  pmt::string_to_symbol("organizationally_unique_id"),
-                 pmt::from_long(vp.organizationallyUniqueId), srcid);
+                 pmt::from_long(vp.oui()), srcid);
     add_item_tag(output, absolute_sample_num,
                  pmt::string_to_symbol("information_class_code"),
-                 pmt::from_long(vp.informationClassCode), srcid);
+                 pmt::from_long(vp.icc()), srcid);
     add_item_tag(output, absolute_sample_num,
                  pmt::string_to_symbol("packet_class_code"),
-                 pmt::from_long(vp.packetClassCode), srcid);
+                 pmt::from_long(vp.pcc()), srcid);
   }
 }
 
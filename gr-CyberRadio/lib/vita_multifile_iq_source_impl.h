@@ -13,14 +13,12 @@
 #define INCLUDED_CYBERRADIO_VITA_MULTIFILE_IQ_SOURCE_IMPL_H
 
 #include <CyberRadio/api.h>
+#include <CyberRadio/vita49_view.h>
 #include <CyberRadio/vita_multifile_iq_source.h>
-#include <LibCyberRadio/Common/Vita49Packet.h>
 #include <boost/thread/mutex.hpp>
 #include <string>
 #include <vector>
 
-typedef LibCyberRadio::Vita49Packet Vita49Packet;
-
 namespace gr {
 namespace CyberRadio {
 class CYBERRADIO_API vita_multifile_iq_source_impl
@@ -50,7 +48,7 @@ protected:
   void close_file_immediate();
   void next_file_immediate();
   int read_output_items_immediate(gr_complex *out);
-  void generate_vita_tags(int output, const Vita49Packet &vp);
+  void generate_vita_tags(int output, const vita49_view &vp);
   int debug(const char *format, ...);
 
 protected:
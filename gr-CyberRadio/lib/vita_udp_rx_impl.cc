@@ -23,9 +23,12 @@
 #endif
 
 #include "vita_udp_rx_impl.h"
+#include "ddc_rates.h"
+#include <CyberRadio/vita49_view.h>
 #include <gnuradio/io_signature.h>
 #include <arpa/inet.h>
 #include <sys/socket.h> // consider boost::asio?
+#include <unistd.h>
 #include <volk/volk.h>
 #include <cstring>
 #include <iomanip>
@@ -34,56 +37,12 @@
 namespace {
 auto const control_port = pmt::mp("control");
 auto const status_port = pmt::mp("status");
+auto const rx_kernel_time_key = pmt::mp("rx_kernel_time");
 
-// V49 Struct Info
-struct V49_308_Header {
-    char p;
-    char l;
-    char r;
-    char v;
-    unsigned int frame_info;
-    unsigned int packet_info;
-    unsigned int stream_id;
-    unsigned int class_id_1;
-    unsigned int class_id_2;
-    unsigned int int_timestamp;
-    unsigned int frac_timestamp_msw;
-    unsigned int frac_timestamp_lsw;
-};
-
-// VITA 49 VRT IF data packet header, no class ID
-// (used without external framing on NDR354/364)
-struct V49_No491_Header {
-    unsigned int packet_info;
-    unsigned int stream_id;
-    unsigned int int_timestamp;
-    unsigned int frac_timestamp_msw;
-    unsigned int frac_timestamp_lsw;
-};
-
-struct V49_0_Header {
-    uint32_t packet_info;
-    uint32_t stream_id;
-    uint32_t class_0;
-    uint32_t class_1;
-    uint32_t int_timestamp;
-    uint32_t frac_timestamp_msw;
-    uint32_t frac_timestamp_lsw;
-    uint32_t ddc_0;
-    uint32_t ddc_1;
-    uint32_t ddc_2;
-    uint32_t ddc_3;
-    uint32_t ddc_4;
-};
-
-std::map<int, float> ndr358_551_ddc_map = {
-    { 0, 0.25e3 }, { 1, 0.5e3 },  { 2, 1.0e3 },  { 3, 2.0e3 },   { 4, 4.0e3 },
-    { 5, 8.0e3 },  { 6, 16e3 },   { 7, 32e3 },   { 8, 64e3 },    { 9, 128e3 },
-    { 10, 200e3 }, { 11, 256e3 }, { 12, 400e3 }, { 13, 1.28e6 }, { 14, 3.2e6 },
-    { 15, 4e6 },   { 16, 2e6 },   { 32, 8e6 },   { 33, 8e6 },    { 34, 16e6 },
-    { 35, 16e6 },  { 36, 16e6 },  { 37, 32e6 },  { 38, 32e6 },   { 39, 64e6 },
-    { 40, 128e6 }
-};
+auto timespec_to_ns(timespec const& ts) -> uint64_t
+{
+    return uint64_t(ts.tv_sec) * 1000000000ULL + uint64_t(ts.tv_nsec);
+}
 
 void raise_error(std::string tag, int sock)
 {
@@ -126,7 +85,11 @@ auto vita_udp_rx::make(const std::string &src_ip,
                        vector_output, 
                        bool uses_v491, 
                        bool narrowband, 
-                       bool debug) -> sptr
+                       bool debug,
+                       bool kernel_timestamps,
+                       int latency_tag_interval,
+                       float latency_report_period,
+                       bool auto_detect) -> sptr
 {
     struct Cfg cfg;
     cfg.src_ip = src_ip;
@@ -135,15 +98,53 @@ auto vita_udp_rx::make(const std::string &src_ip,
     cfg.samples_per_packet = samples_per_packet;
     cfg.bytes_per_packet = bytes_per_packet;
     cfg.swap_bytes = swap_bytes;
+    cfg.swap_iq = swap_iq;
     cfg.tag_packets = tag_packets;
     cfg.uses_v49_1 = uses_v491;
     cfg.narrowband = narrowband;
     cfg.debug = debug;
+    cfg.kernel_timestamps = kernel_timestamps;
+    cfg.latency_tag_interval = latency_tag_interval;
+    cfg.latency_report_period = latency_report_period;
+    cfg.auto_detect = auto_detect;
 
     return gnuradio::get_initial_sptr(new vita_udp_rx_impl(cfg));
 }
 
 
+/*******************************************************************************
+ * \brief Receive one datagram into d_buffer, which must already be sized
+ * \return the number of bytes received, or -1 on error
+ *******************************************************************************/
+auto vita_udp_rx_impl::receive_datagram() -> ssize_t
+{
+    ssize_t nbytesRx;
+    d_rx_time_valid = false;
+    if (d_kernel_timestamps) {
+        // recvmsg() so the kernel's SO_TIMESTAMPNS control message comes along
+        // with the datagram
+        iovec iov{ d_buffer.data(), d_buffer.size() };
+        char control[CMSG_SPACE(sizeof(timespec))];
+        msghdr msg{};
+        msg.msg_iov = &iov;
+        msg.msg_iovlen = 1;
+        msg.msg_control = control;
+        msg.msg_controllen = sizeof(control);
+
+        nbytesRx = recvmsg(d_sock, &msg, 0);
+        for (auto cmsg = CMSG_FIRSTHDR(&msg); cmsg != nullptr;
+             cmsg = CMSG_NXTHDR(&msg, cmsg)) {
+            if (cmsg->cmsg_level == SOL_SOCKET and cmsg->cmsg_type == SCM_TIMESTAMPNS) {
+                std::memcpy(&d_rx_time, CMSG_DATA(cmsg), sizeof(d_rx_time));
+                d_rx_time_valid = true;
+            }
+        }
+    } else {
+        nbytesRx = recv(d_sock, d_buffer.data(), d_buffer.size(), 0);
+    }
+    return nbytesRx;
+}
+
 auto vita_udp_rx_impl::receive_packet() -> bool
 {
     auto success = false;
@@ -152,15 +153,8 @@ auto vita_udp_rx_impl::receive_packet() -> bool
     // then fill it
     d_buffer.resize(d_bytes_per_packet);
 
-    auto nbytesRx = recv(d_sock, d_buffer.data(), d_buffer.size(), 0);
-    if (nbytesRx == d_buffer.size()) {
-
-        // Byte-swap the header if needed so we can read it
-        if (d_swap_bytes) {
-            volk_32u_byteswap(reinterpret_cast<uint32_t*>(d_buffer.data()),
-                              d_header_byte_offset / 4);
-        }
-
+    auto nbytesRx = receive_datagram();
+    if (nbytesRx == ssize_t(d_buffer.size())) {
         success = true;
     } else {
         std::cerr
@@ -171,11 +165,50 @@ auto vita_udp_rx_impl::receive_packet() -> bool
     return success;
 }
 
+/*******************************************************************************
+ * \brief Read packets until the layout detector locks, then switch the block
+ *        over to the detected layout. The last packet read stays in d_buffer
+ *        so it is processed normally.
+ * \return true once the layout is locked, false if the socket failed
+ *******************************************************************************/
+auto vita_udp_rx_impl::detect_layout() -> bool
+{
+    while (not d_detector.locked()) {
+        d_buffer.resize(vita_layout_detector::max_datagram_bytes);
+        auto nbytesRx = receive_datagram();
+        if (nbytesRx <= 0) {
+            d_buffer.resize(0);
+            return false;
+        }
+        d_detector.add(d_buffer.data(), size_t(nbytesRx));
+        d_buffer.resize(size_t(nbytesRx));
+    }
+
+    auto const& layout = d_detector.layout();
+    d_uses_v49_1 = layout.vrlp;
+    d_header_byte_offset = layout.header_bytes;
+    d_bytes_per_packet = layout.frame_bytes;
+    d_samples_per_packet = layout.samples_per_packet;
+    d_swap_bytes = layout.byte_swapped;
+    d_buffer.reserve(d_bytes_per_packet);
+    {
+        gr::thread::scoped_lock lock(d_layout_mutex);
+        d_layout_str = layout.to_string();
+    }
+    std::cout << "gr::CyberRadio::vita_udp_rx_impl(" << d_src_ip << ":" << d_port
+              << "): detected " << d_layout_str << std::endl;
+
+    // from here on, work() is only called with room for whole packets
+    set_output_multiple(d_samples_per_packet);
+    d_layout_locked = true;
+    return true;
+}
+
 auto vita_udp_rx_impl::process_packet(gr_complex*& outP, int samples_needed) -> int
 {
     int samples_produced = 0;
 
-    auto hdr = reinterpret_cast<V49_No491_Header*>(d_buffer.data());
+    vita49_view hdr(d_buffer.data(), d_buffer.size(), d_swap_bytes);
 
     if (d_debug) {
         auto save_flags = std::cout.flags();
@@ -183,19 +216,19 @@ auto vita_udp_rx_impl::process_packet(gr_complex*& outP, int samples_needed) ->
         std::cout << "**** vita_udp_rx_impl(" << d_src_ip << ":" << d_port
                   << ")::process_packet() "
                   << "PACKET/N491 p_i = " << std::hex << std::setw(8) << std::setfill('0')
-                  << hdr->packet_info << "    ****" << std::endl;
+                  << hdr.header_word() << "    ****" << std::endl;
         std::cout.flags(save_flags);
         std::cout.fill(save_fill);
     }
 
     // Dropped packet handling. If the counter doesn't match the expected value, it means
     // a packet was dropped. Report it, and insert null samples into the output
-    unsigned packet_counter = (hdr->packet_info >> 16) & 0x000F;
+    unsigned packet_counter = hdr.packet_count();
 
     samples_produced += handle_dropped_packet(packet_counter, outP, samples_needed);
 
     if (samples_produced < samples_needed) {
-        tag_packet(0, samples_produced);
+        tag_packet(0, outP - d_out_base);
         samples_produced += process_IQ(outP);
     }
 
@@ -206,18 +239,18 @@ auto vita_udp_rx_impl::process_v491_packet(gr_complex*& outP) -> int
 {
     int samples_produced = 0;
 
-    auto hdr = reinterpret_cast<V49_308_Header*>(d_buffer.data());
+    vita49_view hdr(d_buffer.data(), d_buffer.size(), d_swap_bytes);
     if (d_debug) {
         auto save_flags = std::cout.flags();
         auto save_fill = std::cout.fill();
         std::cout << "**** vita_udp_rx_impl::process_v491_packet()"
                   << "PACKET/491 p_i = " << std::hex << std::setw(8) << std::setfill('0')
-                  << hdr->packet_info << "    ****" << std::endl;
+                  << hdr.header_word() << "    ****" << std::endl;
         std::cout.flags(save_flags);
         std::cout.fill(save_fill);
     }
 
-    tag_v491_packet(0, samples_produced);
+    tag_v491_packet(0, outP - d_out_base);
     samples_produced += process_IQ(outP);
     return samples_produced;
 }
@@ -280,6 +313,8 @@ auto vita_udp_rx_impl::process_IQ(gr_complex*& outP) -> int
     volk_16i_s32f_convert_32f(
         reinterpret_cast<float*>(outP), IQ, 32768.0, 2 * d_samples_per_packet);
 
+    record_latency(outP - d_out_base);
+
     outP += d_samples_per_packet;
     produce(0, d_samples_per_packet);
     d_buffer.resize(0); // consume the buffer
@@ -288,6 +323,36 @@ auto vita_udp_rx_impl::process_IQ(gr_complex*& outP) -> int
     return samples_produced;
 }
 
+/*******************************************************************************
+ * \brief Record the kernel-to-output latency of the buffered packet
+ * \param offset the relative sample number of the packet's first sample
+ *******************************************************************************/
+auto vita_udp_rx_impl::record_latency(int offset) -> void
+{
+    if (not d_rx_time_valid) {
+        return;
+    }
+
+    timespec now;
+    clock_gettime(CLOCK_REALTIME, &now);
+    auto const rx_ns = timespec_to_ns(d_rx_time);
+    auto const now_ns = timespec_to_ns(now);
+    {
+        gr::thread::scoped_lock lock(d_latency_mutex);
+        // a clock step can put the kernel time in the future; count it as zero
+        d_latency.add(now_ns > rx_ns ? now_ns - rx_ns : 0);
+    }
+
+    if (d_latency_tag_interval > 0 and
+        (d_packets_seen % d_latency_tag_interval) == 0) {
+        add_item_tag(0,
+                     nitems_written(0) + offset,
+                     rx_kernel_time_key,
+                     pmt::from_uint64(rx_ns));
+    }
+    ++d_packets_seen;
+}
+
 /*******************************************************************************
  * \brief tag a packet with information from the V49 stream
  * \param stream which output stream this applies to (should always be 0)
@@ -296,36 +361,37 @@ auto vita_udp_rx_impl::process_IQ(gr_complex*& outP) -> int
 auto vita_udp_rx_impl::tag_packet(int stream, int offset) -> void
 {
     if (d_tag_packets) {
-        auto hdr = reinterpret_cast<V49_0_Header*>(d_buffer.data());
+        vita49_view hdr(d_buffer.data(), d_buffer.size(), d_swap_bytes);
 
         uint64_t tag_item = nitems_written(0) + offset;
 
-        // Note if we setup byte swap, it's already been done in place
+        // The NDR358/NDR551 DDC words follow the standard header
+        auto const ddc_0 = hdr.extension_word(0);
+        auto const ddc_1 = hdr.extension_word(1);
+        auto const ddc_2 = hdr.extension_word(2);
+        auto const ddc_4 = hdr.extension_word(4);
 
         // timestamp
         {
-            auto fractionalTs = uint64_t(0);
-            fractionalTs = uint64_t(hdr->frac_timestamp_msw) << 32;
-            fractionalTs += uint64_t(hdr->frac_timestamp_lsw) & 0x0FFFFFFFFLL;
-            auto tag = pmt::cons(pmt::from_long(hdr->int_timestamp),
-                                 pmt::from_uint64(fractionalTs));
+            auto tag = pmt::cons(pmt::from_long(hdr.timestamp_int()),
+                                 pmt::from_uint64(hdr.timestamp_frac()));
             add_item_tag(stream, tag_item, pmt::mp("timestamp"), tag);
         }
 
         // stream id
         {
-            auto tag = pmt::from_long(hdr->stream_id);
+            auto tag = pmt::from_long(hdr.stream_id());
             add_item_tag(stream, tag_item, pmt::mp("stream_id"), tag);
         }
         {
-            auto tag = pmt::from_long((hdr->ddc_0 >> 28) & 0x0F);
+            auto tag = pmt::from_long((ddc_0 >> 28) & 0x0F);
             add_item_tag(stream, tag_item, pmt::mp("rx_channel"), tag);
         }
 
         // frequency
         {
-            auto tuned_freq = uint16_t((hdr->ddc_0 >> 0) & 0x0FFFF);
-            auto ddc_offset = int32_t((hdr->ddc_1 >> 0) & 0x0FFFFFFFF);
+            auto tuned_freq = uint16_t((ddc_0 >> 0) & 0x0FFFF);
+            auto ddc_offset = int32_t((ddc_1 >> 0) & 0x0FFFFFFFF);
             {
                 auto tag = pmt::from_long(tuned_freq);
                 add_item_tag(stream, tag_item, pmt::mp("rx_freq"), tag);
@@ -337,23 +403,23 @@ auto vita_udp_rx_impl::tag_packet(int stream, int offset) -> void
         }
 
         {
-            auto ddc_filter = ((hdr->ddc_2 >> 20) & 0x0FFF);
-            auto tag = pmt::from_float(ndr358_551_ddc_map.at(ddc_filter));
+            auto ddc_filter = ((ddc_2 >> 20) & 0x0FFF);
+            auto tag = pmt::from_float(ndr358_551_ddc_map().at(ddc_filter));
             add_item_tag(stream, tag_item, pmt::mp("ddc_rate"), tag);
         }
 
         {
-            auto tag = pmt::from_long((hdr->ddc_2 >> 0) & 0x0001FFFF);
+            auto tag = pmt::from_long((ddc_2 >> 0) & 0x0001FFFF);
             add_item_tag(stream, tag_item, pmt::mp("delay_time"), tag);
         }
 
         {
-            auto tag = pmt::from_bool(bool((hdr->ddc_0 >> 27) & 0x01));
+            auto tag = pmt::from_bool(bool((ddc_0 >> 27) & 0x01));
             add_item_tag(stream, tag_item, pmt::mp("delay_en"), tag);
         }
 
         {
-            auto ovs = (hdr->ddc_4 >> 28) & 0x0F;
+            auto ovs = (ddc_4 >> 28) & 0x0F;
             std::string ovs_s;
             switch (ovs) {
             case 0:
@@ -380,17 +446,17 @@ auto vita_udp_rx_impl::tag_packet(int stream, int offset) -> void
         }
 
         {
-            auto tag = pmt::from_long((hdr->ddc_4 >> 16) & 0x0FFF);
+            auto tag = pmt::from_long((ddc_4 >> 16) & 0x0FFF);
             add_item_tag(stream, tag_item, pmt::mp("ddc_agc_gain"), tag);
         }
 
         {
-            auto tag = pmt::from_long(((hdr->ddc_4 >> 0) & 0x000007FF));
+            auto tag = pmt::from_long(((ddc_4 >> 0) & 0x000007FF));
             add_item_tag(stream, tag_item, pmt::mp("valid_data_count"), tag);
         }
 
         {
-            auto tag = pmt::from_long((hdr->ddc_0 >> 16) & 0x003F);
+            auto tag = pmt::from_long((ddc_0 >> 16) & 0x003F);
             add_item_tag(stream, tag_item, pmt::mp("rx_atten"), tag);
         }
     }
@@ -406,20 +472,18 @@ auto vita_udp_rx_impl::tag_v491_packet(int stream, int offset) -> void
     if (d_tag_packets) {
         uint64_t tag_item = nitems_written(0) + offset;
 
-        // Note if we setup byte swap, it's already been done in place
+        vita49_view hdr(d_buffer.data(), d_buffer.size(), d_swap_bytes);
 
-        auto hdr = reinterpret_cast<V49_308_Header*>(d_buffer.data());
-
-        // timestamp
+        // timestamp (the fractional part is reported as its low word)
         {
-            auto tag = pmt::cons(pmt::from_long(hdr->int_timestamp),
-                                 pmt::from_long(hdr->frac_timestamp_lsw));
+            auto tag = pmt::cons(pmt::from_long(hdr.timestamp_int()),
+                                 pmt::from_long(hdr.timestamp_frac() & 0xFFFFFFFF));
             add_item_tag(stream, tag_item, pmt::mp("timestamp"), tag);
         }
 
         // stream id
         {
-            auto tag = pmt::from_long(hdr->stream_id);
+            auto tag = pmt::from_long(hdr.stream_id());
             add_item_tag(stream, tag_item, pmt::mp("stream_id"), tag);
         }
     }
@@ -449,13 +513,34 @@ vita_udp_rx_impl::vita_udp_rx_impl(Cfg const& cfg)
       d_debug(cfg.debug),
       d_first_packet(true),
       d_packetCounter(0),
-      d_buffer()
+      d_buffer(),
+      d_kernel_timestamps(cfg.kernel_timestamps),
+      d_latency_tag_interval(cfg.latency_tag_interval),
+      d_latency_report_period(cfg.latency_report_period),
+      d_rx_time(),
+      d_rx_time_valid(false),
+      d_packets_seen(0),
+      d_latency(),
+      d_last_latency_report(std::chrono::steady_clock::now()),
+      d_out_base(nullptr),
+      d_auto_detect(cfg.auto_detect),
+      d_layout_locked(not cfg.auto_detect),
+      d_detector(cfg.auto_detect ? cfg.samples_per_packet : 0),
+      d_layout_str(),
+      d_layout_mutex()
 {
-    // pre-allocate the memory
-    d_buffer.reserve(cfg.bytes_per_packet);
+    if (d_auto_detect) {
+        // the packet size isn't known yet; make sure the buffer can hold two of
+        // the largest packets a datagram can carry
+        d_buffer.reserve(vita_layout_detector::max_datagram_bytes);
+        set_min_output_buffer(2 * long(vita_layout_detector::max_datagram_bytes / 4));
+    } else {
+        // pre-allocate the memory
+        d_buffer.reserve(cfg.bytes_per_packet);
 
-    // don't call work() until there is enough space for a whole packet
-    set_output_multiple(d_samples_per_packet);
+        // don't call work() until there is enough space for a whole packet
+        set_output_multiple(d_samples_per_packet);
+    }
 
     // Create input port
     message_port_register_in(control_port);
@@ -488,6 +573,81 @@ void vita_udp_rx_impl::txStatusMsg()
     message_port_pub(status_port, msg);
 }
 
+/*******************************************************************************
+ * \brief Transmit the latency statistics as a status message, at most once per
+ *        latency_report_period
+ *******************************************************************************/
+auto vita_udp_rx_impl::txLatencyMsg() -> void
+{
+    auto now = std::chrono::steady_clock::now();
+    if (now - d_last_latency_report < d_latency_report_period) {
+        return;
+    }
+    d_last_latency_report = now;
+
+    auto stats = get_latency_stats();
+    auto dict = pmt::make_dict();
+    dict = pmt::dict_add(dict, pmt::mp("src_ip"), pmt::mp(d_src_ip));
+    dict = pmt::dict_add(dict, pmt::mp("port"), pmt::from_long(d_port));
+    dict = pmt::dict_add(dict, pmt::mp("count"), pmt::from_uint64(uint64_t(stats[0])));
+    dict = pmt::dict_add(dict, pmt::mp("p50_us"), pmt::from_double(stats[1]));
+    dict = pmt::dict_add(dict, pmt::mp("p99_us"), pmt::from_double(stats[2]));
+    dict = pmt::dict_add(dict, pmt::mp("max_us"), pmt::from_double(stats[3]));
+    message_port_pub(status_port, pmt::cons(pmt::mp("latency"), dict));
+}
+
+/*******************************************************************************
+ * \brief Transmit the detected packet layout as a status message
+ *******************************************************************************/
+auto vita_udp_rx_impl::txLayoutMsg() -> void
+{
+    auto const& layout = d_detector.layout();
+    auto dict = pmt::make_dict();
+    dict = pmt::dict_add(dict, pmt::mp("description"), pmt::mp(layout.to_string()));
+    dict = pmt::dict_add(dict, pmt::mp("uses_v491"), pmt::from_bool(layout.vrlp));
+    dict = pmt::dict_add(dict, pmt::mp("swap_bytes"), pmt::from_bool(layout.byte_swapped));
+    dict = pmt::dict_add(
+        dict, pmt::mp("header_byte_offset"), pmt::from_long(layout.header_bytes));
+    dict = pmt::dict_add(
+        dict, pmt::mp("samples_per_packet"), pmt::from_long(layout.samples_per_packet));
+    dict = pmt::dict_add(
+        dict, pmt::mp("bytes_per_packet"), pmt::from_long(layout.frame_bytes));
+    dict = pmt::dict_add(dict, pmt::mp("class_id"), pmt::from_bool(layout.has_class_id));
+    dict = pmt::dict_add(dict, pmt::mp("trailer"), pmt::from_bool(layout.has_trailer));
+    message_port_pub(status_port, pmt::cons(pmt::mp("layout"), dict));
+}
+
+/*******************************************************************************
+ * \brief Packet layout found by auto detection
+ *******************************************************************************/
+auto vita_udp_rx_impl::get_detected_layout() -> std::string
+{
+    gr::thread::scoped_lock lock(d_layout_mutex);
+    return d_layout_str;
+}
+
+/*******************************************************************************
+ * \brief Latency statistics since the last reset
+ * \return [packet count, p50 (us), p99 (us), max (us)]
+ *******************************************************************************/
+auto vita_udp_rx_impl::get_latency_stats() -> std::vector<double>
+{
+    gr::thread::scoped_lock lock(d_latency_mutex);
+    return { double(d_latency.count()),
+             d_latency.percentile(50.0) * 1e-3,
+             d_latency.percentile(99.0) * 1e-3,
+             double(d_latency.max()) * 1e-3 };
+}
+
+/*******************************************************************************
+ * \brief Clear the latency statistics
+ *******************************************************************************/
+auto vita_udp_rx_impl::reset_latency_stats() -> void
+{
+    gr::thread::scoped_lock lock(d_latency_mutex);
+    d_latency.reset();
+}
+
 /*******************************************************************************
  * \brief Override of GNURadio start function
  * \return true if socket opened false if error
@@ -540,6 +700,16 @@ bool vita_udp_rx_impl::start()
         }
     }
 
+    if (d_kernel_timestamps) {
+        // Ask the kernel to timestamp each datagram on arrival. Not fatal if
+        // unsupported; latency statistics are simply not collected.
+        if (setsockopt(sockfd, SOL_SOCKET, SO_TIMESTAMPNS, &enable, sizeof(int)) < 0) {
+            std::cerr << "gr::CyberRadio::vita_udp_rx_impl: setsockopt SO_TIMESTAMPNS "
+                      << "failed; latency statistics disabled" << std::endl;
+            d_kernel_timestamps = false;
+        }
+    }
+
     // Bind the socket
     sockaddr_in myaddr;
     memset((char*)&myaddr, 0, sizeof(myaddr));
@@ -585,8 +755,21 @@ int vita_udp_rx_impl::general_work(int noutput_items,
                                    [[maybe_unused]],
                                    gr_vector_void_star& output_items)
 {
+    if (not d_layout_locked) {
+        if (detect_layout()) {
+            txLayoutMsg();
+        }
+        // output_multiple has just changed; come back with room for whole packets
+        return 0;
+    }
+
     auto samples_needed = noutput_items;
     auto outP = static_cast<gr_complex*>(output_items[0]);
+    d_out_base = outP;
+
+    if (d_kernel_timestamps and d_latency_report_period.count() > 0) {
+        txLatencyMsg();
+    }
 
     // This method is called because there is room to fill the output buffer. We know
     // it's at least one packet; wait until the next packet is received
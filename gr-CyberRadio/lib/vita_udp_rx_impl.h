@@ -22,6 +22,11 @@
 #define INCLUDED_CYBERRADIO_VITA_UDP_RX_IMPL_H
 
 #include "CyberRadio/vita_udp_rx.h"
+#include "latency_histogram.h"
+#include "vita_layout.h"
+#include <gnuradio/thread/thread.h>
+#include <chrono>
+#include <ctime>
 #include <vector>
 
 namespace gr {
@@ -37,12 +42,13 @@ private:
     unsigned short const d_port;
     int d_sock;
 
-    int const d_samples_per_packet;
-    size_t const d_header_byte_offset;
-    size_t const d_bytes_per_packet;
-    bool const d_swap_bytes;
+    // Packet layout; these are replaced by the detected values in auto_detect mode
+    int d_samples_per_packet;
+    size_t d_header_byte_offset;
+    size_t d_bytes_per_packet;
+    bool d_swap_bytes;
     bool const d_swap_iq;
-    bool const d_uses_v49_1;
+    bool d_uses_v49_1;
     bool const d_is_narrowband;
     bool const d_tag_packets;
     bool d_debug;
@@ -51,9 +57,31 @@ private:
 
     std::vector<uint8_t> d_buffer;
 
+    // Receive latency measurement
+    bool d_kernel_timestamps;
+    int const d_latency_tag_interval;
+    std::chrono::duration<float> const d_latency_report_period;
+    timespec d_rx_time;         ///< kernel receive time of the buffered packet
+    bool d_rx_time_valid;
+    uint64_t d_packets_seen;
+    latency_histogram d_latency;
+    gr::thread::mutex d_latency_mutex;
+    std::chrono::steady_clock::time_point d_last_latency_report;
+    gr_complex* d_out_base;     ///< start of the output buffer for this work call
+
+    // Packet layout detection
+    bool const d_auto_detect;
+    bool d_layout_locked;
+    vita_layout_detector d_detector;
+    std::string d_layout_str;
+    gr::thread::mutex d_layout_mutex;
+
 protected:
     // Methods
+    auto receive_datagram() -> ssize_t;
     auto receive_packet() -> bool;
+    auto detect_layout() -> bool;
+    auto txLayoutMsg() -> void;
     auto process_packet(gr_complex*& outP, int samples_needed) -> int;
     auto process_v491_packet(gr_complex*& outP) -> int;
     auto handle_dropped_packet(unsigned packet_counter,
@@ -64,6 +92,8 @@ protected:
 
     auto tag_packet(int stream, int offset) -> void;
     auto tag_v491_packet(int stream, int offset) -> void;
+    auto record_latency(int offset) -> void;
+    auto txLatencyMsg() -> void;
 
 public:
     vita_udp_rx_impl(Cfg const& cfg);
@@ -71,6 +101,10 @@ public:
     void rxControlMsg(pmt::pmt_t msg);
     void txStatusMsg();
 
+    auto get_latency_stats() -> std::vector<double> override;
+    auto reset_latency_stats() -> void override;
+    auto get_detected_layout() -> std::string override;
+
     bool start() override;
     bool stop() override;
 
@@ -0,0 +1,201 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "wola_log_mag_fft_cf_impl.h"
+#include "fold_kernels.h"
+#include "single_pole_iir_kernels.h"
+#include "spectral_cache.h"
+#include <cstring>
+#include <gnuradio/io_signature.h>
+#include <stdexcept>
+#include <volk/volk.h>
+
+namespace gr {
+namespace CyberRadio {
+
+wola_log_mag_fft_cf::sptr
+wola_log_mag_fft_cf::make(int fft_size, int n_overlap,
+                          const std::string &window_type, double avg_alpha,
+                          int nthreads) {
+  return gnuradio::get_initial_sptr(new wola_log_mag_fft_cf_impl(
+      fft_size, n_overlap, window_type, avg_alpha, nthreads));
+}
+
+/*
+ * acc[k] (+)= x[k] * c[k] over n floats; the first segment stores instead
+ * of accumulating, and also writes the small FFT's windowed copy so the
+ * segment is read once.
+ */
+static inline void fold_first(float *acc, float *small, const float *x,
+                              const float *c, const float *cs, size_t n) {
+  size_t k = 0;
+#if defined(__GNUC__)
+  typedef float v8sf __attribute__((vector_size(32)));
+  for (; k + 8 <= n; k += 8) {
+    v8sf vx, vc, vs;
+    memcpy(&vx, x + k, sizeof(vx));
+    memcpy(&vc, c + k, sizeof(vc));
+    memcpy(&vs, cs + k, sizeof(vs));
+    vc *= vx;
+    vs *= vx;
+    memcpy(acc + k, &vc, sizeof(vc));
+    memcpy(small + k, &vs, sizeof(vs));
+  }
+#endif
+  for (; k < n; k++) {
+    acc[k] = x[k] * c[k];
+    small[k] = x[k] * cs[k];
+  }
+}
+
+/*
+ * The private constructor
+ */
+wola_log_mag_fft_cf_impl::wola_log_mag_fft_cf_impl(
+    int fft_size, int n_overlap, const std::string &window_type,
+    double avg_alpha, int nthreads)
+    : gr::sync_block(
+          "wola_log_mag_fft_cf",
+          io_signature::make(1, 1, sizeof(gr_complex) * fft_size *
+                                       (n_overlap > 0 ? n_overlap : 1)),
+          io_signature::make(1, 4, sizeof(float) * fft_size)),
+      d_fft_size(fft_size), d_n_overlap(n_overlap), d_alpha(1.0f),
+      d_primed(false), d_log(10.0f) {
+  if (fft_size < 1 || n_overlap < 1)
+    throw std::invalid_argument(
+        "wola_log_mag_fft_cf: fft_size and n_overlap must be positive");
+  d_fft = new fft_batch(fft_size, NUM_SPECTRA, true, nthreads);
+  size_t align = volk_get_alignment();
+  d_fold_coef = (float *)volk_malloc(
+      sizeof(float) * 2 * fft_size * n_overlap, align);
+  d_small_coef = (float *)volk_malloc(sizeof(float) * 2 * fft_size, align);
+  d_mag = (float *)volk_malloc(sizeof(float) * fft_size, align);
+  for (int s = 0; s < NUM_SPECTRA; s++) {
+    d_avg[s] = (float *)volk_malloc(sizeof(float) * fft_size, align);
+    memset(d_avg[s], 0, sizeof(float) * fft_size);
+  }
+  compute_coefficients(window_type);
+  set_avg_alpha(avg_alpha);
+  message_port_register_in(pmt::mp("reset"));
+  set_msg_handler(pmt::mp("reset"),
+                  boost::bind(&wola_log_mag_fft_cf_impl::rxResetMsg, this, _1));
+}
+
+wola_log_mag_fft_cf_impl::~wola_log_mag_fft_cf_impl() {
+  delete d_fft;
+  volk_free(d_fold_coef);
+  volk_free(d_small_coef);
+  volk_free(d_mag);
+  for (int s = 0; s < NUM_SPECTRA; s++)
+    volk_free(d_avg[s]);
+}
+
+/*
+ * Same scaling as the old hier block: the long window divided by
+ * sum/(fft_size*n_overlap), then log_mag_fft's unit-sum boxcar (1/fft_size),
+ * i.e. n_overlap times the unit-sum window.  The small window has unit sum.
+ */
+void wola_log_mag_fft_cf_impl::compute_coefficients(
+    const std::string &window_type) {
+  const int len = d_fft_size * d_n_overlap;
+  window_sptr w = cached_window(window_type, len, WINDOW_NORM_SUM);
+  window_sptr ws = cached_window(window_type, d_fft_size, WINDOW_NORM_SUM);
+  const float scale = float(d_n_overlap);
+  for (int k = 0; k < len; k++)
+    d_fold_coef[2 * k] = d_fold_coef[2 * k + 1] = (*w)[k] * scale;
+  for (int k = 0; k < d_fft_size; k++)
+    d_small_coef[2 * k] = d_small_coef[2 * k + 1] = (*ws)[k];
+  d_window_type = window_type;
+}
+
+void wola_log_mag_fft_cf_impl::set_avg_alpha(double alpha) {
+  if (alpha < 0 || alpha > 1)
+    throw std::out_of_range("Alpha must be in [0, 1]\n");
+  gr::thread::scoped_lock lock(d_mutex);
+  d_alpha = float(alpha);
+}
+
+void wola_log_mag_fft_cf_impl::set_window_type(
+    const std::string &window_type) {
+  gr::thread::scoped_lock lock(d_mutex);
+  if (window_type != d_window_type)
+    compute_coefficients(window_type);
+}
+
+void wola_log_mag_fft_cf_impl::reset() {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_primed = false;
+}
+
+void wola_log_mag_fft_cf_impl::set_nthreads(int n) {
+  gr::thread::scoped_lock lock(d_mutex);
+  d_fft->set_nthreads(n);
+}
+
+void wola_log_mag_fft_cf_impl::rxResetMsg(pmt::pmt_t msg) { reset(); }
+
+int wola_log_mag_fft_cf_impl::work(int noutput_items,
+                                   gr_vector_const_void_star &input_items,
+                                   gr_vector_void_star &output_items) {
+  gr::thread::scoped_lock lock(d_mutex);
+  const int N = d_fft_size;
+  const size_t seg = 2 * size_t(N); // floats per segment
+  const int half = N / 2;
+  const int upper = N - half;
+  const int nout = int(output_items.size());
+  const float alpha = d_alpha;
+
+  for (int i = 0; i < noutput_items; i++) {
+    const float *in =
+        (const float *)input_items[0] + size_t(i) * seg * d_n_overlap;
+    float *fold = (float *)d_fft->get_inbuf(WOLA);
+    float *small = (float *)d_fft->get_inbuf(SMALL);
+    fold_first(fold, small, in, d_fold_coef, d_small_coef, seg);
+    for (int n = 1; n < d_n_overlap; n++)
+      fold_accumulate(fold, in + n * seg, d_fold_coef + n * seg, seg);
+    d_fft->execute();
+
+    for (int s = 0; s < NUM_SPECTRA; s++) {
+      const gr_complex *fft_out = d_fft->get_outbuf(s);
+      float *avg = d_avg[s];
+      // fft_vcc's shift: the upper floor(N/2) bins move to the front
+      volk_32fc_magnitude_squared_32f(d_mag, fft_out + half, upper);
+      volk_32fc_magnitude_squared_32f(d_mag + upper, fft_out, half);
+      if (!d_primed)
+        memcpy(avg, d_mag, sizeof(float) * N);
+      else
+        single_pole_iir_update(avg, NULL, d_mag, alpha, N);
+      if (2 * s < nout)
+        nlog10_kernel((float *)output_items[2 * s] + i * N, avg, d_log, N);
+      if (2 * s + 1 < nout)
+        memcpy((float *)output_items[2 * s + 1] + i * N, avg,
+               sizeof(float) * N);
+    }
+    d_primed = true;
+  }
+  return noutput_items;
+}
+
+} /* namespace CyberRadio */
+} /* namespace gr */
@@ -0,0 +1,75 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2026 CyberRadio Solutions, Inc.
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_CYBERRADIO_WOLA_LOG_MAG_FFT_CF_IMPL_H
+#define INCLUDED_CYBERRADIO_WOLA_LOG_MAG_FFT_CF_IMPL_H
+
+#include <CyberRadio/wola_log_mag_fft_cf.h>
+#include "fft_batch.h"
+#include "nlog10_kernels.h"
+#include <gnuradio/thread/thread.h>
+
+namespace gr {
+namespace CyberRadio {
+
+class wola_log_mag_fft_cf_impl : public wola_log_mag_fft_cf {
+private:
+  enum { WOLA = 0, SMALL = 1, NUM_SPECTRA = 2 };
+
+  int d_fft_size;
+  int d_n_overlap;
+  std::string d_window_type;
+  float d_alpha;
+  fft_batch *d_fft;   // transform WOLA is the fold, SMALL the first segment
+  // Coefficients are stored once per float (re and im), so the fold is a
+  // plain float multiply-accumulate over 2*fft_size values per segment
+  float *d_fold_coef;   // 2*fft_size*n_overlap
+  float *d_small_coef;  // 2*fft_size
+  float *d_mag;
+  float *d_avg[NUM_SPECTRA];
+  bool d_primed;
+  nlog10_params d_log;
+  gr::thread::mutex d_mutex;
+
+  void compute_coefficients(const std::string &window_type);
+  void rxResetMsg(pmt::pmt_t msg);
+
+public:
+  wola_log_mag_fft_cf_impl(int fft_size, int n_overlap,
+                           const std::string &window_type, double avg_alpha,
+                           int nthreads);
+  ~wola_log_mag_fft_cf_impl();
+
+  void set_avg_alpha(double alpha);
+  double avg_alpha() const { return d_alpha; }
+  void set_window_type(const std::string &window_type);
+  std::string window_type() const { return d_window_type; }
+  void reset();
+  void set_nthreads(int n);
+  int nthreads() const { return d_fft->nthreads(); }
+
+  int work(int noutput_items, gr_vector_const_void_star &input_items,
+           gr_vector_void_star &output_items);
+};
+
+} // namespace CyberRadio
+} // namespace gr
+
+#endif /* INCLUDED_CYBERRADIO_WOLA_LOG_MAG_FFT_CF_IMPL_H */
@@ -61,5 +61,10 @@ from .qt_freq_time_sink_iq import qt_freq_time_sink_iq
 from .qt_freq_time_sink_real import qt_freq_time_sink_real
 from .safe_audio_sink import safe_audio_sink
 from .sinad_calc_block import sinad_calc_block
+from . import spectral_cache
+from . import spectrum_occupancy
+from . import vita49
+from . import vita_file_analyzer
+from . import vita_spectrogram
 from .wola_log_mag_fft import wola_log_mag_fft
 #
@@ -26,11 +26,21 @@ from gnuradio import gr
 from gnuradio.fft import window
 from gnuradio.filter import firdes
 import CyberRadio
-import numpy, scipy.signal
+import numpy
+from . import spectral_cache
 
 class log_mag_fft(gr.hier_block2):
 	"""
-	docstring for block log_mag_fft
+	Windowed FFT, magnitude, single-pole averaging and log magnitude.
+
+	By default (fused=True) the work is done by the log_mag_fft_cf block in
+	one pass per vector; fused=False builds the original chain of fft_vcc,
+	complex_to_mag(_squared), single_pole_iir_filter_ff and vector_nlog10_ff
+	blocks.  The outputs are the same either way.
+
+	With numInputs > 1, the fused block transforms all inputs together with
+	one batched FFTW plan.  nthreads sets the FFTW thread count (for the
+	chain, the thread count of each fft_vcc).
 	"""
 	def __init__(self,
 					numInputs=1,
@@ -40,6 +50,8 @@ class log_mag_fft(gr.hier_block2):
 					secondaryOutput="fft",
 					resetOnAlphaChange = False,
 					magSquared = True,
+					fused = True,
+					nthreads = 1,
 					 ):
 
 		numOutput = numInputs
@@ -83,16 +95,31 @@ class log_mag_fft(gr.hier_block2):
 		self.windowType = windowType
 		self.resetOnAlphaChange = resetOnAlphaChange
 		self.magSquared = magSquared
+		self.nthreads = nthreads
 		self.nLog10_n = 10 if self.magSquared else 20
 
 		##################################################
 		# Variables
 		##################################################
-		self.fftWindow = fftWindow = scipy.signal.get_window(windowType, fftSize)
+		self.fftWindow = fftWindow = spectral_cache.get_window(windowType, fftSize)
 
 		##################################################
 		# Blocks
 		##################################################
+		self.fused = fused
+		if fused:
+			# One block does window, FFT, magnitude, averaging and log
+			self.logMagFFT = CyberRadio.log_mag_fft_cf(
+				numInputs, fftSize, [float(x) for x in fftWindow],
+				iirAlpha if iirAlpha is not None else 1.0,
+				secondaryOutput, resetOnAlphaChange, magSquared, nthreads)
+			self.msg_connect((self, "reset"), (self.logMagFFT, "reset"))
+			for i in range(numOutput):
+				self.connect((self.logMagFFT, i), (self, i))
+			for i in range(numInputs):
+				self.connect((self, i), (self.logMagFFT, i))
+			return
+
 		self.nLog10=[CyberRadio.vector_nlog10_ff(self.nLog10_n, fftSize, 0) for i in range(numInputs)]
 		if connectLogMagUnfiltered:
 			self.nLog10 += [CyberRadio.vector_nlog10_ff(self.nLog10_n, fftSize, 0) for i in range(numInputs)]
@@ -104,7 +131,7 @@ class log_mag_fft(gr.hier_block2):
 			self.compToMag=[blocks.complex_to_mag_squared(fftSize) for i in range(numInputs)]
 		else:
 			self.compToMag=[blocks.complex_to_mag(fftSize) for i in range(numInputs)]
-		self.fwdFFT=[fft.fft_vcc(fftSize, True, (fftWindow/numpy.sum(fftWindow)), True, 1) for i in range(numInputs)]
+		self.fwdFFT=[fft.fft_vcc(fftSize, True, spectral_cache.get_window(windowType, fftSize, "sum"), True, nthreads) for i in range(numInputs)]
 
 		##################################################
 		# Connections
@@ -139,9 +166,24 @@ class log_mag_fft(gr.hier_block2):
 		return self.iirAlpha
 
 	def set_iirAlpha(self, iirAlpha):
-		if self.singlePoleIIR is not None:
+		if self.fused:
+			if self.iirAlpha is not None:
+				self.iirAlpha = iirAlpha
+				self.logMagFFT.set_iir_alpha(iirAlpha)
+		elif self.singlePoleIIR is not None:
 			self.iirAlpha = iirAlpha
 			res = [i.set_taps(self.iirAlpha) for i in self.singlePoleIIR]
 
+	def get_nthreads(self):
+		return self.nthreads
+
+	def set_nthreads(self, nthreads):
+		self.nthreads = nthreads
+		if self.fused:
+			self.logMagFFT.set_nthreads(nthreads)
+		else:
+			for f in self.fwdFFT:
+				f.set_nthreads(nthreads)
+
 	def get_windowType(self):
 		return self.windowType
@@ -25,8 +25,9 @@ from gnuradio import filter
 from gnuradio import gr
 from gnuradio.fft import window
 from gnuradio.filter import firdes
-import numpy, scipy.signal
+import numpy
 import CyberRadio
+from . import spectral_cache
 
 class ndr804ptt_snapshot_fft_source(gr.hier_block2):
     """
@@ -68,7 +69,7 @@ class ndr804ptt_snapshot_fft_source(gr.hier_block2):
         ##################################################
         # Variables
         ##################################################
-        self.fftWindow = fftWindow = scipy.signal.get_window(fftWindowType,fftSize)
+        self.fftWindow = fftWindow = spectral_cache.get_window(fftWindowType,fftSize)
         self.windowScale = windowScale = fftWindow.sum()/fftWindow.size
         
         ##################################################
@@ -87,12 +88,13 @@ class ndr804ptt_snapshot_fft_source(gr.hier_block2):
         self.snapshotToVector = blocks.stream_to_vector(gr.sizeof_gr_complex*1, fftSize)
         self.snapshotSource = CyberRadio.snapshot_source_c('0.0.0.0', udpPort, fftSize, rate)
         if doLog10:
-            self.log10_direct = CyberRadio.vector_nlog10_ff(10, outSize, 0)
+            # |X|^2 and 10*log10 in one pass, straight from the FFT bins
+            self.log10_direct = CyberRadio.vector_mag_squared_log10_cf(10, outSize, 0)
             self.nullSink_direct = blocks.null_sink(gr.sizeof_float*outSize)
         else:
             self.log10_direct = None
-        self.fftBlock = fft.fft_vcc(fftSize, True, (fftWindow/fftWindow.sum()), True, 1)
-        self.extractPacketPayload = CyberRadio.vector_keep_m_in_n(gr.sizeof_gr_complex, outSize, fftSize, (fftSize-outSize)/2)
+        self.fftBlock = fft.fft_vcc(fftSize, True, spectral_cache.get_window(fftWindowType, fftSize, "sum"), True, 1)
+        self.extractPacketPayload = CyberRadio.vector_keep_m_in_n(gr.sizeof_gr_complex, outSize, fftSize, (fftSize-outSize)//2)
         self.ddcControl = CyberRadio.generic_ddc_control_block( 
                     radioParam, 
                     index, 
@@ -111,14 +113,16 @@ class ndr804ptt_snapshot_fft_source(gr.hier_block2):
                     otherDdcArgs, 
                     False
                      )
-        self.compToMagSq = blocks.complex_to_mag_squared(outSize)
+        if (numOut > 1) or not doLog10:
+            self.compToMagSq = blocks.complex_to_mag_squared(outSize)
+        else:
+            self.compToMagSq = None
         self.avgFilterList = []
         self.avgNullSinkList = []
         self.avgLog10List = []
         
         for i in range(numOut-1):
-            #cep test self.avgFilterList.append( filter.single_pole_iir_filter_ff(avgGainList[i], outSize) )
-            self.avgFilterList.append( CyberRadio.vector_single_pole_iir_filter_ff(avgGainList[i], outSize, True) )
+            self.avgFilterList.append( CyberRadio.single_pole_iir_filter_ff(avgGainList[i], outSize, True) )
             self.avgNullSinkList.append( blocks.null_sink(gr.sizeof_float*outSize) )
             if doLog10:
                 self.avgLog10List.append( CyberRadio.vector_nlog10_ff(10, outSize, 0) )
@@ -131,7 +135,7 @@ class ndr804ptt_snapshot_fft_source(gr.hier_block2):
                 
         for i in range(numOut-1):
             self.connect((self.compToMagSq, 0), (self.avgFilterList[i], 0))
-            #cep test self.msg_connect((self, 'clearAvg'), (self.avgFilterList[i], 'clear'))
+            self.msg_connect((self, 'clearAvg'), (self.avgFilterList[i], 'reset'))
             if doLog10:
                 self.connect((self.avgFilterList[i], 0), (self.avgLog10List[i], 0))
                 self.connect((self.avgLog10List[i], 0), (self.avgNullSinkList[i], 0))
@@ -140,12 +144,13 @@ class ndr804ptt_snapshot_fft_source(gr.hier_block2):
                 self.connect((self.avgFilterList[i], 0), (self.avgNullSinkList[i], 0))
                 self.connect((self.avgFilterList[i], 0), (self, i+1))   
         if doLog10:
-            self.connect((self.compToMagSq, 0), (self.log10_direct, 0)) 
+            self.connect((self.extractPacketPayload, 0), (self.log10_direct, 0)) 
             self.connect((self.log10_direct, 0), (self.nullSink_direct, 0)) 
             self.connect((self.log10_direct, 0), (self, 0)) 
         else:
             self.connect((self.compToMagSq, 0), (self, 0))  
-        self.connect((self.extractPacketPayload, 0), (self.compToMagSq, 0))
+        if self.compToMagSq is not None:
+            self.connect((self.extractPacketPayload, 0), (self.compToMagSq, 0))
         self.connect((self.fftBlock, 0), (self.extractPacketPayload, 0))
         self.connect((self.snapshotToVector, 0), (self.fftBlock, 0))
         self.connect((self.snapshotSource, 0), (self.snapshotToVector, 0))
@@ -185,14 +190,14 @@ class ndr804ptt_snapshot_fft_source(gr.hier_block2):
 
     def set_fftSize(self, fftSize):
         self.fftSize = fftSize
-        self.set_fftWindow(scipy.signal.get_window(self.fftWindowType,self.fftSize))
+        self.set_fftWindow(spectral_cache.get_window(self.fftWindowType,self.fftSize))
 
     def get_fftWindowType(self):
         return self.fftWindowType
 
     def set_fftWindowType(self, fftWindowType):
         self.fftWindowType = fftWindowType
-        self.set_fftWindow(scipy.signal.get_window(self.fftWindowType,self.fftSize))
+        self.set_fftWindow(spectral_cache.get_window(self.fftWindowType,self.fftSize))
 
     def get_index(self):
         return self.index
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 CyberRadio Solutions, Inc.
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+"""
+Shared, memoized FFT windows.
+
+Spectral blocks used to call scipy.signal.get_window() from their
+constructors and again from every setter that touched the window, which
+for 2^17-point windows is measurable at startup and on every retune.
+get_window() here keeps the most recently used windows, keyed by
+(type, size, normalization), and hands out the same read-only array to
+every caller::
+
+    from CyberRadio import spectral_cache
+    w = spectral_cache.get_window("blackmanharris", 2**17, "sum")
+
+The C++ blocks have the matching cache, including the FFTW plans and the
+wisdom file, in lib/spectral_cache.h.
+"""
+
+import functools
+
+import numpy
+import scipy.signal
+
+#: Windows kept before the least recently used is dropped
+CACHE_SIZE = 32
+
+NORMALIZATIONS = (None, "sum", "energy")
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _window(window_type, size, normalization):
+    w = scipy.signal.get_window(window_type, size)
+    if normalization == "sum":
+        w = w / numpy.sum(w)
+    elif normalization == "energy":
+        w = w / numpy.sqrt(numpy.sum(w * w))
+    w.setflags(write=False)
+    return w
+
+
+def get_window(window_type, size, normalization=None):
+    """
+    scipy.signal.get_window(window_type, size), scaled and cached.
+
+    normalization is None (as generated), "sum" (unit sum, the scaling
+    log_mag_fft applies) or "energy" (unit sum of squares).  window_type is
+    anything scipy accepts, including tuples such as ("kaiser", 8.6).  The
+    result is shared between callers and is read-only; copy it to modify it.
+    """
+    if normalization not in NORMALIZATIONS:
+        raise ValueError("normalization must be one of %r" % (NORMALIZATIONS,))
+    if isinstance(window_type, list):
+        window_type = tuple(window_type)
+    return _window(window_type, int(size), normalization)
+
+
+def cache_info():
+    """Hit and miss counts, as functools.lru_cache reports them."""
+    return _window.cache_info()
+
+
+def cache_clear():
+    _window.cache_clear()
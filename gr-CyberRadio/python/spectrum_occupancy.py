@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 CyberRadio Solutions, Inc.
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+"""
+Reader for the snapshot files written by spectrum_occupancy_f.
+
+Each record is one time bucket of per-bin statistics::
+
+    from CyberRadio import spectrum_occupancy
+    for snap in spectrum_occupancy.read_snapshots("survey.crso"):
+        print(snap["start"], snap["frames"], snap["occupancy"].max())
+
+The record layout is described in spectrum_occupancy_f.h.
+"""
+
+import numpy
+
+MAGIC = b"CRSO"
+VERSION = 1
+
+_HEADER = numpy.dtype([("magic", "S4"), ("version", "<u4"), ("vlen", "<u4"),
+                       ("num_percentiles", "<u4"), ("start", "<f8"),
+                       ("stop", "<f8"), ("frames", "<u8")])
+
+
+def read_snapshots(filename):
+    """
+    Return the snapshots in `filename` as a list of dicts.
+
+    Keys are those of the block's snapshot messages: start, stop (Unix
+    seconds), frames, occupancy (fraction), mean and max (dB), percentiles
+    (fractions) and levels (dB, one row per percentile).  The files are
+    written in the writer's byte order; little endian is assumed here.
+    """
+    data = numpy.fromfile(filename, dtype=numpy.uint8)
+    snapshots = []
+    pos = 0
+    while pos + _HEADER.itemsize <= len(data):
+        hdr = numpy.frombuffer(data, _HEADER, 1, pos)[0]
+        if hdr["magic"] != MAGIC or hdr["version"] != VERSION:
+            raise ValueError("%s: bad snapshot record at byte %d"
+                             % (filename, pos))
+        vlen = int(hdr["vlen"])
+        npct = int(hdr["num_percentiles"])
+        pos += _HEADER.itemsize
+        size = 4 * npct + 2 * vlen * (3 + npct)
+        if pos + size > len(data):
+            break  # truncated last record
+        percentiles = numpy.frombuffer(data, "<f4", npct, pos)
+        pos += 4 * npct
+        occupancy = numpy.frombuffer(data, "<u2", vlen, pos) / 65535.0
+        pos += 2 * vlen
+        rows = numpy.frombuffer(data, "<i2", vlen * (2 + npct), pos)
+        rows = rows.reshape(2 + npct, vlen) * 0.01
+        pos += 2 * vlen * (2 + npct)
+        snapshots.append({
+            "start": float(hdr["start"]),
+            "stop": float(hdr["stop"]),
+            "frames": int(hdr["frames"]),
+            "occupancy": occupancy,
+            "mean": rows[0],
+            "max": rows[1],
+            "percentiles": percentiles.copy(),
+            "levels": rows[2:],
+        })
+    return snapshots
@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 CyberRadio Solutions, Inc.
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+"""
+Vectorized VITA 49 packet parsing.
+
+This is the NumPy counterpart of the C++ vita49_view
+(CyberRadio/vita49_view.h): the same field decoding, driven by the packet
+type, C, T, TSI and TSF header bits, but applied to every packet in a buffer
+at once.  A buffer can be anything that supports the buffer protocol
+(bytes, bytearray, mmap, numpy arrays).
+
+Typical use::
+
+    from CyberRadio import vita49
+    hdrs = vita49.parse(buf)                 # structured array, one row per packet
+    iq = vita49.iq_samples(buf, hdrs)        # zero-copy int16 view, (npackets, nsamples, 2)
+    x = vita49.to_complex(iq)                # complex64 copy
+"""
+
+import numpy
+
+VRLP = 0x56524c50
+VEND = 0x56454e44
+
+#: Fields produced by parse().  Sizes are in bytes unless noted.
+HEADER_DTYPE = numpy.dtype([
+    ('offset', numpy.int64),            # start of the packet in the buffer
+    ('framed', numpy.bool_),            # VITA 49.1 VRLP/VEND framing present
+    ('frame_count', numpy.uint16),
+    ('frame_size', numpy.uint32),       # 32-bit words, 0 if not framed
+    ('packet_type', numpy.uint8),
+    ('class_id_present', numpy.bool_),  # C bit
+    ('trailer_present', numpy.bool_),   # T bit
+    ('tsi', numpy.uint8),
+    ('tsf', numpy.uint8),
+    ('packet_count', numpy.uint8),
+    ('packet_size', numpy.uint16),      # 32-bit words
+    ('stream_id', numpy.uint32),
+    ('oui', numpy.uint32),
+    ('icc', numpy.uint16),
+    ('pcc', numpy.uint16),
+    ('timestamp_int', numpy.uint32),
+    ('timestamp_frac', numpy.uint64),
+    ('payload_offset', numpy.int64),    # first sample, from the start of the buffer
+    ('payload_bytes', numpy.int64),
+    ('trailer', numpy.uint32),
+])
+
+# Bytes scanned per pass when searching for VRLP words; bounds the size of
+# the temporaries on very large (memory-mapped) buffers.
+_SCAN_CHUNK = 64 * 1024 * 1024
+
+
+def _as_bytes(buf):
+    """Return a flat uint8 view of a buffer, without copying."""
+    if isinstance(buf, numpy.ndarray):
+        return buf.reshape(-1).view(numpy.uint8)
+    return numpy.frombuffer(buf, dtype=numpy.uint8)
+
+
+def _big(byte_order):
+    if byte_order not in ('>', '<'):
+        raise ValueError("byte_order must be '>' or '<'")
+    return byte_order == '>'
+
+
+def _words(b, pos, big_endian):
+    """Gather the 32-bit words at byte positions pos (clipped to the buffer)."""
+    pos = numpy.clip(pos, 0, max(len(b) - 4, 0))
+    b0 = b[pos].astype(numpy.uint32)
+    b1 = b[pos + 1].astype(numpy.uint32)
+    b2 = b[pos + 2].astype(numpy.uint32)
+    b3 = b[pos + 3].astype(numpy.uint32)
+    if big_endian:
+        return (b0 << 24) | (b1 << 16) | (b2 << 8) | b3
+    return (b3 << 24) | (b2 << 16) | (b1 << 8) | b0
+
+
+def detect_byte_order(buf):
+    """
+    Guess the byte order of the VITA words in a buffer.
+
+    Looks for the VRLP framing word near the start of the buffer; without
+    framing, takes the order in which the first header's packetSize is
+    plausible (network order wins a tie).
+
+    :returns: '>' (big endian) or '<' (little endian)
+    """
+    b = _as_bytes(buf)
+    head = b[:1024 * 1024].tobytes()
+    be, le = head.find(b'VRLP'), head.find(b'PLRV')
+    if be >= 0 and (le < 0 or be <= le):
+        return '>'
+    if le >= 0:
+        return '<'
+    if len(b) >= 4:
+        for order in ('>', '<'):
+            hdr = int(_words(b, numpy.array([0]), _big(order))[0])
+            size = 4 * (hdr & 0xFFFF)
+            if (hdr >> 28) <= 3 and 4 < size <= len(b):
+                return order
+    return '>'
+
+
+def find_packets(buf, byte_order=None):
+    """
+    Find VITA 49.1 framed packets in a buffer.
+
+    Every occurrence of the VRLP word is a candidate; a candidate is kept if
+    its frameSize fits in the buffer, the frame ends with VEND, and it does
+    not start inside a frame found before it.  The scan is vectorized and
+    runs in chunks, so it is suitable for memory-mapped captures.
+
+    :param buf: buffer to search
+    :param byte_order: '>' or '<', or None to detect
+    :returns: int64 array of packet byte offsets, in order
+    """
+    b = _as_bytes(buf)
+    if byte_order is None:
+        byte_order = detect_byte_order(b)
+    big = _big(byte_order)
+    magic = numpy.frombuffer(b'VRLP' if big else b'PLRV', dtype=numpy.uint8)
+    found = []
+    n = len(b)
+    for start in range(0, max(n - 3, 0), _SCAN_CHUNK):
+        stop = min(start + _SCAN_CHUNK + 3, n)
+        c = b[start:stop]
+        m = len(c) - 3
+        hit = ((c[:m] == magic[0]) & (c[1:m + 1] == magic[1]) &
+               (c[2:m + 2] == magic[2]) & (c[3:m + 3] == magic[3]))
+        found.append(numpy.flatnonzero(hit) + start)
+    if not found:
+        return numpy.zeros(0, dtype=numpy.int64)
+    cand = numpy.concatenate(found).astype(numpy.int64)
+    if len(cand) == 0:
+        return cand
+    size = 4 * (_words(b, cand + 4, big) & 0xFFFFF).astype(numpy.int64)
+    end = cand + size
+    ok = (size >= 16) & (end <= n)
+    ok[ok] &= _words(b, end[ok] - 4, big) == VEND
+    cand, end = cand[ok], end[ok]
+    if len(cand) > 1:
+        # drop anything that starts inside an earlier frame
+        prev_end = numpy.maximum.accumulate(end)
+        keep = numpy.ones(len(cand), dtype=bool)
+        keep[1:] = cand[1:] >= prev_end[:-1]
+        cand = cand[keep]
+    return cand
+
+
+def packet_offsets(buf, packet_bytes):
+    """Offsets of back-to-back fixed-size packets (e.g. unframed captures)."""
+    n = len(_as_bytes(buf))
+    return numpy.arange(0, n - packet_bytes + 1, packet_bytes, dtype=numpy.int64)
+
+
+def parse(buf, offsets=None, byte_order=None, packet_bytes=None,
+          extension_words=0):
+    """
+    Parse the headers of many VITA 49 packets in one vectorized pass.
+
+    :param buf: buffer holding the packets
+    :param offsets: byte offsets of the packets; by default the buffer is
+        scanned with find_packets(), or split every packet_bytes
+    :param byte_order: '>' or '<', or None to detect
+    :param packet_bytes: size of each packet, for unframed captures
+    :param extension_words: vendor words between the standard header and the
+        samples (5 for the NDR358/NDR551 DDC words)
+    :returns: numpy structured array of HEADER_DTYPE
+    """
+    b = _as_bytes(buf)
+    if byte_order is None:
+        byte_order = detect_byte_order(b)
+    big = _big(byte_order)
+    if offsets is None:
+        if packet_bytes:
+            offsets = packet_offsets(b, packet_bytes)
+        else:
+            offsets = find_packets(b, byte_order)
+    o = numpy.asarray(offsets, dtype=numpy.int64)
+    out = numpy.zeros(len(o), dtype=HEADER_DTYPE)
+    if len(o) == 0:
+        return out
+
+    framed = _words(b, o, big) == VRLP
+    frame_word = numpy.where(framed, _words(b, o + 4, big), 0)
+    h = o + 8 * framed                      # VRT header position
+    hdr = _words(b, h, big)
+    ptype = (hdr >> 28) & 0x0F
+    has_c = ((hdr >> 27) & 0x01).astype(bool)
+    has_t = ((hdr >> 26) & 0x01).astype(bool)
+    tsi = (hdr >> 22) & 0x03
+    tsf = (hdr >> 20) & 0x03
+    psize = (hdr & 0xFFFF).astype(numpy.int64)
+    has_sid = (ptype & 0x01).astype(bool)
+
+    cls = h + 4 + 4 * has_sid
+    tsi_pos = cls + 8 * has_c
+    tsf_pos = tsi_pos + 4 * (tsi != 0)
+    header_end = tsf_pos + 8 * (tsf != 0)
+    total = numpy.where(framed, 4 * (frame_word & 0xFFFFF).astype(numpy.int64),
+                        4 * psize)
+    tail = 4 * has_t + 4 * framed
+
+    out['offset'] = o
+    out['framed'] = framed
+    out['frame_count'] = (frame_word >> 20) & 0xFFF
+    out['frame_size'] = frame_word & 0xFFFFF
+    out['packet_type'] = ptype
+    out['class_id_present'] = has_c
+    out['trailer_present'] = has_t
+    out['tsi'] = tsi
+    out['tsf'] = tsf
+    out['packet_count'] = (hdr >> 16) & 0x0F
+    out['packet_size'] = psize
+    out['stream_id'] = numpy.where(has_sid, _words(b, h + 4, big), 0)
+    out['oui'] = numpy.where(has_c, _words(b, cls, big) & 0x00FFFFFF, 0)
+    class2 = numpy.where(has_c, _words(b, cls + 4, big), 0)
+    out['icc'] = class2 >> 16
+    out['pcc'] = class2 & 0xFFFF
+    out['timestamp_int'] = numpy.where(tsi != 0, _words(b, tsi_pos, big), 0)
+    frac = ((_words(b, tsf_pos, big).astype(numpy.uint64) << numpy.uint64(32)) |
+            _words(b, tsf_pos + 4, big).astype(numpy.uint64))
+    out['timestamp_frac'] = numpy.where(tsf != 0, frac, 0)
+    out['payload_offset'] = header_end + 4 * extension_words
+    out['payload_bytes'] = numpy.maximum(
+        o + total - tail - out['payload_offset'], 0)
+    out['trailer'] = numpy.where(has_t, _words(b, h + 4 * (psize - 1), big), 0)
+    return out
+
+
+def iq_samples(buf, headers, byte_order=None, iq_swapped=False):
+    """
+    View the I/Q samples of parsed packets without copying them.
+
+    When every packet has the same payload size and the packets are evenly
+    spaced (the usual case for a capture from one stream), the result is a
+    single strided int16 array of shape (npackets, nsamples, 2) over the
+    original buffer, in the buffer's byte order.  Otherwise a list of
+    per-packet (nsamples, 2) views is returned.
+
+    :param iq_swapped: return Q/I ordered data as I/Q (still a view)
+    """
+    b = _as_bytes(buf)
+    if byte_order is None:
+        byte_order = detect_byte_order(b)
+    _big(byte_order)
+    dt = numpy.dtype(byte_order + 'i2')
+    pos = headers['payload_offset']
+    nbytes = headers['payload_bytes']
+    if len(headers) == 0:
+        return numpy.zeros((0, 0, 2), dtype=dt)
+    uniform = bool(numpy.all(nbytes == nbytes[0]))
+    steps = numpy.diff(pos)
+    if uniform and (len(pos) == 1 or bool(numpy.all(steps == steps[0]))):
+        stride = int(steps[0]) if len(pos) > 1 else int(nbytes[0])
+        iq = numpy.ndarray(shape=(len(pos), int(nbytes[0]) // 4, 2), dtype=dt,
+                           buffer=b, offset=int(pos[0]),
+                           strides=(stride, 4, 2))
+    else:
+        iq = [numpy.ndarray(shape=(int(n) // 4, 2), dtype=dt, buffer=b,
+                            offset=int(p)) for p, n in zip(pos, nbytes)]
+    if iq_swapped:
+        if isinstance(iq, list):
+            return [x[..., ::-1] for x in iq]
+        return iq[..., ::-1]
+    return iq
+
+
+def to_complex(iq, scale=1.0 / 32768):
+    """Convert an (..., 2) int16 I/Q array to complex64 (this copies)."""
+    x = numpy.asarray(iq, dtype=numpy.float32) * numpy.float32(scale)
+    return numpy.ascontiguousarray(x).view(numpy.complex64)[..., 0]
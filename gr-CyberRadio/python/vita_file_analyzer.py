@@ -0,0 +1,290 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 CyberRadio Solutions, Inc.
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+"""
+Offline analysis of VITA 49 capture files.
+
+The files vita_multifile_iq_source plays back are memory-mapped, scanned for
+packet boundaries and decoded in bulk with CyberRadio.vita49, so a whole
+capture is summarized (packet loss, timing gaps, sample rate) without
+walking it one packet at a time.  Sets of captures are analyzed in parallel
+with a process pool.
+
+Example::
+
+    from CyberRadio import vita_file_analyzer as vfa
+    cap = vfa.vita_capture("session1.vita")
+    cap.headers['timestamp_int']          # every packet's integer timestamp
+    iq = cap.iq()                          # int16 view, no copy
+    print(vfa.format_report(cap.analyze()))
+
+    reports = vfa.analyze_captures(glob.glob("/data/*.vita"))
+
+From the command line::
+
+    python -m CyberRadio.vita_file_analyzer /data/*.vita
+"""
+
+import concurrent.futures
+import os
+import sys
+
+import numpy
+
+from . import vita49
+
+# TSF field values
+TSF_NONE = 0
+TSF_SAMPLE_COUNT = 1
+TSF_REAL_TIME = 2
+TSF_FREE_RUNNING = 3
+
+# A packet interval this many times the expected one counts as a timing gap
+GAP_THRESHOLD = 1.5
+
+
+class vita_capture(object):
+    """
+    A memory-mapped VITA 49 capture file.
+
+    :param filename: capture file
+    :param byte_order: '>' or '<' for the VITA words, or None to detect
+    :param packet_bytes: packet size for captures without VRLP framing;
+        None to scan for VRLP framing
+    :param extension_words: vendor words between the standard header and the
+        samples (5 for the NDR358/NDR551 DDC words)
+    :param sample_rate: sample rate in Hz, used to convert sample-count
+        timestamps; None to estimate it from real-time timestamps
+    """
+
+    def __init__(self, filename, byte_order=None, packet_bytes=None,
+                 extension_words=0, sample_rate=None):
+        self.filename = filename
+        self.sample_rate = sample_rate
+        if os.path.getsize(filename) > 0:
+            self.data = numpy.memmap(filename, dtype=numpy.uint8, mode='r')
+        else:
+            self.data = numpy.zeros(0, dtype=numpy.uint8)
+        self.byte_order = byte_order or vita49.detect_byte_order(self.data)
+        self.headers = vita49.parse(self.data, byte_order=self.byte_order,
+                                    packet_bytes=packet_bytes,
+                                    extension_words=extension_words)
+
+    def __len__(self):
+        return len(self.headers)
+
+    def stream_ids(self):
+        """Stream IDs present in the capture, sorted."""
+        return numpy.unique(self.headers['stream_id'])
+
+    def select(self, stream_id=None):
+        """Headers for one stream, or all of them."""
+        if stream_id is None:
+            return self.headers
+        return self.headers[self.headers['stream_id'] == stream_id]
+
+    def iq(self, stream_id=None, iq_swapped=False):
+        """
+        I/Q samples as int16, without copying.
+
+        :returns: a (npackets, nsamples, 2) array when the selected packets
+            are evenly spaced in the file, else a list of (nsamples, 2) arrays
+        """
+        return vita49.iq_samples(self.data, self.select(stream_id),
+                                 byte_order=self.byte_order,
+                                 iq_swapped=iq_swapped)
+
+    def timestamps(self, stream_id=None):
+        """
+        Packet timestamps in seconds, as float64.
+
+        Real-time fractional timestamps are picoseconds; sample-count ones
+        need sample_rate.  Packets whose time can't be determined are NaN.
+        """
+        return _timestamps(self.select(stream_id), self.sample_rate)
+
+    def analyze(self):
+        """Summarize the capture; see analyze_capture()."""
+        report = {
+            'filename': self.filename,
+            'bytes': int(len(self.data)),
+            'packets': int(len(self.headers)),
+            'byte_order': self.byte_order,
+            'streams': {},
+        }
+        h = self.headers
+        if len(h) == 0:
+            return report
+        # Group the packets by stream without a Python loop over packets
+        order = numpy.argsort(h['stream_id'], kind='stable')
+        sids, starts = numpy.unique(h['stream_id'][order], return_index=True)
+        bounds = list(starts) + [len(order)]
+        for i, sid in enumerate(sids):
+            s = h[order[bounds[i]:bounds[i + 1]]]
+            report['streams'][int(sid)] = _stream_stats(s, self.sample_rate)
+        return report
+
+
+def _timestamps(h, sample_rate):
+    t = numpy.full(len(h), numpy.nan)
+    integer = h['timestamp_int'].astype(numpy.float64)
+    frac = h['timestamp_frac'].astype(numpy.float64)
+    rt = h['tsf'] == TSF_REAL_TIME
+    t[rt] = integer[rt] + frac[rt] * 1e-12
+    if sample_rate:
+        sc = h['tsf'] == TSF_SAMPLE_COUNT
+        t[sc] = integer[sc] + frac[sc] / float(sample_rate)
+    return t
+
+
+def _frames_lost(h):
+    """Frames missing according to the 12-bit VRLP frame counter."""
+    # The counter wraps after 4096 frames, so it catches bursts of lost
+    # packets that the 4-bit VRT packet counter aliases
+    framed = h['framed']
+    if numpy.count_nonzero(framed) < 2:
+        return 0
+    fc = h['frame_count'][framed].astype(numpy.int64)
+    step = numpy.diff(fc) % 4096
+    # A step of zero is a repeated frame, not 4095 lost ones
+    step = step[step != 0]
+    return int(numpy.sum((step - 1) % 4096))
+
+
+def _stream_stats(h, sample_rate):
+    """Statistics for the packets of one stream, in capture order."""
+    nsamples = h['payload_bytes'] // 4
+    stats = {
+        'packets': int(len(h)),
+        'samples': int(nsamples.sum()),
+        'samples_per_packet': int(numpy.median(nsamples)),
+    }
+    # The 4-bit packet counter steps by one per packet within a stream; a
+    # step of zero is a duplicated or re-sent packet, not 15 lost ones
+    if len(h) > 1:
+        step = numpy.diff(h['packet_count'].astype(numpy.int64)) % 16
+        dup = step == 0
+        lost = step[~dup]
+        stats['packets_lost'] = int(numpy.sum((lost - 1) % 16))
+        stats['loss_events'] = int(numpy.count_nonzero(lost != 1))
+        stats['duplicates'] = int(numpy.count_nonzero(dup))
+    else:
+        stats['packets_lost'] = 0
+        stats['loss_events'] = 0
+        stats['duplicates'] = 0
+    stats['frames_lost'] = _frames_lost(h)
+
+    t = _timestamps(h, sample_rate)
+    valid = ~numpy.isnan(t)
+    if numpy.count_nonzero(valid) < 2:
+        return stats
+    t, n = t[valid], nsamples[valid]
+    dt = numpy.diff(t)
+    span = t[-1] - t[0]
+    stats['start_time'] = float(t[0])
+    stats['duration'] = float(span + (n[-1] / sample_rate if sample_rate
+                                      else numpy.median(dt)))
+    # Rate from the packets that arrived back to back
+    ok = dt > 0
+    if numpy.any(ok):
+        per_packet = n[:-1][ok] / dt[ok]
+        rate = float(sample_rate or numpy.median(per_packet))
+        stats['sample_rate'] = rate
+        stats['sample_rate_measured'] = float(n[:-1].sum() / span) if span > 0 else 0.0
+        expected = n[:-1] / rate
+        gap = dt > GAP_THRESHOLD * expected
+        stats['gaps'] = int(numpy.count_nonzero(gap))
+        stats['gap_seconds'] = float(numpy.sum(dt[gap] - expected[gap]))
+        stats['max_gap'] = float(numpy.max(dt[gap] - expected[gap])) if numpy.any(gap) else 0.0
+        stats['jitter_rms'] = float(numpy.std(dt[~gap] - expected[~gap])) if numpy.any(~gap) else 0.0
+    stats['timestamps_backwards'] = int(numpy.count_nonzero(dt < 0))
+    return stats
+
+
+def analyze_capture(filename, **kwargs):
+    """
+    Analyze one capture file.
+
+    Keyword arguments are passed to vita_capture.  Returns a dict with the
+    file size and packet count and, for each stream ID: packets, samples,
+    packets lost (VRT packet counter), duplicated packets, frames lost (VRLP
+    frame counter), and when
+    the timestamps allow it: start time, duration, sample rate (nominal and
+    measured), number and total length of timing gaps, largest gap, interval
+    jitter and backwards timestamps.  Times are in seconds.
+    """
+    return vita_capture(filename, **kwargs).analyze()
+
+
+def analyze_captures(filenames, processes=None, **kwargs):
+    """
+    Analyze many capture files in parallel, one file per worker process.
+
+    :param processes: number of worker processes (default: one per core)
+    :returns: list of reports, in the order of filenames
+    """
+    filenames = list(filenames)
+    if processes == 1 or len(filenames) < 2:
+        return [analyze_capture(f, **kwargs) for f in filenames]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [pool.submit(analyze_capture, f, **kwargs) for f in filenames]
+        return [f.result() for f in futures]
+
+
+def format_report(report):
+    """Render a report from analyze_capture() as text."""
+    lines = ["%s: %d packets, %d bytes, byte order %s" % (
+        report['filename'], report['packets'], report['bytes'],
+        report['byte_order'])]
+    for sid, s in sorted(report['streams'].items()):
+        line = "  stream 0x%08x: %d packets (%d samples/packet), %d lost in %d events, %d duplicated, %d frames lost" % (
+            sid, s['packets'], s['samples_per_packet'], s['packets_lost'],
+            s['loss_events'], s['duplicates'], s['frames_lost'])
+        if 'sample_rate' in s:
+            line += ", %.6f s at %.1f sps (measured %.1f), %d gaps (%.6f s, max %.6f s)" % (
+                s['duration'], s['sample_rate'], s['sample_rate_measured'],
+                s['gaps'], s['gap_seconds'], s['max_gap'])
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Summarize VITA 49 capture files")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--packet-bytes", type=int, default=None,
+                        help="packet size for captures without VRLP framing")
+    parser.add_argument("--byte-order", choices=['>', '<'], default=None)
+    parser.add_argument("--extension-words", type=int, default=0)
+    parser.add_argument("--sample-rate", type=float, default=None)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args(argv)
+    reports = analyze_captures(args.files, processes=args.processes,
+                               byte_order=args.byte_order,
+                               packet_bytes=args.packet_bytes,
+                               extension_words=args.extension_words,
+                               sample_rate=args.sample_rate)
+    for r in reports:
+        print(format_report(r))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 CyberRadio Solutions, Inc.
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+"""
+Batch spectrograms and averaged PSDs of recorded VITA captures.
+
+Captures are described with the same layout parameters as
+vita_multifile_iq_source (vita_type, payload_size, vita_header_size,
+vita_tail_size, byte_swapped, iq_swapped, iq_scale_factor), memory-mapped,
+and transformed thousands of frames at a time instead of being replayed
+through log_mag_fft.  Windows are scipy.signal.get_window() names and are
+normalized and FFT-shifted the way log_mag_fft does it, so the dB values
+line up with a live display.
+
+Files, and time ranges within a file, are spread over a process pool::
+
+    from CyberRadio import vita_spectrogram
+    results = vita_spectrogram.batch_spectrogram(
+        glob.glob("/data/*.vita"), vita_type=551, payload_size=8192,
+        vita_header_size=56, vita_tail_size=8, byte_swapped=True,
+        fft_size=2048, decimation=16)
+    for r in results:
+        pyplot.imshow(r['spectrogram'], aspect='auto')
+"""
+
+import concurrent.futures
+import os
+
+import numpy
+
+from . import spectral_cache
+from . import vita49
+
+# Frames transformed per numpy.fft call
+CHUNK_FRAMES = 4096
+
+
+class vita_iq_file(object):
+    """
+    Random access to the I/Q samples of a memory-mapped capture file.
+
+    The parameters mean what they do for vita_multifile_iq_source.  With a
+    VITA type other than 0, packets are located by their VRLP framing words
+    (falling back to fixed-size packets if there are none), so a capture
+    that starts mid-packet is handled the same way the source block does.
+    """
+
+    def __init__(self, filename, vita_type=0, payload_size=8192,
+                 vita_header_size=0, vita_tail_size=0, byte_swapped=False,
+                 iq_swapped=False, iq_scale_factor=1.0):
+        self.filename = filename
+        self.iq_swapped = iq_swapped
+        self.iq_scale_factor = iq_scale_factor
+        self.samples_per_packet = payload_size // 4
+        packet_bytes = vita_header_size + payload_size + vita_tail_size
+        if os.path.getsize(filename) > 0:
+            self.data = numpy.memmap(filename, dtype=numpy.uint8, mode='r')
+        else:
+            self.data = numpy.zeros(0, dtype=numpy.uint8)
+        # byte_swapped is relative to the host, as in the source block
+        native = '<' if numpy.little_endian else '>'
+        swapped = '>' if native == '<' else '<'
+        order = swapped if byte_swapped else native
+        offsets = None
+        if vita_type != 0:
+            offsets = vita49.find_packets(self.data, order)
+        if offsets is None or len(offsets) == 0:
+            offsets = vita49.packet_offsets(self.data, packet_bytes)
+        header = 0 if vita_type == 0 else vita_header_size
+        offsets = offsets[offsets + header + payload_size <= len(self.data)]
+        self.payload_offsets = offsets + header
+        self.dtype = numpy.dtype(order + 'i2')
+
+    @property
+    def num_samples(self):
+        return len(self.payload_offsets) * self.samples_per_packet
+
+    def _packets(self, p0, p1):
+        """Packets [p0, p1) as an int16 (npackets, nsamples, 2) array."""
+        offs = self.payload_offsets[p0:p1]
+        spp = self.samples_per_packet
+        if len(offs) == 0:
+            return numpy.zeros((0, spp, 2), dtype=self.dtype)
+        steps = numpy.diff(offs)
+        if len(offs) == 1 or numpy.all(steps == steps[0]):
+            # Evenly spaced packets are a strided view of the file
+            stride = int(steps[0]) if len(offs) > 1 else spp * 4
+            return numpy.ndarray((len(offs), spp, 2), dtype=self.dtype,
+                                 buffer=self.data, offset=int(offs[0]),
+                                 strides=(stride, 4, 2))
+        index = offs[:, None] + numpy.arange(spp * 4)
+        return self.data[index].view(self.dtype).reshape(len(offs), spp, 2)
+
+    def read(self, start, stop):
+        """Samples [start, stop) as complex64, scaled like the source block."""
+        start = max(0, start)
+        stop = min(stop, self.num_samples)
+        if stop <= start:
+            return numpy.zeros(0, dtype=numpy.complex64)
+        spp = self.samples_per_packet
+        p0, p1 = start // spp, (stop + spp - 1) // spp
+        iq = self._packets(p0, p1)
+        if self.iq_swapped:
+            iq = iq[..., ::-1]
+        x = numpy.empty(iq.shape, dtype=numpy.float32)
+        numpy.multiply(iq, self.iq_scale_factor, out=x, casting='unsafe')
+        x = x.view(numpy.complex64).reshape(-1)
+        return x[start - p0 * spp:stop - p0 * spp]
+
+
+def get_window(window_type, fft_size):
+    """The FFT window log_mag_fft applies, normalized to unit sum."""
+    return spectral_cache.get_window(window_type, fft_size,
+                                     "sum").astype(numpy.float32)
+
+
+def _segment(filename, start, stop, layout, fft_size, window_type, overlap,
+             decimation, reduce):
+    """
+    Spectrogram rows and the summed frame power for samples [start, stop).
+
+    start is assumed to fall on a row boundary.  Returns linear power.
+    """
+    src = vita_iq_file(filename, **layout)
+    stop = min(stop, src.num_samples)
+    hop = fft_size - overlap
+    win = get_window(window_type, fft_size)
+    nframes = max(0, (stop - start - fft_size) // hop + 1)
+    nrows = nframes // decimation
+    rows = numpy.zeros((nrows, fft_size), dtype=numpy.float32)
+    psd = numpy.zeros(fft_size, dtype=numpy.float64)
+    # Whole rows per chunk, so decimation never straddles chunks
+    step = max(1, CHUNK_FRAMES // decimation) * decimation
+    for f0 in range(0, nframes, step):
+        f1 = min(f0 + step, nframes)
+        x = src.read(start + f0 * hop, start + (f1 - 1) * hop + fft_size)
+        frames = numpy.lib.stride_tricks.as_strided(
+            x, shape=(f1 - f0, fft_size),
+            strides=(hop * x.strides[0], x.strides[0]))
+        spec = numpy.fft.fftshift(numpy.fft.fft(frames * win, axis=1), axes=1)
+        power = (spec.real ** 2 + spec.imag ** 2).astype(numpy.float32)
+        psd += power.sum(axis=0)
+        r0, r1 = f0 // decimation, f1 // decimation
+        if r1 > r0:
+            p = power[:(r1 - r0) * decimation].reshape(r1 - r0, decimation,
+                                                        fft_size)
+            rows[r0:r1] = p.max(axis=1) if reduce == 'max' else p.mean(axis=1)
+    return rows, psd, nframes
+
+
+def _to_db(power):
+    return (10.0 * numpy.log10(numpy.maximum(power, 1e-20))).astype(numpy.float32)
+
+
+def batch_spectrogram(filenames, fft_size=1024, window_type="blackmanharris",
+                      overlap=0, decimation=1, reduce='mean', processes=None,
+                      segments_per_file=None, start=0, stop=None, **layout):
+    """
+    Spectrograms and averaged PSDs for a set of capture files.
+
+    :param filenames: capture file names (or one name)
+    :param fft_size: FFT length
+    :param window_type: scipy.signal.get_window() name, as for log_mag_fft
+    :param overlap: samples shared by consecutive frames
+    :param decimation: frames combined into each spectrogram row
+    :param reduce: 'mean' or 'max' over the frames of a row
+    :param processes: worker processes (default: one per core; 1 runs inline)
+    :param segments_per_file: time ranges each file is split into; by default
+        files are split only when there are fewer files than workers
+    :param start: first sample of each file to use
+    :param stop: sample after the last one to use (default: end of file)
+    :param layout: vita_type, payload_size, vita_header_size, vita_tail_size,
+        byte_swapped, iq_swapped, iq_scale_factor, as for
+        vita_multifile_iq_source
+    :returns: one dict per file, with 'spectrogram' (rows x fft_size, dB),
+        'psd' (fft_size, dB, averaged over every frame), 'frames',
+        'decimation', 'fft_size', 'window_type', 'start' and 'stop'
+    """
+    if isinstance(filenames, str):
+        filenames = [filenames]
+    filenames = list(filenames)
+    if reduce not in ('mean', 'max'):
+        raise ValueError("reduce must be 'mean' or 'max'")
+    if not 0 <= overlap < fft_size or decimation < 1:
+        raise ValueError("need 0 <= overlap < fft_size and decimation >= 1")
+    workers = processes or os.cpu_count() or 1
+    if segments_per_file is None:
+        segments_per_file = max(1, -(-workers // max(1, len(filenames))))
+    hop = fft_size - overlap
+    row_samples = hop * decimation
+
+    # Split each file on row boundaries; each segment also reads the
+    # overlap into the next one so no frame is lost at the seams
+    jobs = []
+    for i, f in enumerate(filenames):
+        total = vita_iq_file(f, **layout).num_samples
+        end = total if stop is None else min(stop, total)
+        nrows = max(0, (end - start - fft_size) // hop + 1) // decimation
+        per = -(-nrows // segments_per_file) if nrows else 0
+        r = 0
+        while True:
+            r1 = min(nrows, r + per) if per else nrows
+            s0 = start + r * row_samples
+            s1 = (start + r1 * row_samples + overlap) if r1 < nrows else end
+            jobs.append((i, (f, s0, s1, layout, fft_size, window_type,
+                             overlap, decimation, reduce)))
+            if r1 >= nrows:
+                break
+            r = r1
+
+    if workers == 1 or len(jobs) < 2:
+        parts = [_segment(*args) for _, args in jobs]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_segment, *args) for _, args in jobs]
+            parts = [fu.result() for fu in futures]
+
+    results = []
+    for i, f in enumerate(filenames):
+        mine = [p for (j, _), p in zip(jobs, parts) if j == i]
+        frames = sum(p[2] for p in mine)
+        rows = numpy.concatenate([p[0] for p in mine])
+        psd = sum(p[1] for p in mine) / max(frames, 1)
+        results.append({
+            'filename': f,
+            'spectrogram': _to_db(rows),
+            'psd': _to_db(psd),
+            'frames': frames,
+            'decimation': decimation,
+            'fft_size': fft_size,
+            'window_type': window_type,
+            'start': start,
+            'stop': start + frames * hop + (overlap if frames else 0),
+        })
+    return results
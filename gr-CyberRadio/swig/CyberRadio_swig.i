@@ -21,6 +21,21 @@
 #include "CyberRadio/vita_iq_source.h"
 #include "CyberRadio/vita_iq_source_mk3.h"
 #include "CyberRadio/vita_multifile_iq_source.h"
+#include "CyberRadio/log_mag_fft_cf.h"
+#include "CyberRadio/wola_log_mag_fft_cf.h"
+#include "CyberRadio/spectrum_trace_ff.h"
+#include "CyberRadio/sinad_meter_cf.h"
+#include "CyberRadio/power_meter_bank_cf.h"
+#include "CyberRadio/pfb_channelizer_ccf.h"
+#include "CyberRadio/ddc_resampler_ccf.h"
+#include "CyberRadio/demod_bank_cf.h"
+#include "CyberRadio/energy_detector_f.h"
+#include "CyberRadio/spectrum_occupancy_f.h"
+#include "CyberRadio/vector_integrate_ff.h"
+#include "CyberRadio/vector_reduce_ff.h"
+#include "CyberRadio/cross_spectral_matrix_cc.h"
+#include "CyberRadio/tdoa_correlator_c.h"
+#include "CyberRadio/timestamp_aligner_cc.h"
 #include "CyberRadio/ndr651_sink.h"
 #include "CyberRadio/NDR651_duc_sink_mk2.h"
 #include "CyberRadio/NDR651_sync_sink.h"
@@ -52,6 +67,36 @@ GR_SWIG_BLOCK_MAGIC2(CyberRadio, vita_iq_source);
 GR_SWIG_BLOCK_MAGIC2(CyberRadio, vita_iq_source_mk3);
 %include "CyberRadio/vita_multifile_iq_source.h"
 GR_SWIG_BLOCK_MAGIC2(CyberRadio, vita_multifile_iq_source);
+%include "CyberRadio/log_mag_fft_cf.h"
+GR_SWIG_BLOCK_MAGIC2(CyberRadio, log_mag_fft_cf);
+%include "CyberRadio/wola_log_mag_fft_cf.h"
+GR_SWIG_BLOCK_MAGIC2(CyberRadio, wola_log_mag_fft_cf);
+%include "CyberRadio/spectrum_trace_ff.h"
+GR_SWIG_BLOCK_MAGIC2(CyberRadio, spectrum_trace_ff);
+%include "CyberRadio/sinad_meter_cf.h"
+GR_SWIG_BLOCK_MAGIC2(CyberRadio, sinad_meter_cf);
+%include "CyberRadio/power_meter_bank_cf.h"
+GR_SWIG_BLOCK_MAGIC2(CyberRadio, power_meter_bank_cf);
+%include "CyberRadio/pfb_channelizer_ccf.h"
+GR_SWIG_BLOCK_MAGIC2(CyberRadio, pfb_channelizer_ccf);
+%include "CyberRadio/ddc_resampler_ccf.h"
+GR_SWIG_BLOCK_MAGIC2(CyberRadio, ddc_resampler_ccf);
+%include "CyberRadio/demod_bank_cf.h"
+GR_SWIG_BLOCK_MAGIC2(CyberRadio, demod_bank_cf);
+%include "CyberRadio/energy_detector_f.h"
+GR_SWIG_BLOCK_MAGIC2(CyberRadio, energy_detector_f);
+%include "CyberRadio/spectrum_occupancy_f.h"
+GR_SWIG_BLOCK_MAGIC2(CyberRadio, spectrum_occupancy_f);
+%include "CyberRadio/vector_integrate_ff.h"
+GR_SWIG_BLOCK_MAGIC2(CyberRadio, vector_integrate_ff);
+%include "CyberRadio/vector_reduce_ff.h"
+GR_SWIG_BLOCK_MAGIC2(CyberRadio, vector_reduce_ff);
+%include "CyberRadio/cross_spectral_matrix_cc.h"
+GR_SWIG_BLOCK_MAGIC2(CyberRadio, cross_spectral_matrix_cc);
+%include "CyberRadio/tdoa_correlator_c.h"
+GR_SWIG_BLOCK_MAGIC2(CyberRadio, tdoa_correlator_c);
+%include "CyberRadio/timestamp_aligner_cc.h"
+GR_SWIG_BLOCK_MAGIC2(CyberRadio, timestamp_aligner_cc);
 %include "CyberRadio/ndr651_sink.h"
 GR_SWIG_BLOCK_MAGIC2(CyberRadio, ndr651_sink);
 %include "CyberRadio/NDR651_duc_sink_mk2.h"